@@ -43,6 +43,10 @@ def create_db() -> None:
             cursor.execute(
                 "CREATE INDEX IF NOT EXISTS idx_timestamp ON entries (timestamp)"
             )
+            # Covering index for grouping a time window by app and title
+            cursor.execute(
+                "CREATE INDEX IF NOT EXISTS idx_entries_ts_app_title ON entries (timestamp, app, title)"
+            )
             conn.commit()
     except sqlite3.Error as e:
         print(f"Database error during table creation: {e}")
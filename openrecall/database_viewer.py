@@ -4,61 +4,98 @@ Database Viewer Interface - Property-Based Schema
 Web interface to view and manage OpenRecall and Documentation databases
 """
 
-import json
 import sqlite3
+from contextlib import contextmanager
 from datetime import datetime, timedelta
 from pathlib import Path
-from flask import Flask, render_template_string, request, jsonify
+from flask import Flask, Response, render_template, render_template_string, request, jsonify, make_response, abort, send_from_directory, stream_with_context, url_for
+from flask.json.provider import DefaultJSONProvider
 import os
+import queue
+import re
+import atexit
 import configparser
-import shutil
+from collections import OrderedDict
+import functools
+import hashlib
+import threading
+import time
+
+from openrecall.properties_fts import create_properties_fts, fts_query
+
+# gzip/brotli for JSON and static responses, when flask-compress is installed
+try:
+    from flask_compress import Compress
+except ImportError:
+    Compress = None
+
+# Multi-threaded production WSGI server, when waitress is installed
+try:
+    from waitress import serve
+except ImportError:
+    serve = None
+
+# Faster JSON encoding and decoding for API responses, when orjson is installed
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 HTML_TEMPLATE = """
 <!DOCTYPE html>
 <html>
 <head>
     <title>OpenRecall Database Viewer</title>
-    <link rel="stylesheet" href="https://cdn.jsdelivr.net/npm/bootstrap-icons@1.11.0/font/bootstrap-icons.css">
+    <link rel="preconnect" href="https://cdn.jsdelivr.net" crossorigin>
+    <link rel="dns-prefetch" href="//cdn.jsdelivr.net">
+    <link rel="preload" as="style" href="https://cdn.jsdelivr.net/npm/bootstrap-icons@1.11.0/font/bootstrap-icons.css" onload="this.onload=null;this.rel='stylesheet'">
+    <link rel="preload" as="style" href="{{ asset_urls['viewer.css'] }}" onload="this.onload=null;this.rel='stylesheet'">
+    <noscript>
+        <link rel="stylesheet" href="https://cdn.jsdelivr.net/npm/bootstrap-icons@1.11.0/font/bootstrap-icons.css">
+        <link rel="stylesheet" href="{{ asset_urls['viewer.css'] }}">
+    </noscript>
+    <script type="module" src="{{ asset_urls['viewer.js'] }}"></script>
+    <!-- Above-the-fold styles only; the rest arrives with viewer.css -->
     <style>
         * {
             margin: 0;
             padding: 0;
             box-sizing: border-box;
         }
-        
+
         body { 
             font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, sans-serif; 
             background: #f8f9fa; 
             color: #495057;
             line-height: 1.6;
         }
-        
+
         .header { 
             background: white; 
             padding: 20px; 
             box-shadow: 0 2px 10px rgba(0,0,0,0.1);
             border-bottom: 1px solid #dee2e6;
         }
-        
+
         .header h1 { 
             margin: 0; 
             color: #495057;
             font-size: 1.5rem;
             font-weight: 600;
         }
-        
+
         .header p {
             margin: 5px 0 0 0;
             color: #6c757d;
             font-size: 0.9rem;
         }
-        
+
         .container { 
             padding: 20px;
             max-width: 1400px;
             margin: 0 auto;
         }
-        
+
         /* Tabs */
         .tabs { 
             display: flex; 
@@ -69,7 +106,7 @@ HTML_TEMPLATE = """
             border-radius: 12px; 
             box-shadow: 0 2px 10px rgba(0,0,0,0.1);
         }
-        
+
         .tab { 
             padding: 12px 20px; 
             background: transparent; 
@@ -84,526 +121,28 @@ HTML_TEMPLATE = """
             align-items: center;
             gap: 8px;
         }
-        
+
         .tab i {
             font-size: 1rem;
         }
-        
+
         .tab:hover:not(.active) {
             background: #f8f9fa;
             color: #495057;
         }
-        
+
         .tab.active { 
             background: #007bff; 
             color: white; 
             box-shadow: 0 2px 8px rgba(0,123,255,0.3);
         }
-        
-        /* Table Container */
-        .table-container { 
-            background: white; 
-            border-radius: 12px; 
-            padding: 20px; 
-            box-shadow: 0 2px 10px rgba(0,0,0,0.1);
-            border: 1px solid #dee2e6;
-            margin-bottom: 20px;
-        }
-        
-        .table-header { 
-            display: flex; 
-            justify-content: space-between; 
-            align-items: center; 
-            margin-bottom: 20px; 
-            padding-bottom: 15px;
-            border-bottom: 1px solid #f1f3f4;
-        }
-        
-        .table-title { 
-            font-size: 1.25rem; 
-            font-weight: 600; 
-            color: #495057; 
-        }
-        
-        /* Controls */
-        .controls { 
-            display: flex; 
-            gap: 12px; 
-            margin-bottom: 20px; 
-            flex-wrap: wrap; 
-            align-items: center;
-        }
-        
-        .search-box { 
-            flex: 1; 
-            min-width: 250px; 
-            padding: 12px 16px; 
-            border: 1px solid #dee2e6; 
-            border-radius: 8px; 
-            font-size: 0.95rem;
-            background: #f8f9fa;
-            transition: all 0.2s ease;
-        }
-        
-        .search-box:focus {
-            outline: none;
-            border-color: #007bff;
-            background: white;
-            box-shadow: 0 0 0 3px rgba(0,123,255,0.1);
-        }
-        
-        .filter-select { 
-            padding: 12px 16px; 
-            border: 1px solid #dee2e6; 
-            border-radius: 8px; 
-            min-width: 140px; 
-            background: #f8f9fa;
-            font-size: 0.95rem;
-            cursor: pointer;
-            transition: all 0.2s ease;
-        }
-        
-        .filter-select:focus {
-            outline: none;
-            border-color: #007bff;
-            background: white;
-            box-shadow: 0 0 0 3px rgba(0,123,255,0.1);
-        }
-        
-        .btn { 
-            padding: 12px 20px; 
-            background: #007bff; 
-            color: white; 
-            border: none; 
-            border-radius: 8px; 
-            cursor: pointer; 
-            font-weight: 500; 
-            font-size: 0.95rem;
-            transition: all 0.2s ease;
-            display: inline-flex;
-            align-items: center;
-            gap: 6px;
-        }
-        
-        .btn:hover { 
-            background: #0056b3; 
-            transform: translateY(-1px);
-            box-shadow: 0 4px 12px rgba(0,123,255,0.3);
-        }
-        
-        .btn-secondary { 
-            background: #6c757d; 
-        }
-        
-        .btn-secondary:hover { 
-            background: #545b62; 
-        }
-        
-        /* Table */
-        table { 
-            width: 100%; 
-            border-collapse: collapse; 
-            font-size: 0.95rem;
-        }
-        
-        th { 
-            background: #f8f9fa; 
-            padding: 16px 12px; 
-            text-align: left; 
-            font-weight: 600; 
-            color: #495057; 
-            border-bottom: 1px solid #dee2e6;
-            font-size: 0.9rem;
-            text-transform: uppercase;
-            letter-spacing: 0.5px;
-        }
-        
-        td { 
-            padding: 16px 12px; 
-            border-bottom: 1px solid #f1f3f4; 
-            vertical-align: top;
-        }
-        
-        tr:hover { 
-            background: #f8f9fa; 
-        }
-        
-        tr:last-child td {
-            border-bottom: none;
-        }
-        
-        /* Pagination */
-        .pagination { 
-            display: flex; 
-            justify-content: center; 
-            gap: 8px; 
-            margin-top: 30px; 
-        }
-        
-        .page-btn { 
-            padding: 10px 16px; 
-            background: white; 
-            border: 1px solid #dee2e6; 
-            border-radius: 8px; 
-            cursor: pointer; 
-            font-size: 0.9rem;
-            font-weight: 500;
-            color: #495057;
-            transition: all 0.2s ease;
-        }
-        
-        .page-btn.active { 
-            background: #007bff; 
-            color: white; 
-            border-color: #007bff; 
-            box-shadow: 0 2px 8px rgba(0,123,255,0.3);
-        }
-        
-        .page-btn:hover:not(.active) { 
-            background: #f8f9fa; 
-            border-color: #007bff;
-            color: #007bff;
-        }
-        
-        /* Stats */
-        .stats { 
-            display: grid; 
-            grid-template-columns: repeat(auto-fit, minmax(220px, 1fr)); 
-            gap: 20px; 
-            margin-bottom: 30px; 
-        }
-        
-        .stat-card { 
-            background: white; 
-            padding: 24px 20px; 
-            border-radius: 12px; 
-            text-align: center; 
-            box-shadow: 0 2px 10px rgba(0,0,0,0.1);
-            border: 1px solid #dee2e6;
-            transition: transform 0.2s ease;
-        }
-        
-        .stat-card:hover {
-            transform: translateY(-2px);
-            box-shadow: 0 4px 20px rgba(0,0,0,0.15);
-        }
-        
-        .stat-number { 
-            font-size: 2rem; 
-            font-weight: 700; 
-            color: #007bff; 
-            line-height: 1;
-        }
-        
-        .stat-label { 
-            color: #6c757d; 
-            margin-top: 8px; 
-            font-size: 0.9rem;
-            font-weight: 500;
-        }
-        
+
         /* Tab Content */
         .tab-content { display: none; }
         .tab-content.active { display: block; }
-        
-        /* Modal */
-        .modal { 
-            display: none; 
-            position: fixed; 
-            z-index: 1000; 
-            left: 0; 
-            top: 0; 
-            width: 100%; 
-            height: 100%; 
-            background: rgba(0,0,0,0.5); 
-            backdrop-filter: blur(4px);
-        }
-        
-        .modal-content { 
-            background: white; 
-            margin: 50px auto; 
-            padding: 30px; 
-            width: 90%; 
-            max-width: 900px; 
-            border-radius: 12px; 
-            max-height: 85vh; 
-            overflow-y: auto; 
-            box-shadow: 0 20px 60px rgba(0,0,0,0.3);
-        }
-        
-        .modal-header { 
-            display: flex; 
-            justify-content: space-between; 
-            align-items: center; 
-            margin-bottom: 25px; 
-            padding-bottom: 15px;
-            border-bottom: 1px solid #f1f3f4;
-        }
-        
-        .modal-title { 
-            font-size: 1.5rem; 
-            font-weight: 600; 
-            color: #495057;
-        }
-        
-        .close { 
-            font-size: 1.5rem; 
-            cursor: pointer; 
-            color: #6c757d; 
-            transition: color 0.2s ease;
-            width: 40px;
-            height: 40px;
-            display: flex;
-            align-items: center;
-            justify-content: center;
-            border-radius: 8px;
-        }
-        
-        .close:hover { 
-            color: #495057; 
-            background: #f8f9fa;
-        }
-        
-        /* Code block */
-        .code-block { 
-            background: #f8f9fa; 
-            padding: 20px; 
-            border-radius: 8px; 
-            font-family: 'SF Mono', 'Monaco', 'Inconsolata', 'Roboto Mono', monospace; 
-            font-size: 0.9rem;
-            overflow-x: auto; 
-            white-space: pre-wrap; 
-            border: 1px solid #e9ecef;
-            line-height: 1.5;
-        }
-        
-        /* Truncate text */
-        .truncate { 
-            max-width: 300px; 
-            white-space: nowrap; 
-            overflow: hidden; 
-            text-overflow: ellipsis; 
-        }
-        
-        /* Tags */
-        .tag { 
-            display: inline-block; 
-            background: #e9ecef; 
-            color: #495057;
-            padding: 4px 12px; 
-            border-radius: 16px; 
-            font-size: 0.8rem; 
-            margin: 2px 4px 2px 0; 
-            font-weight: 500;
-            transition: all 0.2s ease;
-        }
-        
-        .tag:hover {
-            background: #dee2e6;
-        }
-        
-        .tag.active { 
-            background: #007bff; 
-            color: white; 
-        }
-        
-        /* Tree view */
-        .tree { margin-left: 20px; }
-        .tree-item { margin: 5px 0; padding: 5px; border-left: 2px solid #e0e0e0; }
-        .tree-item:hover { background: #f8f9fa; }
-        .tree-toggle { cursor: pointer; user-select: none; }
-        .tree-children { margin-left: 15px; }
-        
-        /* Property path */
-        .property-path { font-size: 12px; color: #666; font-style: italic; }
-        
-        /* Type badges */
-        .type-badge { padding: 2px 6px; border-radius: 3px; font-size: 11px; font-weight: bold; text-transform: uppercase; }
-        .type-text { background: #e3f2fd; color: #1565c0; }
-        .type-json { background: #f3e5f5; color: #7b1fa2; }
-        .type-file { background: #e8f5e8; color: #2e7d32; }
-        .type-code { background: #fff3e0; color: #ef6c00; }
-        .type-documentation { background: #e1f5fe; color: #0277bd; }
-        .type-section { background: #fce4ec; color: #c2185b; }
-        
-        /* Settings form */
-        .settings-form { 
-            max-width: 700px; 
-        }
-        
-        .form-group { 
-            margin-bottom: 25px; 
-        }
-        
-        .form-label { 
-            display: block; 
-            margin-bottom: 8px; 
-            font-weight: 600; 
-            color: #495057; 
-            font-size: 0.95rem;
-        }
-        
-        .form-input { 
-            width: 100%; 
-            padding: 12px 16px; 
-            border: 1px solid #dee2e6; 
-            border-radius: 8px; 
-            font-size: 0.95rem; 
-            transition: all 0.2s ease;
-            background: #f8f9fa;
-        }
-        
-        .form-input:focus { 
-            border-color: #007bff; 
-            outline: none; 
-            box-shadow: 0 0 0 3px rgba(0,123,255,0.1);
-            background: white;
-        }
-        
-        .form-description { 
-            font-size: 0.85rem; 
-            color: #6c757d; 
-            margin-top: 6px; 
-            line-height: 1.4;
-        }
-        .btn-danger { 
-            background: #dc3545; 
-        }
-        
-        .btn-danger:hover { 
-            background: #c82333; 
-            transform: translateY(-1px);
-            box-shadow: 0 4px 12px rgba(220,53,69,0.3);
-        }
-        
-        .btn-success { 
-            background: #28a745; 
-        }
-        
-        .btn-success:hover { 
-            background: #218838; 
-            transform: translateY(-1px);
-            box-shadow: 0 4px 12px rgba(40,167,69,0.3);
-        }
-        
-        .alert { 
-            padding: 16px 20px; 
-            border-radius: 8px; 
-            margin-bottom: 25px; 
-            border: 1px solid transparent;
-            font-size: 0.95rem;
-        }
-        
-        .alert-success { 
-            background: #d1e7dd; 
-            color: #0a3622; 
-            border-color: #a3cfbb; 
-        }
-        
-        .alert-error { 
-            background: #f8d7da; 
-            color: #58151c; 
-            border-color: #f1aeb5; 
-        }
-        .config-status { 
-            display: inline-block; 
-            padding: 6px 12px; 
-            border-radius: 6px; 
-            font-size: 0.8rem; 
-            font-weight: 500;
-        }
-        
-        .config-valid { 
-            background: #d1e7dd; 
-            color: #0a3622; 
-        }
-        
-        .config-invalid { 
-            background: #f8d7da; 
-            color: #58151c; 
-        }
-        
-        /* Responsive Design */
-        @media (max-width: 768px) {
-            .container {
-                padding: 15px;
-            }
-            
-            .tabs {
-                padding: 6px;
-                gap: 1px;
-            }
-            
-            .tab {
-                padding: 10px 14px;
-                font-size: 0.9rem;
-                gap: 6px;
-            }
-            
-            .tab i {
-                font-size: 0.9rem;
-            }
-            
-            .table-container {
-                padding: 15px;
-            }
-            
-            .controls {
-                flex-direction: column;
-                align-items: stretch;
-            }
-            
-            .search-box,
-            .filter-select {
-                min-width: auto;
-                width: 100%;
-            }
-            
-            .stats {
-                grid-template-columns: repeat(auto-fit, minmax(180px, 1fr));
-                gap: 15px;
-            }
-            
-            .stat-card {
-                padding: 20px 15px;
-            }
-            
-            .modal-content {
-                width: 95%;
-                margin: 20px auto;
-                padding: 20px;
-            }
-        }
-        
-        /* Bootstrap Icons */
-        .bi {
-            vertical-align: -0.125em;
-        }
-        
-        .text-success {
-            color: #198754 !important;
-        }
-        
-        .text-danger {
-            color: #dc3545 !important;
-        }
-        
-        .text-warning {
-            color: #ffc107 !important;
-        }
-        
-        /* Icon spacing in content */
-        h3 .bi, strong .bi, td .bi {
-            margin-right: 6px;
-        }
-        
-        /* Smooth transitions */
-        * {
-            transition: box-shadow 0.15s ease-out;
-        }
     </style>
 </head>
-<body>
+<body data-auto-refresh-seconds="{{ auto_refresh_seconds|int }}">
     <div class="header">
         <h1>OpenRecall Database Viewer</h1>
         <p>Property-based unified documentation and activity tracking</p>
@@ -622,221 +161,26 @@ HTML_TEMPLATE = """
         
         <!-- Activities Tab -->
         <div id="activities" class="tab-content active">
-            <div class="stats" id="activityStats"></div>
-            
-            <div class="table-container">
-                <div class="table-header">
-                    <div class="table-title">Recent Activities</div>
-                    <div>
-                        <select id="timeRange" onchange="loadActivities()">
-                            <option value="today">Today</option>
-                            <option value="yesterday">Yesterday</option>
-                            <option value="week" selected>This Week</option>
-                            <option value="month">This Month</option>
-                            <option value="all">All Time</option>
-                        </select>
-                    </div>
-                </div>
-                
-                <div class="controls">
-                    <input type="text" class="search-box" id="activitySearch" placeholder="Search activities..." onkeyup="searchActivities(event)">
-                    <button class="btn" onclick="refreshActivities()">Refresh</button>
-                </div>
-                
-                <table id="activitiesTable">
-                    <thead>
-                        <tr>
-                            <th>Application</th>
-                            <th>Title</th>
-                            <th>Count</th>
-                            <th>First Seen</th>
-                            <th>Last Seen</th>
-                            <th>Duration</th>
-                        </tr>
-                    </thead>
-                    <tbody></tbody>
-                </table>
-                
-                <div class="pagination" id="activitiesPagination"></div>
-            </div>
+            {% include 'tabs/activities.html' %}
         </div>
         
+        <!-- Remaining tabs are fetched from /tabs/<name> the first time they are opened -->
+        
         <!-- Properties Tab -->
-        <div id="properties" class="tab-content">
-            <div class="table-container">
-                <div class="table-header">
-                    <div class="table-title">Properties</div>
-                    <div>
-                        <button class="btn" onclick="showPropertyForm()">Add Property</button>
-                        <button class="btn btn-secondary" onclick="rebuildSearchIndex()">Rebuild Index</button>
-                    </div>
-                </div>
-                
-                <div class="controls">
-                    <input type="text" class="search-box" id="propertySearch" placeholder="Search properties..." onkeyup="searchProperties(event)">
-                    <select class="filter-select" id="typeFilter" onchange="loadProperties()">
-                        <option value="">All Types</option>
-                        <option value="text">Text</option>
-                        <option value="json">JSON</option>
-                        <option value="file">File</option>
-                        <option value="code_item">Code</option>
-                        <option value="documentation">Documentation</option>
-                        <option value="section">Section</option>
-                    </select>
-                    <select class="filter-select" id="tagFilter" onchange="loadProperties()">
-                        <option value="">All Tags</option>
-                    </select>
-                    <button class="btn" onclick="loadProperties()">Filter</button>
-                </div>
-                
-                <table id="propertiesTable">
-                    <thead>
-                        <tr>
-                            <th>Key</th>
-                            <th>Type</th>
-                            <th>Value Preview</th>
-                            <th>Path</th>
-                            <th>Tags</th>
-                            <th>Updated</th>
-                            <th>Actions</th>
-                        </tr>
-                    </thead>
-                    <tbody></tbody>
-                </table>
-                
-                <div class="pagination" id="propertiesPagination"></div>
-            </div>
-        </div>
+        <div id="properties" class="tab-content"></div>
         
         <!-- Tags Tab -->
-        <div id="tags" class="tab-content">
-            <div class="table-container">
-                <div class="table-header">
-                    <div class="table-title">Tag Hierarchy</div>
-                    <button class="btn" onclick="showTagForm()">Add Tag</button>
-                </div>
-                
-                <div class="controls">
-                    <select class="filter-select" id="projectFilter" onchange="loadTags()">
-                        <option value="default">Default Project</option>
-                    </select>
-                </div>
-                
-                <div id="tagTree"></div>
-            </div>
-        </div>
+        <div id="tags" class="tab-content"></div>
         
         <!-- Projects Tab -->
-        <div id="projects" class="tab-content">
-            <div class="table-container">
-                <div class="table-header">
-                    <div class="table-title">Projects</div>
-                    <button class="btn" onclick="showProjectForm()">Add Project</button>
-                </div>
-                
-                <table id="projectsTable">
-                    <thead>
-                        <tr>
-                            <th>Name</th>
-                            <th>Slug</th>
-                            <th>Status</th>
-                            <th>Properties</th>
-                            <th>Tags</th>
-                            <th>Created</th>
-                            <th>Actions</th>
-                        </tr>
-                    </thead>
-                    <tbody></tbody>
-                </table>
-            </div>
-        </div>
+        <div id="projects" class="tab-content"></div>
         
         
         <!-- Statistics Tab -->
-        <div id="stats" class="tab-content">
-            <div class="stats" id="databaseStats"></div>
-            
-            <div class="table-container">
-                <div class="table-header">
-                    <div class="table-title">Property Type Distribution</div>
-                </div>
-                <div id="typeChart"></div>
-            </div>
-        </div>
+        <div id="stats" class="tab-content"></div>
         
         <!-- Settings Tab -->
-        <div id="settings" class="tab-content">
-            <div class="table-container">
-                <div class="table-header">
-                    <div class="table-title">Configuration Settings</div>
-                    <div>
-                        <button class="btn btn-secondary" onclick="resetToDefaults()">Reset to Defaults</button>
-                        <button class="btn btn-success" onclick="saveSettings()">Save Settings</button>
-                    </div>
-                </div>
-                
-                <div id="settingsAlert"></div>
-                
-                <form id="settingsForm" class="settings-form">
-                    <div class="form-group">
-                        <label class="form-label" for="recallDbPath">OpenRecall Database Path</label>
-                        <input type="text" id="recallDbPath" class="form-input" placeholder="/path/to/openrecall.db">
-                        <div class="form-description">Path to the OpenRecall activity tracking database</div>
-                        <div id="recallDbStatus" class="config-status"></div>
-                    </div>
-                    
-                    <div class="form-group">
-                        <label class="form-label" for="docsDbPath">Documentation Database Path</label>
-                        <input type="text" id="docsDbPath" class="form-input" placeholder="/path/to/documentation.db">
-                        <div class="form-description">Path to the documentation/properties database</div>
-                        <div id="docsDbStatus" class="config-status"></div>
-                    </div>
-                    
-                    <div class="form-group">
-                        <label class="form-label" for="serverHost">Server Host</label>
-                        <input type="text" id="serverHost" class="form-input" placeholder="127.0.0.1">
-                        <div class="form-description">Host address for the web interface</div>
-                    </div>
-                    
-                    <div class="form-group">
-                        <label class="form-label" for="serverPort">Server Port</label>
-                        <input type="number" id="serverPort" class="form-input" placeholder="8084" min="1024" max="65535">
-                        <div class="form-description">Port number for the web interface</div>
-                    </div>
-                    
-                    <div class="form-group">
-                        <label class="form-label" for="autoRefresh">Auto Refresh Interval (seconds)</label>
-                        <input type="number" id="autoRefresh" class="form-input" placeholder="30" min="0" max="3600">
-                        <div class="form-description">Automatic refresh interval for data (0 to disable)</div>
-                    </div>
-                    
-                    <div class="form-group">
-                        <label class="form-label" for="pageSize">Default Page Size</label>
-                        <input type="number" id="pageSize" class="form-input" placeholder="20" min="10" max="100">
-                        <div class="form-description">Number of items to show per page</div>
-                    </div>
-                </form>
-                
-                <div class="table-container" style="margin-top: 30px;">
-                    <div class="table-header">
-                        <div class="table-title">Configuration File Status</div>
-                        <button class="btn btn-secondary" onclick="loadSettings(true)">Reload Config</button>
-                    </div>
-                    
-                    <table id="configStatusTable">
-                        <thead>
-                            <tr>
-                                <th>Setting</th>
-                                <th>Current Value</th>
-                                <th>Status</th>
-                                <th>Last Updated</th>
-                            </tr>
-                        </thead>
-                        <tbody></tbody>
-                    </table>
-                </div>
-            </div>
-        </div>
+        <div id="settings" class="tab-content"></div>
     </div>
     
     <!-- Modal -->
@@ -850,659 +194,328 @@ HTML_TEMPLATE = """
         </div>
     </div>
     
-    <script>
-        let currentTab = 'activities';
-        let currentPage = 1;
-        const pageSize = 20;
-        
-        // Initialize
-        window.onload = function() {
-            loadActivities();
-            loadDatabaseStats();
-            loadTagOptions();
-            loadProjectOptions();
-        };
-        
-        function switchTab(tab) {
-            currentTab = tab;
-            document.querySelectorAll('.tab').forEach(t => t.classList.remove('active'));
-            document.querySelectorAll('.tab-content').forEach(c => c.classList.remove('active'));
-            
-            event.target.classList.add('active');
-            document.getElementById(tab).classList.add('active');
-            
-            // Load data for the tab
-            currentPage = 1;
-            if (tab === 'activities') loadActivities();
-            else if (tab === 'properties') loadProperties();
-            else if (tab === 'tags') loadTags();
-            else if (tab === 'projects') loadProjects();
-            else if (tab === 'stats') loadDatabaseStats();
-            else if (tab === 'settings') loadSettings();
-        }
-        
-        // Activities functions
-        function loadActivities() {
-            const timeRange = document.getElementById('timeRange').value;
-            
-            fetch(`/api/activities?time_range=${timeRange}&page=${currentPage}&size=${pageSize}`)
-                .then(r => r.json())
-                .then(data => {
-                    const tbody = document.querySelector('#activitiesTable tbody');
-                    tbody.innerHTML = '';
-                    
-                    data.activities.forEach(a => {
-                        tbody.innerHTML += `
-                            <tr>
-                                <td>${a.app}</td>
-                                <td class="truncate" title="${a.title}">${a.title}</td>
-                                <td>${a.count}</td>
-                                <td>${formatDate(a.first_seen)}</td>
-                                <td>${formatDate(a.last_seen)}</td>
-                                <td>${a.duration_minutes} min</td>
-                            </tr>
-                        `;
-                    });
-                    
-                    updatePagination('activitiesPagination', data.total_pages);
-                })
-                .catch(err => console.error('Error loading activities:', err));
-        }
-        
-        function searchActivities(event) {
-            if (event.key === 'Enter') {
-                const query = event.target.value;
-                fetch(`/api/search-activities?q=${encodeURIComponent(query)}`)
-                    .then(r => r.json())
-                    .then(data => {
-                        const tbody = document.querySelector('#activitiesTable tbody');
-                        tbody.innerHTML = '';
-                        
-                        data.results.forEach(a => {
-                            tbody.innerHTML += `
-                                <tr>
-                                    <td>${a.app}</td>
-                                    <td class="truncate">${a.title}</td>
-                                    <td>${a.count}</td>
-                                    <td>${formatDate(a.first_seen)}</td>
-                                    <td>${formatDate(a.last_seen)}</td>
-                                    <td>-</td>
-                                </tr>
-                            `;
-                        });
-                    })
-                    .catch(err => console.error('Error searching activities:', err));
-            }
-        }
-        
-        // Properties functions
-        function loadProperties() {
-            const typeFilter = document.getElementById('typeFilter').value;
-            const tagFilter = document.getElementById('tagFilter').value;
-            
-            let url = `/api/properties?page=${currentPage}&size=${pageSize}`;
-            if (typeFilter) url += `&type=${typeFilter}`;
-            if (tagFilter) url += `&tag=${tagFilter}`;
-            
-            fetch(url)
-                .then(r => r.json())
-                .then(data => {
-                    const tbody = document.querySelector('#propertiesTable tbody');
-                    tbody.innerHTML = '';
-                    
-                    if (data.error) {
-                        tbody.innerHTML = `
-                            <tr>
-                                <td colspan="7" style="text-align: center; padding: 20px; color: #666;">
-                                    <strong><i class="bi bi-exclamation-triangle"></i> ${data.error}</strong><br>
-                                    <small>The documentation database needs to be initialized with the new schema.</small>
-                                </td>
-                            </tr>
-                        `;
-                        updatePagination('propertiesPagination', 0);
-                        return;
-                    }
-                    
-                    if (!data.properties || data.properties.length === 0) {
-                        tbody.innerHTML = `
-                            <tr>
-                                <td colspan="7" style="text-align: center; padding: 20px; color: #666;">
-                                    <i class="bi bi-file-text"></i> No properties found.<br>
-                                    <small>Use the DocumentationMCP server to add properties to the database.</small>
-                                </td>
-                            </tr>
-                        `;
-                        updatePagination('propertiesPagination', 0);
-                        return;
-                    }
-                    
-                    data.properties.forEach(p => {
-                        const tags = p.tags.filter(tag => tag && tag.trim()).map(tag => `<span class="tag">${tag}</span>`).join('');
-                        const typeClass = `type-${p.type.replace('_', '-')}`;
-                        
-                        tbody.innerHTML += `
-                            <tr>
-                                <td><strong>${p.key}</strong></td>
-                                <td><span class="type-badge ${typeClass}">${p.type}</span></td>
-                                <td class="truncate" title="${p.value || ''}">${p.value || '<empty>'}</td>
-                                <td class="property-path">${p.path || ''}</td>
-                                <td>${tags}</td>
-                                <td>${formatDate(p.updated_at)}</td>
-                                <td>
-                                    <button onclick="viewProperty('${p.id}')">View</button>
-                                    <button onclick="viewPropertyTree('${p.key}')">Tree</button>
-                                </td>
-                            </tr>
-                        `;
-                    });
-                    
-                    updatePagination('propertiesPagination', data.total_pages || 0);
-                })
-                .catch(err => {
-                    console.error('Error loading properties:', err);
-                    const tbody = document.querySelector('#propertiesTable tbody');
-                    tbody.innerHTML = `
-                        <tr>
-                            <td colspan="7" style="text-align: center; padding: 20px; color: #dc3545;">
-                                <i class="bi bi-x-circle"></i> Error loading properties: ${err.message}
-                            </td>
-                        </tr>
-                    `;
-                });
-        }
-        
-        function searchProperties(event) {
-            if (event.key === 'Enter') {
-                const query = event.target.value;
-                if (!query.trim()) {
-                    loadProperties();
-                    return;
-                }
-                
-                fetch(`/api/search-properties?q=${encodeURIComponent(query)}`)
-                    .then(r => r.json())
-                    .then(data => {
-                        const tbody = document.querySelector('#propertiesTable tbody');
-                        tbody.innerHTML = '';
-                        
-                        data.properties.forEach(p => {
-                            const tags = p.tags.map(tag => `<span class="tag">${tag}</span>`).join('');
-                            const typeClass = `type-${p.type.replace('_', '-')}`;
-                            
-                            tbody.innerHTML += `
-                                <tr>
-                                    <td><strong>${p.key}</strong></td>
-                                    <td><span class="type-badge ${typeClass}">${p.type}</span></td>
-                                    <td class="truncate">${p.value || '<empty>'}</td>
-                                    <td class="property-path">${p.path || ''}</td>
-                                    <td>${tags}</td>
-                                    <td>-</td>
-                                    <td>
-                                        <button onclick="viewProperty('${p.id}')">View</button>
-                                    </td>
-                                </tr>
-                            `;
-                        });
-                    })
-                    .catch(err => console.error('Error searching properties:', err));
-            }
-        }
-        
-        function viewProperty(id) {
-            fetch(`/api/properties/${id}`)
-                .then(r => r.json())
-                .then(data => {
-                    document.getElementById('modalTitle').textContent = data.key;
-                    document.getElementById('modalBody').innerHTML = `
-                        <p><strong>ID:</strong> ${data.id}</p>
-                        <p><strong>Type:</strong> <span class="type-badge type-${data.type.replace('_', '-')}">${data.type}</span></p>
-                        <p><strong>Path:</strong> ${data.path || 'Root'}</p>
-                        <p><strong>Tags:</strong> ${data.tags.map(t => `<span class="tag">${t}</span>`).join('')}</p>
-                        <p><strong>Created:</strong> ${formatDate(data.created_at)}</p>
-                        <p><strong>Updated:</strong> ${formatDate(data.updated_at)}</p>
-                        <p><strong>Value:</strong></p>
-                        <div class="code-block">${data.value || '<empty>'}</div>
-                    `;
-                    document.getElementById('modal').style.display = 'block';
-                })
-                .catch(err => console.error('Error loading property:', err));
-        }
-        
-        function viewPropertyTree(key) {
-            fetch(`/api/property-tree/${encodeURIComponent(key)}`)
-                .then(r => r.json())
-                .then(data => {
-                    document.getElementById('modalTitle').textContent = `Tree: ${key}`;
-                    document.getElementById('modalBody').innerHTML = renderPropertyTree(data.tree);
-                    document.getElementById('modal').style.display = 'block';
-                })
-                .catch(err => console.error('Error loading property tree:', err));
-        }
-        
-        function renderPropertyTree(node, level = 0) {
-            const indent = '  '.repeat(level);
-            const typeClass = `type-${node.type.replace('_', '-')}`;
-            let html = `
-                <div class="tree-item" style="margin-left: ${level * 20}px">
-                    <strong>${node.key}</strong> 
-                    <span class="type-badge ${typeClass}">${node.type}</span><br>
-                    <div class="code-block" style="margin: 5px 0; font-size: 12px;">${node.value || '<empty>'}</div>
-                </div>
-            `;
-            
-            if (node.children && node.children.length > 0) {
-                node.children.forEach(child => {
-                    html += renderPropertyTree(child, level + 1);
-                });
-            }
-            
-            return html;
-        }
-        
-        // Tags functions
-        function loadTags() {
-            const project = document.getElementById('projectFilter').value;
-            
-            fetch(`/api/tag-tree?project=${project}`)
-                .then(r => r.json())
-                .then(data => {
-                    const tagTree = document.getElementById('tagTree');
-                    
-                    if (data.error) {
-                        tagTree.innerHTML = `
-                            <div style="text-align: center; padding: 40px; color: #666;">
-                                <h3><i class="bi bi-exclamation-triangle"></i> ${data.error}</h3>
-                                <p>The documentation database needs to be initialized with the new schema.<br>
-                                Use the DocumentationMCP server to create tags and properties.</p>
-                            </div>
-                        `;
-                        return;
-                    }
-                    
-                    if (!data.tags || data.tags.length === 0) {
-                        tagTree.innerHTML = `
-                            <div style="text-align: center; padding: 40px; color: #666;">
-                                <h3><i class="bi bi-tags"></i> No tags found</h3>
-                                <p>Use the DocumentationMCP server to create hierarchical tags.</p>
-                            </div>
-                        `;
-                        return;
-                    }
-                    
-                    tagTree.innerHTML = renderTagTree(data.tags);
-                })
-                .catch(err => {
-                    console.error('Error loading tags:', err);
-                    document.getElementById('tagTree').innerHTML = `
-                        <div style="text-align: center; padding: 40px; color: #dc3545;">
-                            <h3><i class="bi bi-x-circle"></i> Error loading tags</h3>
-                            <p>${err.message}</p>
-                        </div>
-                    `;
-                });
-        }
-        
-        function renderTagTree(tags, level = 0) {
-            let html = '';
-            tags.forEach(tag => {
-                html += `
-                    <div class="tree-item" style="margin-left: ${level * 20}px">
-                        <span class="tree-toggle" onclick="toggleTag('${tag.id}')"><i class="bi bi-folder"></i></span>
-                        <span class="tag" style="background-color: ${tag.color || '#e0e0e0'}">${tag.name}</span>
-                        <span class="property-path">(${tag.property_count} properties)</span>
-                        <div id="tag-${tag.id}" class="tree-children">
-                            ${renderTagTree(tag.children, level + 1)}
-                        </div>
-                    </div>
-                `;
-            });
-            return html;
-        }
-        
-        // Projects functions
-        function loadProjects() {
-            fetch('/api/projects')
-                .then(r => r.json())
-                .then(data => {
-                    const tbody = document.querySelector('#projectsTable tbody');
-                    tbody.innerHTML = '';
-                    
-                    data.projects.forEach(p => {
-                        tbody.innerHTML += `
-                            <tr>
-                                <td><strong>${p.name}</strong></td>
-                                <td>${p.slug}</td>
-                                <td>${p.is_active ? '<i class="bi bi-check-circle text-success"></i> Active' : '<i class="bi bi-x-circle text-danger"></i> Inactive'}</td>
-                                <td>${p.property_count}</td>
-                                <td>${p.tag_count}</td>
-                                <td>${formatDate(p.created_at)}</td>
-                                <td>
-                                    <button onclick="viewProject('${p.id}')">View</button>
-                                </td>
-                            </tr>
-                        `;
-                    });
-                })
-                .catch(err => console.error('Error loading projects:', err));
-        }
-        
-        
-        // Statistics functions
-        function loadDatabaseStats() {
-            fetch('/api/database-stats')
-                .then(r => r.json())
-                .then(data => {
-                    // Activity stats
-                    document.getElementById('activityStats').innerHTML = `
-                        <div class="stat-card">
-                            <div class="stat-number">${data.total_entries || 0}</div>
-                            <div class="stat-label">Total Entries</div>
-                        </div>
-                        <div class="stat-card">
-                            <div class="stat-number">${data.unique_apps || 0}</div>
-                            <div class="stat-label">Unique Apps</div>
-                        </div>
-                        <div class="stat-card">
-                            <div class="stat-number">${data.days_of_data || 0}</div>
-                            <div class="stat-label">Days of Data</div>
-                        </div>
-                    `;
-                    
-                    // Database stats
-                    document.getElementById('databaseStats').innerHTML = `
-                        <div class="stat-card">
-                            <div class="stat-number">${data.total_properties || 0}</div>
-                            <div class="stat-label">Total Properties</div>
-                        </div>
-                        <div class="stat-card">
-                            <div class="stat-number">${data.total_tags || 0}</div>
-                            <div class="stat-label">Tags</div>
-                        </div>
-                        <div class="stat-card">
-                            <div class="stat-number">${data.active_projects || 0}</div>
-                            <div class="stat-label">Active Projects</div>
-                        </div>
-                        <div class="stat-card">
-                            <div class="stat-number">${data.total_versions || 0}</div>
-                            <div class="stat-label">Versions</div>
-                        </div>
-                        <div class="stat-card">
-                            <div class="stat-number">${data.index_coverage || 0}%</div>
-                            <div class="stat-label">Search Index Coverage</div>
-                        </div>
-                        <div class="stat-card">
-                            <div class="stat-number">${data.size_mb || 0}</div>
-                            <div class="stat-label">Database Size (MB)</div>
-                        </div>
-                    `;
-                    
-                    // Property type chart
-                    if (data.properties_by_type) {
-                        let chartHtml = '<div style="display: flex; flex-wrap: wrap; gap: 10px;">';
-                        Object.entries(data.properties_by_type).forEach(([type, count]) => {
-                            const typeClass = `type-${type.replace('_', '-')}`;
-                            chartHtml += `
-                                <div class="stat-card" style="min-width: 150px;">
-                                    <div class="stat-number">${count}</div>
-                                    <div class="stat-label">
-                                        <span class="type-badge ${typeClass}">${type}</span>
-                                    </div>
-                                </div>
-                            `;
-                        });
-                        chartHtml += '</div>';
-                        document.getElementById('typeChart').innerHTML = chartHtml;
-                    }
-                })
-                .catch(err => console.error('Error loading database stats:', err));
-        }
-        
-        // Utility functions
-        function loadTagOptions() {
-            fetch('/api/tags')
-                .then(r => r.json())
-                .then(data => {
-                    const select = document.getElementById('tagFilter');
-                    select.innerHTML = '<option value="">All Tags</option>';
-                    
-                    if (data.error) {
-                        select.innerHTML += '<option value="" disabled><i class="bi bi-exclamation-triangle"></i> ' + data.error + '</option>';
-                        return;
-                    }
-                    
-                    if (data.tags && data.tags.length > 0) {
-                        data.tags.forEach(tag => {
-                            select.innerHTML += `<option value="${tag.slug}">${tag.name}</option>`;
-                        });
-                    } else {
-                        select.innerHTML += '<option value="" disabled>No tags available</option>';
-                    }
-                })
-                .catch(err => {
-                    console.error('Error loading tag options:', err);
-                    const select = document.getElementById('tagFilter');
-                    select.innerHTML = '<option value="">All Tags</option><option value="" disabled><i class="bi bi-x-circle"></i> Error loading tags</option>';
-                });
-        }
-        
-        function loadProjectOptions() {
-            fetch('/api/projects')
-                .then(r => r.json())
-                .then(data => {
-                    const select = document.getElementById('projectFilter');
-                    select.innerHTML = '';
-                    data.projects.forEach(project => {
-                        select.innerHTML += `<option value="${project.slug}">${project.name}</option>`;
-                    });
-                })
-                .catch(err => console.error('Error loading project options:', err));
-        }
-        
-        function updatePagination(elementId, totalPages) {
-            const pagination = document.getElementById(elementId);
-            pagination.innerHTML = '';
-            
-            for (let i = 1; i <= Math.min(totalPages, 10); i++) {
-                pagination.innerHTML += `
-                    <button class="page-btn ${i === currentPage ? 'active' : ''}" 
-                            onclick="changePage(${i})">${i}</button>
-                `;
-            }
-        }
-        
-        function changePage(page) {
-            currentPage = page;
-            if (currentTab === 'activities') loadActivities();
-            else if (currentTab === 'properties') loadProperties();
-        }
-        
-        function formatDate(dateStr) {
-            if (!dateStr) return '-';
-            const date = new Date(dateStr);
-            return date.toLocaleDateString() + ' ' + date.toLocaleTimeString();
-        }
-        
-        function closeModal() {
-            document.getElementById('modal').style.display = 'none';
-        }
-        
-        function refreshActivities() {
-            loadActivities();
-            loadDatabaseStats();
-        }
-        
-        function rebuildSearchIndex() {
-            if (confirm('Rebuild search index? This may take a moment.')) {
-                fetch('/api/rebuild-search-index', { method: 'POST' })
-                    .then(r => r.json())
-                    .then(data => {
-                        alert(data.message || 'Search index rebuilt');
-                        loadDatabaseStats();
-                    })
-                    .catch(err => {
-                        console.error('Error rebuilding index:', err);
-                        alert('Error rebuilding search index');
-                    });
-            }
-        }
-        
-        // Form functions (placeholders)
-        function showPropertyForm() {
-            alert('Property form not implemented yet');
-        }
-        
-        function showTagForm() {
-            alert('Tag form not implemented yet');
-        }
-        
-        function showProjectForm() {
-            alert('Project form not implemented yet');
-        }
-        
-        
-        // Settings functions
-        function loadSettings(force = false) {
-            fetch('/api/config' + (force ? '?reload=true' : ''))
-                .then(r => r.json())
-                .then(data => {
-                    if (data.error) {
-                        showAlert('Error loading settings: ' + data.error, 'error');
-                        return;
-                    }
-                    
-                    // Populate form fields
-                    document.getElementById('recallDbPath').value = data.recall_db_path || '';
-                    document.getElementById('docsDbPath').value = data.docs_db_path || '';
-                    document.getElementById('serverHost').value = data.server.host || '127.0.0.1';
-                    document.getElementById('serverPort').value = data.server.port || 8084;
-                    document.getElementById('autoRefresh').value = data.interface.auto_refresh_seconds || 30;
-                    document.getElementById('pageSize').value = data.interface.default_page_size || 20;
-                    
-                    // Update status indicators
-                    updateDatabaseStatus('recallDbStatus', data.recall_db_status);
-                    updateDatabaseStatus('docsDbStatus', data.docs_db_status);
-                    
-                    // Update config status table
-                    updateConfigStatusTable(data);
-                })
-                .catch(err => {
-                    console.error('Error loading settings:', err);
-                    showAlert('Failed to load settings', 'error');
-                });
-        }
-        
-        function saveSettings() {
-            const settings = {
-                recall_db_path: document.getElementById('recallDbPath').value,
-                docs_db_path: document.getElementById('docsDbPath').value,
-                server: {
-                    host: document.getElementById('serverHost').value,
-                    port: parseInt(document.getElementById('serverPort').value)
-                },
-                interface: {
-                    auto_refresh_seconds: parseInt(document.getElementById('autoRefresh').value),
-                    default_page_size: parseInt(document.getElementById('pageSize').value)
-                }
-            };
-            
-            fetch('/api/config', {
-                method: 'POST',
-                headers: {
-                    'Content-Type': 'application/json'
-                },
-                body: JSON.stringify(settings)
-            })
-            .then(r => r.json())
-            .then(data => {
-                if (data.error) {
-                    showAlert('Error saving settings: ' + data.error, 'error');
-                } else {
-                    showAlert('Settings saved successfully! Restart required for server settings to take effect.', 'success');
-                    loadSettings(true); // Reload to show updated status
-                }
-            })
-            .catch(err => {
-                console.error('Error saving settings:', err);
-                showAlert('Failed to save settings', 'error');
-            });
-        }
-        
-        function resetToDefaults() {
-            if (confirm('Reset all settings to defaults? This cannot be undone.')) {
-                fetch('/api/config/reset', { method: 'POST' })
-                    .then(r => r.json())
-                    .then(data => {
-                        if (data.error) {
-                            showAlert('Error resetting settings: ' + data.error, 'error');
-                        } else {
-                            showAlert('Settings reset to defaults', 'success');
-                            loadSettings(true);
-                        }
-                    })
-                    .catch(err => {
-                        console.error('Error resetting settings:', err);
-                        showAlert('Failed to reset settings', 'error');
-                    });
-            }
-        }
-        
-        function updateDatabaseStatus(elementId, status) {
-            const element = document.getElementById(elementId);
-            if (!element) return;
-            
-            if (status && status.exists) {
-                element.className = 'config-status config-valid';
-                element.textContent = `✓ Valid (${status.size_mb} MB, ${status.entries || 'N/A'} entries)`;
-            } else {
-                element.className = 'config-status config-invalid';
-                element.textContent = status ? status.error || '✗ File not found' : '✗ Not configured';
-            }
-        }
-        
-        function updateConfigStatusTable(config) {
-            const tbody = document.querySelector('#configStatusTable tbody');
-            tbody.innerHTML = '';
-            
-            const settings = [
-                { key: 'Recall DB', value: config.recall_db_path, status: config.recall_db_status },
-                { key: 'Docs DB', value: config.docs_db_path, status: config.docs_db_status },
-                { key: 'Server Host', value: config.server.host, status: { exists: true } },
-                { key: 'Server Port', value: config.server.port, status: { exists: true } },
-                { key: 'Auto Refresh', value: config.interface.auto_refresh_seconds + 's', status: { exists: true } },
-                { key: 'Page Size', value: config.interface.default_page_size, status: { exists: true } }
-            ];
-            
-            settings.forEach(setting => {
-                const statusClass = setting.status && setting.status.exists ? 'config-valid' : 'config-invalid';
-                const statusText = setting.status && setting.status.exists ? 'Valid' : (setting.status ? setting.status.error || 'Invalid' : 'Not Set');
-                
-                tbody.innerHTML += `
-                    <tr>
-                        <td><strong>${setting.key}</strong></td>
-                        <td class="truncate" title="${setting.value || ''}">${setting.value || '<not set>'}</td>
-                        <td><span class="config-status ${statusClass}">${statusText}</span></td>
-                        <td>${config.last_updated || '-'}</td>
-                    </tr>
-                `;
-            });
-        }
-        
-        function showAlert(message, type) {
-            const alertDiv = document.getElementById('settingsAlert');
-            alertDiv.innerHTML = `<div class="alert alert-${type === 'success' ? 'success' : 'error'}">${message}</div>`;
-            setTimeout(() => {
-                alertDiv.innerHTML = '';
-            }, 5000);
-        }
-    </script>
 </body>
 </html>
 """
 
 
+# Correlated subquery that returns a property's tag names as a JSON array
+PROPERTY_TAGS_JSON = """(
+    SELECT json_group_array(t.name) FROM property_tags pt
+    JOIN tags t ON t.id = pt.tag_id
+    WHERE pt.property_id = p.id
+)"""
+
+# Aggregates served from the stats_cache table, with the query used to recount each one
+STATS_CACHE_COUNTS = {
+    'properties_active': "SELECT COUNT(*) FROM properties WHERE status = 'active'",
+    'tags': "SELECT COUNT(*) FROM tags",
+    'projects_active': "SELECT COUNT(*) FROM projects WHERE is_active = 1",
+    'versions': "SELECT COUNT(*) FROM versions",
+    'search_index': "SELECT COUNT(*) FROM search_index",
+}
+
+# Per-type active property totals, kept in property_type_counts alongside stats_cache
+PROPERTY_TYPE_COUNTS_SQL = "SELECT type, COUNT(*) FROM properties WHERE status = 'active' GROUP BY type"
+
+
+# Tab panes under templates/tabs/, all but the first served lazily from /tabs/<name>
+TAB_NAMES = ('activities', 'properties', 'tags', 'projects', 'stats', 'settings')
+
+# Recall counters for the statistics tab in one statement; as separate scalar subqueries
+# MIN and MAX each stay a single idx_timestamp lookup instead of joining the DISTINCT scan
+RECALL_STATS_SQL = """
+    SELECT (SELECT COUNT(*) FROM entries),
+           (SELECT COUNT(DISTINCT app) FROM entries),
+           (SELECT MIN(timestamp) FROM entries),
+           (SELECT MAX(timestamp) FROM entries)
+"""
+
+# Statements checked with EXPLAIN QUERY PLAN at startup
+# The activities page queries end with the number of groups in the window as a total_rows column
+ACTIVITIES_SQL = """
+    SELECT app, title, COUNT(*) as count,
+           MIN(timestamp) as first_seen,
+           MAX(timestamp) as last_seen,
+           ROUND((MAX(timestamp) - MIN(timestamp)) / 60.0, 1) as duration_minutes,
+           COUNT(*) OVER () as total_rows
+    FROM entries
+    WHERE timestamp >= ?
+    GROUP BY app, title
+    ORDER BY count DESC
+    LIMIT ? OFFSET ?
+"""
+
+# Per-day (app, title) totals; whole days are read from activity_rollup and only the part
+# of the first day after the window start is aggregated from entries
+ACTIVITY_WINDOW_CTE = """
+    WITH window_rows(app, title, count, first_seen, last_seen) AS (
+        SELECT app, title, count, first_ts, last_ts
+        FROM activity_rollup
+        WHERE day >= ?
+        UNION ALL
+        SELECT COALESCE(app, ''), COALESCE(title, ''), COUNT(*), MIN(timestamp), MAX(timestamp)
+        FROM entries
+        WHERE timestamp >= ? AND timestamp < ?
+        GROUP BY 1, 2
+    )
+"""
+
+ACTIVITIES_ROLLUP_SQL = ACTIVITY_WINDOW_CTE + """
+    SELECT app, title, SUM(count) as count,
+           MIN(first_seen) as first_seen,
+           MAX(last_seen) as last_seen,
+           ROUND((MAX(last_seen) - MIN(first_seen)) / 60.0, 1) as duration_minutes,
+           COUNT(*) OVER () as total_rows
+    FROM window_rows
+    GROUP BY app, title
+    ORDER BY count DESC
+    LIMIT ? OFFSET ?
+"""
+
+# Recomputes one (app, title, day) rollup row from entries; {row} is old or new inside a trigger.
+# Every entry of a local day lies within 25 hours of any other, which keeps idx_timestamp usable.
+ACTIVITY_ROLLUP_RECOUNT = """
+    DELETE FROM activity_rollup
+    WHERE app = COALESCE({row}.app, '') AND title = COALESCE({row}.title, '')
+      AND day = date({row}.timestamp, 'unixepoch', 'localtime');
+    INSERT INTO activity_rollup (app, title, day, count, first_ts, last_ts)
+    SELECT COALESCE(app, ''), COALESCE(title, ''), date(timestamp, 'unixepoch', 'localtime'),
+           COUNT(*), MIN(timestamp), MAX(timestamp)
+    FROM entries
+    WHERE timestamp BETWEEN {row}.timestamp - 90000 AND {row}.timestamp + 90000
+      AND date(timestamp, 'unixepoch', 'localtime') = date({row}.timestamp, 'unixepoch', 'localtime')
+      AND COALESCE(app, '') = COALESCE({row}.app, '') AND COALESCE(title, '') = COALESCE({row}.title, '')
+    GROUP BY 1, 2, 3;
+"""
+
+SEARCH_ACTIVITIES_FTS_SQL = """
+    SELECT app, title, COUNT(*) as count,
+           MIN(timestamp) as first_seen,
+           MAX(timestamp) as last_seen
+    FROM entries
+    WHERE id IN (SELECT rowid FROM entries_fts WHERE entries_fts MATCH ?)
+    GROUP BY app, title
+    ORDER BY count DESC
+    LIMIT 20
+"""
+
+PROPERTIES_PAGE_SQL = f"""
+    SELECT p.id, p.key, substr(p.value, 1, 200), p.type, p.updated_at, si.computed_path,
+           {PROPERTY_TAGS_JSON}
+    FROM properties p
+    LEFT JOIN search_index si ON p.id = si.property_id
+    WHERE p.status = 'active'
+"""
+
+# Projects with their tagged active properties (one per tag assignment) and tag counts,
+# each aggregated in a single pass instead of per project
+PROJECTS_SQL = """
+    SELECT p.id, p.name, p.slug, p.is_active, p.created_at,
+           COALESCE(pc.property_count, 0), COALESCE(tc.tag_count, 0)
+    FROM projects p
+    LEFT JOIN (
+        SELECT t.project_id, COUNT(*) as property_count
+        FROM property_tags pt
+        JOIN tags t ON pt.tag_id = t.id
+        JOIN properties pr ON pr.id = pt.property_id
+        WHERE pr.status = 'active'
+        GROUP BY t.project_id
+    ) pc ON pc.project_id = p.id
+    LEFT JOIN (
+        SELECT project_id, COUNT(*) as tag_count FROM tags GROUP BY project_id
+    ) tc ON tc.project_id = p.id
+    ORDER BY p.created_at DESC
+"""
+
+# Deepest level below the root that /api/property-tree returns
+PROPERTY_TREE_DEPTH = 5
+
+# Rows come out depth by depth, and by key within a depth, so every parent precedes its children
+PROPERTY_TREE_SQL = f"""
+    WITH RECURSIVE subtree(id, key, value, type, parent_id, depth) AS (
+        SELECT id, key, value, type, parent_id, 0 FROM properties
+        WHERE id = (SELECT id FROM properties WHERE key = ? AND status = 'active' LIMIT 1)
+        UNION ALL
+        SELECT p.id, p.key, p.value, p.type, p.parent_id, subtree.depth + 1
+        FROM properties p
+        JOIN subtree ON p.parent_id = subtree.id
+        WHERE subtree.depth < {PROPERTY_TREE_DEPTH} AND p.status = 'active'
+    )
+    SELECT id, key, value, type, parent_id, depth FROM subtree
+    ORDER BY depth, key
+"""
+
+SEARCH_PROPERTIES_SQL = f"""
+    SELECT p.id, p.key, substr(p.value, 1, 200), p.type, si.computed_path,
+           {PROPERTY_TAGS_JSON}
+    FROM properties p
+    LEFT JOIN search_index si ON p.id = si.property_id
+    WHERE p.status = 'active'
+    AND (p.key LIKE ? OR p.value LIKE ? OR si.search_vector LIKE ?)
+    ORDER BY p.updated_at DESC
+    LIMIT 50
+"""
+
+SEARCH_PROPERTIES_FTS_SQL = f"""
+    SELECT p.id, p.key, substr(p.value, 1, 200), p.type, si.computed_path,
+           {PROPERTY_TAGS_JSON}
+    FROM properties_fts f
+    JOIN properties p ON p.rowid = f.rowid
+    LEFT JOIN search_index si ON p.id = si.property_id
+    WHERE properties_fts MATCH ? AND p.status = 'active'
+    ORDER BY p.updated_at DESC
+    LIMIT 50
+"""
+
+PROPERTY_DETAIL_SQL = f"""
+    SELECT p.id, p.key, p.value, p.type, p.created_at, p.updated_at, si.computed_path,
+           {PROPERTY_TAGS_JSON}
+    FROM properties p
+    LEFT JOIN search_index si ON p.id = si.property_id
+    WHERE p.id = ? AND p.status = 'active'
+"""
+
+# Indexes behind the viewer's hot queries, also added to databases created before them: (name, table, columns)
+DOCS_INDEXES = (
+    ('idx_tags_parent', 'tags', 'parent_tag_id, project_id'),
+    ('idx_property_tags_tag', 'property_tags', 'tag_id'),
+    ('idx_tags_project', 'tags', 'project_id'),
+    ('idx_properties_status_updated', 'properties', 'status, updated_at DESC'),
+    ('idx_properties_status_type', 'properties', 'status, type'),
+)
+RECALL_INDEXES = (
+    ('idx_entries_ts_app_title', 'entries', 'timestamp, app, title'),
+    ('idx_entries_app', 'entries', 'app'),
+)
+
+# Static files referenced by the shell under a content-hashed name, cached by browsers for a year
+STATIC_ASSETS = ('viewer.js', 'viewer.css')
+ASSET_MAX_AGE = 365 * 86400
+
+# Property and activity pages larger than this are streamed row by row instead of built in memory
+STREAM_PAGE_SIZE = 500
+
+# (label, database, statement, index to suggest if the plan falls back to a table scan)
+TRACKED_QUERIES = [
+    ('activities', 'recall', ACTIVITIES_SQL,
+     "CREATE INDEX idx_timestamp ON entries (timestamp)"),
+    ('activities rollup', 'recall', "SELECT app, title, count FROM activity_rollup WHERE day >= ?",
+     "CREATE INDEX idx_activity_rollup_day ON activity_rollup(day)"),
+    ('activity search', 'recall', SEARCH_ACTIVITIES_FTS_SQL,
+     "restart the viewer with write access to build entries_fts"),
+    ('property search', 'docs', SEARCH_PROPERTIES_FTS_SQL,
+     "restart the viewer with write access to build properties_fts"),
+    ('properties page', 'docs', PROPERTIES_PAGE_SQL + " ORDER BY p.updated_at DESC LIMIT ? OFFSET ?",
+     "CREATE INDEX idx_properties_status_updated ON properties(status, updated_at DESC)"),
+    ('property detail', 'docs', PROPERTY_DETAIL_SQL,
+     "CREATE UNIQUE INDEX idx_properties_id ON properties(id)"),
+]
+
+
+# Applied to every pooled connection; WAL lets the viewer read while OpenRecall and the MCP server write.
+# Pooled connections only read (schema changes go through their own connections at startup),
+# so query_only comes last, after journal_mode has had its one chance to write.
+CONNECTION_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA cache_size=-131072",
+    "PRAGMA mmap_size=1073741824",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA query_only=1",
+)
+
+DB_POOL_SIZE = 4
+
+# Compiled statements kept per pooled connection; the routes use a bounded set of SQL strings
+DB_STATEMENT_CACHE_SIZE = 256
+
+# Serialized API responses and statistics kept in memory per (URL, database signatures), and how
+# long browsers and the server may reuse one without running the query again
+RESPONSE_CACHE_SIZE = 128
+RESPONSE_CACHE_TTL = 5
+
+# Divisor for the size_mb figures of the statistics and settings tabs
+BYTES_PER_MB = 1 << 20
+
+# Seconds a database file existence check is reused by the request handlers
+DB_EXISTS_TTL = 5
+
+
+class OrjsonProvider(DefaultJSONProvider):
+    """Flask JSON provider backed by orjson, keeping the default provider's sorted keys"""
+    
+    options = orjson.OPT_NON_STR_KEYS | orjson.OPT_SORT_KEYS if orjson else 0
+    
+    def dumps(self, obj, **kwargs):
+        return orjson.dumps(obj, default=self.default, option=self.options).decode()
+    
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+    
+    def response(self, *args, **kwargs):
+        obj = self._prepare_response_obj(args, kwargs)
+        body = orjson.dumps(obj, default=self.default, option=self.options | orjson.OPT_APPEND_NEWLINE)
+        return self._app.response_class(body, mimetype=self.mimetype)
+
+
+class DBPool:
+    """Bounded pool of open SQLite connections to one database file, shared by the request threads"""
+    
+    def __init__(self, db_path, size=DB_POOL_SIZE):
+        self.db_path = db_path
+        self.size = size
+        self.idle = queue.Queue(maxsize=size)
+        self.opened = 0
+        self.closed = False
+        self.lock = threading.Lock()
+    
+    def open(self):
+        """Open a connection usable from any thread and apply CONNECTION_PRAGMAS"""
+        conn = sqlite3.connect(self.db_path, check_same_thread=False, cached_statements=DB_STATEMENT_CACHE_SIZE)
+        for pragma in CONNECTION_PRAGMAS:
+            try:
+                conn.execute(pragma)
+            except sqlite3.OperationalError as e:
+                # journal_mode=WAL needs write access; the remaining pragmas still apply
+                print(f"Warning: {pragma} failed on {self.db_path}: {e}")
+        return conn
+    
+    @contextmanager
+    def connection(self):
+        """Borrow a connection, committing or rolling back like `with sqlite3.connect(...)`"""
+        try:
+            conn = self.idle.get_nowait()
+        except queue.Empty:
+            with self.lock:
+                can_open = self.opened < self.size
+                if can_open:
+                    self.opened += 1
+            conn = self.open() if can_open else self.idle.get()
+        try:
+            with conn:
+                yield conn
+        finally:
+            if self.closed:
+                conn.close()
+            else:
+                self.idle.put(conn)
+    
+    def close(self):
+        """Close every idle connection; borrowed ones are closed when returned"""
+        self.closed = True
+        while True:
+            try:
+                self.idle.get_nowait().close()
+            except queue.Empty:
+                break
+
+
 class DatabaseViewer:
     def __init__(self, config_path="database_viewer.ini", recall_db_path=None, docs_db_path=None):
         self.config_path = config_path
+        self.config_file = str(Path(config_path).absolute())
+        self.config_file_cache = None
         self.config = self.load_config()
         
         # Override with command line arguments if provided
@@ -1515,8 +528,29 @@ class DatabaseViewer:
         self.docs_db_path = self.config.get('database', 'docs_db_path', fallback='documentation.db')
         
         self.app = Flask(__name__)
+        if orjson:
+            self.app.json = OrjsonProvider(self.app)
+        if Compress:
+            Compress(self.app)
+        self.db_pools = {}
+        self.db_pools_lock = threading.Lock()
+        self.schema_cache = {}
+        self.response_cache = OrderedDict()
+        self.response_cache_lock = threading.Lock()
+        self.stats_refresh_stop = threading.Event()
+        self.stats_refresh_thread = None
+        atexit.register(self.close)
+        self.pending_analyze = {}
         self.init_documentation_db()
+        self.init_stats_cache()
+        self.init_properties_fts()
+        self.init_recall_db()
+        self.init_recall_indexes()
+        self.init_activity_rollup()
+        self.check_query_plans()
         self.setup_routes()
+        self.render_shell()
+        self.start_stats_cache_refresh()
     
     def load_config(self):
         """Load configuration from INI file, create default if doesn't exist"""
@@ -1529,17 +563,25 @@ class DatabaseViewer:
         }
         config['server'] = {
             'host': '127.0.0.1',
-            'port': '8084'
+            'port': '8084',
+            'threads': '8'
         }
         config['interface'] = {
             'auto_refresh_seconds': '30',
-            'default_page_size': '20'
+            'default_page_size': '20',
+            'stats_refresh_minutes': '10'
         }
         
-        # Load from file if exists
+        # Load from file if exists; an unchanged file is not read and parsed again
         if Path(self.config_path).exists():
             try:
-                config.read(self.config_path)
+                stat = os.stat(self.config_path)
+                key = (self.config_path, stat.st_mtime_ns, stat.st_size)
+                if self.config_file_cache is None or self.config_file_cache[0] != key:
+                    parsed = configparser.ConfigParser()
+                    parsed.read(self.config_path)
+                    self.config_file_cache = (key, {section: dict(parsed[section]) for section in parsed.sections()})
+                config.read_dict(self.config_file_cache[1])
             except Exception as e:
                 print(f"Warning: Error reading config file {self.config_path}: {e}")
                 print("Using default configuration")
@@ -1573,20 +615,21 @@ class DatabaseViewer:
         if not db_path:
             return {'exists': False, 'error': 'Path not configured'}
             
-        path = Path(db_path)
-        if not path.exists():
+        # One stat answers both whether the file exists and how big it is
+        try:
+            size_bytes = os.stat(db_path).st_size
+        except OSError:
             return {'exists': False, 'error': 'File does not exist'}
             
         try:
-            size_mb = round(path.stat().st_size / 1024 / 1024, 2)
+            size_mb = round(size_bytes / BYTES_PER_MB, 2)
             
             # Try to get entry count for validation
             with sqlite3.connect(db_path) as conn:
                 cursor = conn.cursor()
                 
                 # Check if it's an OpenRecall DB or Documentation DB
-                cursor.execute("SELECT name FROM sqlite_master WHERE type='table'")
-                tables = [row[0] for row in cursor.fetchall()]
+                tables = self.db_tables(conn, db_path)
                 
                 if 'entries' in tables:  # OpenRecall DB
                     cursor.execute("SELECT COUNT(*) FROM entries")
@@ -1601,7 +644,7 @@ class DatabaseViewer:
                 'exists': True,
                 'size_mb': size_mb,
                 'entries': entries,
-                'tables': tables
+                'tables': list(tables)
             }
         except Exception as e:
             return {'exists': False, 'error': f'Database error: {str(e)}'}
@@ -1622,15 +665,461 @@ class DatabaseViewer:
                     self.create_documentation_schema(cursor)
                     conn.commit()
                     print(f"Initialized documentation database schema: {self.docs_db_path}")
+                
+                self.add_indexes(conn, self.docs_db_path, DOCS_INDEXES)
                     
         except Exception as e:
             print(f"Warning: Could not initialize documentation database: {e}")
     
+    def init_recall_indexes(self):
+        """Add the covering index read by the activities queries to the OpenRecall database"""
+        if not self.recall_db_path or not Path(self.recall_db_path).exists():
+            return
+            
+        try:
+            with sqlite3.connect(self.recall_db_path) as conn:
+                self.add_indexes(conn, self.recall_db_path, RECALL_INDEXES)
+                
+        except Exception as e:
+            print(f"Warning: Could not add activity indexes: {e}")
+    
+    def add_indexes(self, conn, db_path, indexes):
+        """Create the missing indexes and queue their tables for ANALYZE in check_query_plans"""
+        cursor = conn.cursor()
+        cursor.execute("SELECT name FROM sqlite_master WHERE type='index'")
+        existing = {row[0] for row in cursor.fetchall()}
+        
+        for name, table, columns in indexes:
+            if name not in existing:
+                cursor.execute(f"CREATE INDEX {name} ON {table}({columns})")
+                self.pending_analyze.setdefault(db_path, set()).add(table)
+        conn.commit()
+    
+    def init_stats_cache(self):
+        """Create the trigger-maintained stats_cache table used by the Statistics tab"""
+        if not self.docs_db_path or not Path(self.docs_db_path).exists():
+            return
+            
+        try:
+            with sqlite3.connect(self.docs_db_path) as conn:
+                cursor = conn.cursor()
+                cursor.execute("SELECT name FROM sqlite_master WHERE type='table' AND name='properties'")
+                if not cursor.fetchone():
+                    return
+                
+                cursor.execute("""
+                    CREATE TABLE IF NOT EXISTS stats_cache (
+                        key TEXT PRIMARY KEY,
+                        value INTEGER NOT NULL DEFAULT 0,
+                        updated_at INTEGER
+                    )
+                """)
+                
+                bump = "UPDATE stats_cache SET value = value + ({delta}), updated_at = strftime('%s', 'now') WHERE key = '{key}'"
+                
+                # Plain tables: every row counts
+                for table in ('tags', 'versions'):
+                    cursor.execute(f"""
+                        CREATE TRIGGER IF NOT EXISTS stats_{table}_ai AFTER INSERT ON {table} BEGIN
+                            {bump.format(key=table, delta=1)};
+                        END
+                    """)
+                    cursor.execute(f"""
+                        CREATE TRIGGER IF NOT EXISTS stats_{table}_ad AFTER DELETE ON {table} BEGIN
+                            {bump.format(key=table, delta=-1)};
+                        END
+                    """)
+                
+                # Projects: only active ones count
+                cursor.execute(f"""
+                    CREATE TRIGGER IF NOT EXISTS stats_projects_ai AFTER INSERT ON projects WHEN new.is_active BEGIN
+                        {bump.format(key='projects_active', delta=1)};
+                    END
+                """)
+                cursor.execute(f"""
+                    CREATE TRIGGER IF NOT EXISTS stats_projects_ad AFTER DELETE ON projects WHEN old.is_active BEGIN
+                        {bump.format(key='projects_active', delta=-1)};
+                    END
+                """)
+                cursor.execute(f"""
+                    CREATE TRIGGER IF NOT EXISTS stats_projects_au AFTER UPDATE OF is_active ON projects BEGIN
+                        {bump.format(key='projects_active', delta="(new.is_active <> 0) - (old.is_active <> 0)")};
+                    END
+                """)
+                
+                # properties and search_index are written with INSERT OR REPLACE, whose implicit
+                # delete does not fire triggers, so account for the row being replaced up front
+                cursor.execute(f"""
+                    CREATE TRIGGER IF NOT EXISTS stats_properties_bi BEFORE INSERT ON properties BEGIN
+                        {bump.format(key='properties_active', delta="(new.status = 'active') - COALESCE((SELECT status = 'active' FROM properties WHERE id = new.id), 0)")};
+                    END
+                """)
+                cursor.execute(f"""
+                    CREATE TRIGGER IF NOT EXISTS stats_properties_ad AFTER DELETE ON properties WHEN old.status = 'active' BEGIN
+                        {bump.format(key='properties_active', delta=-1)};
+                    END
+                """)
+                cursor.execute(f"""
+                    CREATE TRIGGER IF NOT EXISTS stats_properties_au AFTER UPDATE OF status ON properties BEGIN
+                        {bump.format(key='properties_active', delta="(new.status = 'active') - (old.status = 'active')")};
+                    END
+                """)
+                # Per-type totals; type may be NULL, so rows are matched with IS rather than =
+                cursor.execute("""
+                    CREATE TABLE IF NOT EXISTS property_type_counts (
+                        type TEXT PRIMARY KEY,
+                        cnt INTEGER NOT NULL DEFAULT 0
+                    )
+                """)
+                type_row = "INSERT INTO property_type_counts (type) SELECT {type} WHERE NOT EXISTS (SELECT 1 FROM property_type_counts WHERE type IS {type})"
+                type_bump = "UPDATE property_type_counts SET cnt = cnt + ({delta}) WHERE type IS {type}"
+                cursor.execute(f"""
+                    CREATE TRIGGER IF NOT EXISTS property_type_counts_bi BEFORE INSERT ON properties BEGIN
+                        UPDATE property_type_counts SET cnt = cnt - 1 WHERE EXISTS (
+                            SELECT 1 FROM properties p
+                            WHERE p.id = new.id AND p.status = 'active' AND p.type IS property_type_counts.type
+                        );
+                        {type_row.format(type='new.type')};
+                        {type_bump.format(type='new.type', delta="new.status IS 'active'")};
+                    END
+                """)
+                cursor.execute(f"""
+                    CREATE TRIGGER IF NOT EXISTS property_type_counts_ad AFTER DELETE ON properties WHEN old.status = 'active' BEGIN
+                        {type_bump.format(type='old.type', delta=-1)};
+                    END
+                """)
+                cursor.execute(f"""
+                    CREATE TRIGGER IF NOT EXISTS property_type_counts_au AFTER UPDATE OF status, type ON properties BEGIN
+                        {type_bump.format(type='old.type', delta="-(old.status IS 'active')")};
+                        {type_row.format(type='new.type')};
+                        {type_bump.format(type='new.type', delta="new.status IS 'active'")};
+                    END
+                """)
+                cursor.execute(f"""
+                    CREATE TRIGGER IF NOT EXISTS stats_search_index_bi BEFORE INSERT ON search_index BEGIN
+                        {bump.format(key='search_index', delta="NOT EXISTS (SELECT 1 FROM search_index WHERE property_id = new.property_id)")};
+                    END
+                """)
+                cursor.execute(f"""
+                    CREATE TRIGGER IF NOT EXISTS stats_search_index_ad AFTER DELETE ON search_index BEGIN
+                        {bump.format(key='search_index', delta=-1)};
+                    END
+                """)
+                
+                self.refresh_stats_cache(cursor)
+                conn.commit()
+                
+        except Exception as e:
+            print(f"Warning: Could not initialize stats cache: {e}")
+    
+    @staticmethod
+    def refresh_stats_cache(cursor):
+        """Recount every cached statistic from the underlying tables, writing only the values that drifted"""
+        cursor.execute("SELECT key, value FROM stats_cache")
+        stored = dict(cursor.fetchall())
+        for key, sql in STATS_CACHE_COUNTS.items():
+            cursor.execute(sql)
+            value = cursor.fetchone()[0]
+            if stored.get(key) != value:
+                cursor.execute("""
+                    INSERT OR REPLACE INTO stats_cache (key, value, updated_at)
+                    VALUES (?, ?, strftime('%s', 'now'))
+                """, (key, value))
+        
+        # NULL types make the rows unorderable, so sort by repr
+        cursor.execute("SELECT type, cnt FROM property_type_counts WHERE cnt > 0")
+        stored_types = sorted(cursor.fetchall(), key=repr)
+        cursor.execute(PROPERTY_TYPE_COUNTS_SQL)
+        if sorted(cursor.fetchall(), key=repr) != stored_types:
+            cursor.execute("DELETE FROM property_type_counts")
+            cursor.execute(f"INSERT INTO property_type_counts (type, cnt) {PROPERTY_TYPE_COUNTS_SQL}")
+    
+    def start_stats_cache_refresh(self):
+        """Periodically recount stats_cache in the background so it self-heals after out-of-band writes"""
+        if not self.docs_db_path or not Path(self.docs_db_path).exists():
+            return
+        with self.get_conn(self.docs_db_path) as conn:
+            if 'stats_cache' not in self.db_tables(conn, self.docs_db_path):
+                return
+        
+        interval = max(self.config.getint('interface', 'stats_refresh_minutes', fallback=10), 1) * 60
+        
+        def refresh_loop():
+            while not self.stats_refresh_stop.wait(interval):
+                try:
+                    with sqlite3.connect(self.docs_db_path) as conn:
+                        self.refresh_stats_cache(conn.cursor())
+                except Exception as e:
+                    print(f"Warning: Could not refresh stats cache: {e}")
+        
+        self.stats_refresh_thread = threading.Thread(target=refresh_loop, daemon=True)
+        self.stats_refresh_thread.start()
+    
+    def init_properties_fts(self):
+        """Add the full-text index used by property search to the documentation database"""
+        if not self.docs_db_path or not Path(self.docs_db_path).exists():
+            return
+            
+        try:
+            with sqlite3.connect(self.docs_db_path) as conn:
+                cursor = conn.cursor()
+                cursor.execute("SELECT name FROM sqlite_master WHERE type='table' AND name='properties'")
+                if not cursor.fetchone():
+                    return
+                
+                if create_properties_fts(cursor):
+                    print(f"Initialized property search index: {self.docs_db_path}")
+                conn.commit()
+                
+        except Exception as e:
+            print(f"Warning: Could not initialize property search index: {e}")
+    
+    def init_recall_db(self):
+        """Add the full-text index used by activity search to the OpenRecall database"""
+        if not self.recall_db_path or not Path(self.recall_db_path).exists():
+            return
+            
+        try:
+            with sqlite3.connect(self.recall_db_path) as conn:
+                cursor = conn.cursor()
+                
+                cursor.execute("SELECT name FROM sqlite_master WHERE type='table' AND name='entries_fts'")
+                if cursor.fetchone():
+                    return
+                
+                # External-content FTS5 table mirroring entries(app, title)
+                cursor.execute("""
+                    CREATE VIRTUAL TABLE entries_fts USING fts5(
+                        app, title,
+                        content='entries', content_rowid='id',
+                        tokenize='unicode61 remove_diacritics 2'
+                    )
+                """)
+                
+                # Keep the index in sync with writes made by the recorder
+                cursor.execute("""
+                    CREATE TRIGGER IF NOT EXISTS entries_fts_ai AFTER INSERT ON entries BEGIN
+                        INSERT INTO entries_fts (rowid, app, title) VALUES (new.id, new.app, new.title);
+                    END
+                """)
+                cursor.execute("""
+                    CREATE TRIGGER IF NOT EXISTS entries_fts_ad AFTER DELETE ON entries BEGIN
+                        INSERT INTO entries_fts (entries_fts, rowid, app, title)
+                        VALUES ('delete', old.id, old.app, old.title);
+                    END
+                """)
+                cursor.execute("""
+                    CREATE TRIGGER IF NOT EXISTS entries_fts_au AFTER UPDATE OF app, title ON entries BEGIN
+                        INSERT INTO entries_fts (entries_fts, rowid, app, title)
+                        VALUES ('delete', old.id, old.app, old.title);
+                        INSERT INTO entries_fts (rowid, app, title) VALUES (new.id, new.app, new.title);
+                    END
+                """)
+                
+                # Index the rows recorded before the table existed
+                cursor.execute("INSERT INTO entries_fts (entries_fts) VALUES ('rebuild')")
+                conn.commit()
+                print(f"Initialized activity search index: {self.recall_db_path}")
+                
+        except Exception as e:
+            print(f"Warning: Could not initialize activity search index: {e}")
+    
+    def init_activity_rollup(self):
+        """Create the per-day activity totals read by /api/activities and keep them in sync with entries"""
+        if not self.recall_db_path or not Path(self.recall_db_path).exists():
+            return
+            
+        try:
+            with sqlite3.connect(self.recall_db_path) as conn:
+                cursor = conn.cursor()
+                
+                cursor.execute("SELECT name FROM sqlite_master WHERE type='table' AND name='activity_rollup'")
+                if cursor.fetchone():
+                    return
+                
+                # One transaction, so no recorder insert lands between the backfill and the triggers
+                cursor.execute("BEGIN IMMEDIATE")
+                cursor.execute("""
+                    CREATE TABLE activity_rollup (
+                        app TEXT NOT NULL,
+                        title TEXT NOT NULL,
+                        day TEXT NOT NULL,
+                        count INTEGER NOT NULL,
+                        first_ts INTEGER NOT NULL,
+                        last_ts INTEGER NOT NULL,
+                        PRIMARY KEY (app, title, day)
+                    )
+                """)
+                cursor.execute("CREATE INDEX idx_activity_rollup_day ON activity_rollup(day)")
+                cursor.execute("""
+                    INSERT INTO activity_rollup (app, title, day, count, first_ts, last_ts)
+                    SELECT COALESCE(app, ''), COALESCE(title, ''), date(timestamp, 'unixepoch', 'localtime'),
+                           COUNT(*), MIN(timestamp), MAX(timestamp)
+                    FROM entries
+                    GROUP BY 1, 2, 3
+                """)
+                
+                cursor.execute("""
+                    CREATE TRIGGER activity_rollup_ai AFTER INSERT ON entries BEGIN
+                        INSERT INTO activity_rollup (app, title, day, count, first_ts, last_ts)
+                        VALUES (COALESCE(new.app, ''), COALESCE(new.title, ''),
+                                date(new.timestamp, 'unixepoch', 'localtime'), 1, new.timestamp, new.timestamp)
+                        ON CONFLICT (app, title, day) DO UPDATE SET
+                            count = count + 1,
+                            first_ts = MIN(first_ts, excluded.first_ts),
+                            last_ts = MAX(last_ts, excluded.last_ts);
+                    END
+                """)
+                cursor.execute(f"""
+                    CREATE TRIGGER activity_rollup_ad AFTER DELETE ON entries BEGIN
+                        {ACTIVITY_ROLLUP_RECOUNT.format(row='old')}
+                    END
+                """)
+                cursor.execute(f"""
+                    CREATE TRIGGER activity_rollup_au AFTER UPDATE OF app, title, timestamp ON entries BEGIN
+                        {ACTIVITY_ROLLUP_RECOUNT.format(row='old')}
+                        {ACTIVITY_ROLLUP_RECOUNT.format(row='new')}
+                    END
+                """)
+                conn.commit()
+                print(f"Initialized activity rollup: {self.recall_db_path}")
+                
+        except Exception as e:
+            print(f"Warning: Could not initialize activity rollup: {e}")
+    
+    def check_query_plans(self):
+        """Refresh planner statistics and warn about tracked queries that fall back to full table scans"""
+        databases = {'recall': self.recall_db_path, 'docs': self.docs_db_path}
+        for name, db_path in databases.items():
+            if not db_path or not Path(db_path).exists():
+                continue
+            try:
+                with sqlite3.connect(db_path) as conn:
+                    cursor = conn.cursor()
+                    
+                    for label, database, sql, suggestion in TRACKED_QUERIES:
+                        if database != name:
+                            continue
+                        try:
+                            cursor.execute("EXPLAIN QUERY PLAN " + sql, (None,) * sql.count('?'))
+                        except sqlite3.OperationalError as e:
+                            print(f"Warning: Could not plan {label} query: {e}")
+                            continue
+                        for row in cursor.fetchall():
+                            detail = row[3]
+                            # Scans of materialized subqueries (window functions) read rows already filtered
+                            if (detail.startswith('SCAN') and 'USING' not in detail and '(subquery' not in detail
+                                    and 'VIRTUAL TABLE' not in detail and 'CONSTANT ROW' not in detail):
+                                print(f"Warning: {label} query does a full scan ({detail}); suggested fix: {suggestion}")
+                    
+                    # Full ANALYZE once; afterwards let SQLite decide whether the stats are stale,
+                    # except for tables that just gained an index. Runs after the plan check so
+                    # tiny tables don't mask a missing index.
+                    cursor.execute("SELECT name FROM sqlite_master WHERE type='table' AND name='sqlite_stat1'")
+                    if cursor.fetchone():
+                        for table in sorted(self.pending_analyze.pop(db_path, ())):
+                            cursor.execute(f"ANALYZE {table}")
+                        cursor.execute("PRAGMA optimize")
+                    else:
+                        cursor.execute("ANALYZE")
+                    conn.commit()
+                    
+            except Exception as e:
+                print(f"Warning: Could not check query plans for {db_path}: {e}")
+    
+    def get_conn(self, db_path):
+        """Borrow a pooled connection to db_path for a `with` block"""
+        with self.db_pools_lock:
+            pool = self.db_pools.get(db_path)
+            if pool is None:
+                # One connection per server thread, so no request waits for another to finish reading
+                size = max(DB_POOL_SIZE, self.config.getint('server', 'threads', fallback=8))
+                pool = self.db_pools[db_path] = DBPool(db_path, size)
+        return pool.connection()
+    
+    def close(self):
+        """Stop the stats_cache refresh thread and close every pool"""
+        self.stats_refresh_stop.set()
+        if self.stats_refresh_thread:
+            self.stats_refresh_thread.join()
+            self.stats_refresh_thread = None
+        self.close_pools()
+    
+    def close_pools(self):
+        """Close the idle connections of every pool"""
+        with self.db_pools_lock:
+            for pool in self.db_pools.values():
+                pool.close()
+    
+    def retire_pools(self):
+        """Close and forget the pools of databases that are no longer configured"""
+        with self.db_pools_lock:
+            for db_path in list(self.db_pools):
+                if db_path not in (self.recall_db_path, self.docs_db_path):
+                    self.db_pools.pop(db_path).close()
+    
+    def db_signatures(self, db_paths):
+        """(path, db_signature) of each configured database in db_paths"""
+        return tuple((path, self.db_signature(path) if path else None) for path in db_paths)
+    
+    def cache_get(self, key):
+        """Value stored under key in the response cache, or None once it has expired"""
+        now = time.monotonic()
+        with self.response_cache_lock:
+            entry = self.response_cache.get(key)
+            if entry and entry[0] > now:
+                self.response_cache.move_to_end(key)
+                return entry[1]
+        return None
+    
+    def cache_put(self, key, value, ttl):
+        """Store value under key in the response cache for ttl seconds, evicting the least recently used"""
+        with self.response_cache_lock:
+            self.response_cache[key] = (time.monotonic() + ttl, value)
+            self.response_cache.move_to_end(key)
+            while len(self.response_cache) > RESPONSE_CACHE_SIZE:
+                self.response_cache.popitem(last=False)
+    
+    def clear_response_cache(self):
+        """Drop every cached response, e.g. after the configured databases change"""
+        with self.response_cache_lock:
+            self.response_cache.clear()
+    
+    def cached_response(self, db_paths, ttl=RESPONSE_CACHE_TTL):
+        """Serve repeated GETs of a JSON route from memory until ttl passes or a database in db_paths() changes"""
+        def decorator(view):
+            @functools.wraps(view)
+            def wrapper(*args, **kwargs):
+                key = (request.full_path, self.db_signatures(db_paths()))
+                cached = self.cache_get(key)
+                if cached:
+                    body, max_age = cached
+                    response = Response(body, mimetype='application/json')
+                    response.cache_control.private = True
+                    response.cache_control.max_age = max_age
+                    response.add_etag()
+                    return response.make_conditional(request)
+                
+                response = self.app.make_response(view(*args, **kwargs))
+                if response.status_code == 200 and not response.is_streamed and response.mimetype == 'application/json':
+                    max_age = response.cache_control.max_age or ttl
+                    response.cache_control.private = True
+                    response.cache_control.max_age = max_age
+                    self.cache_put(key, (response.get_data(), max_age), ttl)
+                return response
+            return wrapper
+        return decorator
+    
     def create_documentation_schema(self, cursor):
-        """Create the property-based documentation schema"""
+        """Create the property-based documentation schema in one transaction; the caller commits"""
         # Enable foreign keys
         cursor.execute("PRAGMA foreign_keys = ON")
         
+        # Journal settings can't change inside a transaction, so set them first
+        cursor.execute("PRAGMA journal_mode=WAL")
+        cursor.execute("PRAGMA synchronous=NORMAL")
+        cursor.execute("BEGIN IMMEDIATE")
+        
         # Create PROJECTS table
         cursor.execute("""
             CREATE TABLE IF NOT EXISTS projects (
@@ -1678,6 +1167,7 @@ class DatabaseViewer:
         """)
         cursor.execute("CREATE INDEX IF NOT EXISTS idx_properties_key_parent ON properties(key, parent_id, status)")
         cursor.execute("CREATE INDEX IF NOT EXISTS idx_properties_parent ON properties(parent_id)")
+        cursor.execute("CREATE INDEX IF NOT EXISTS idx_properties_status_updated ON properties(status, updated_at DESC)")
         
         # Create PROPERTY_TAGS junction table
         cursor.execute("""
@@ -1734,11 +1224,10 @@ class DatabaseViewer:
                 ('Configuration', 'config'),
                 ('Notes', 'notes')
             ]
-            for name, slug in default_tags:
-                cursor.execute("""
-                    INSERT OR IGNORE INTO tags (name, slug, project_id) 
-                    VALUES (?, ?, ?)
-                """, (name, slug, project_id))
+            cursor.executemany("""
+                INSERT OR IGNORE INTO tags (name, slug, project_id) 
+                VALUES (?, ?, ?)
+            """, [(name, slug, project_id) for name, slug in default_tags])
         
         # Create sample property to test the system
         cursor.execute("""
@@ -1746,116 +1235,335 @@ class DatabaseViewer:
             VALUES ('welcome-message', 'Welcome to the new property-based documentation system!', 'text')
         """)
     
+    def render_shell(self):
+        """Render the page shell once and keep it, with its ETag, in memory for / to send"""
+        # A changed asset gets a new URL, so the old one can be cached as immutable
+        self.asset_names = {}
+        for name in STATIC_ASSETS:
+            digest = hashlib.sha1((Path(self.app.static_folder) / name).read_bytes()).hexdigest()[:10]
+            stem, ext = name.rsplit('.', 1)
+            self.asset_names[f"{stem}.{digest}.{ext}"] = name
+        
+        with self.app.test_request_context():
+            asset_urls = {name: url_for('get_asset', hashed_name=hashed_name)
+                          for hashed_name, name in self.asset_names.items()}
+            html = render_template_string(
+                HTML_TEMPLATE,
+                asset_urls=asset_urls,
+                auto_refresh_seconds=self.config.getint('interface', 'auto_refresh_seconds', fallback=30)
+            ).encode('utf-8')
+        
+        self.shell_html = html
+        self.shell_etag = hashlib.sha1(html).hexdigest()
+    
+    @staticmethod
+    def db_signature(db_path):
+        """Size and modification time of a database and its WAL; changes whenever either is written"""
+        signature = []
+        for path in (db_path, f"{db_path}-wal"):
+            try:
+                stat = os.stat(path)
+                signature.append((stat.st_mtime_ns, stat.st_size))
+            except OSError:
+                signature.append(None)
+        return tuple(signature)
+    
+    @staticmethod
+    @functools.lru_cache(maxsize=32)
+    def path_exists(path, time_bucket):
+        """Path(path).exists(), memoized per time_bucket"""
+        return Path(path).exists()
+    
+    def db_exists(self, db_path):
+        """Whether db_path is configured and exists, re-checked on disk at most every DB_EXISTS_TTL seconds"""
+        return bool(db_path) and self.path_exists(db_path, int(time.monotonic() // DB_EXISTS_TTL))
+    
+    def db_tables(self, conn, db_path):
+        """Table names of db_path, re-read from sqlite_master through conn only after the file changes"""
+        signature = self.db_signature(db_path)
+        cached = self.schema_cache.get(db_path)
+        if cached and cached[0] == signature:
+            return cached[1]
+        
+        tables = tuple(row[0] for row in conn.execute("SELECT name FROM sqlite_master WHERE type='table'"))
+        self.schema_cache[db_path] = (signature, tables)
+        return tables
+    
+    def conditional_json(self, payload, max_age=None):
+        """Serialize payload with an ETag and answer If-None-Match revalidations with 304"""
+        response = jsonify(payload)
+        response.add_etag()
+        if max_age is not None:
+            # Browser-private data that may be reused without asking for max_age seconds
+            response.cache_control.private = True
+            response.cache_control.max_age = max_age
+        return response.make_conditional(request)
+    
+    def stream_json_list(self, db_path, sql, params, key, build_item, extra):
+        """Stream {key: [...], **extra} with one list item serialized per query row"""
+        def generate():
+            with self.get_conn(db_path) as conn:
+                dumps = self.app.json.dumps
+                yield '{' + dumps(key) + ':['
+                for i, row in enumerate(conn.execute(sql, params)):
+                    yield (',' if i else '') + dumps(build_item(row))
+                yield ']' + (',' + dumps(extra)[1:] if extra else '}')
+        return Response(stream_with_context(generate()), mimetype='application/json')
+    
+    def activity_window(self, conn, time_range):
+        """Page query for time_range and its window parameters; None when there are no entries"""
+        cursor = conn.cursor()
+        
+        # Get time filter
+        cursor.execute("SELECT MAX(timestamp) FROM entries")
+        max_ts_result = cursor.fetchone()
+        if not max_ts_result or not max_ts_result[0]:
+            return None
+        
+        max_ts = max_ts_result[0]
+        
+        if time_range == 'today':
+            start_ts = int(datetime.fromtimestamp(max_ts).replace(hour=0, minute=0, second=0).timestamp())
+        elif time_range == 'yesterday':
+            yesterday = datetime.fromtimestamp(max_ts).replace(hour=0, minute=0, second=0) - timedelta(days=1)
+            start_ts = int(yesterday.timestamp())
+        elif time_range == 'week':
+            start_ts = max_ts - (7 * 86400)
+        elif time_range == 'month':
+            start_ts = max_ts - (30 * 86400)
+        else:
+            cursor.execute("SELECT MIN(timestamp) FROM entries")
+            min_ts_result = cursor.fetchone()
+            start_ts = min_ts_result[0] if min_ts_result and min_ts_result[0] else max_ts
+        
+        if 'activity_rollup' in self.db_tables(conn, self.recall_db_path):
+            # First local midnight at or after start_ts; earlier entries are aggregated directly
+            window_start = datetime.fromtimestamp(start_ts)
+            rollup_start = window_start.replace(hour=0, minute=0, second=0, microsecond=0)
+            if rollup_start < window_start:
+                rollup_start += timedelta(days=1)
+            window_params = (rollup_start.date().isoformat(), start_ts, int(rollup_start.timestamp()))
+            return ACTIVITIES_ROLLUP_SQL, window_params
+        return ACTIVITIES_SQL, (start_ts,)
+    
+    @staticmethod
+    def activity_item(row):
+        """JSON shape of one activities row"""
+        app, title, count, first_seen, last_seen, duration_minutes, _total = row
+        return {'app': app, 'title': title, 'count': count, 'first_seen': first_seen,
+                'last_seen': last_seen, 'duration_minutes': duration_minutes}
+    
+    @staticmethod
+    def activity_total(conn, activities_sql, window_params, rows=None):
+        """Number of activity groups in the window, read from the total_rows column of a page"""
+        if not rows:
+            # Past the last page the page query returns nothing, so ask for the first row instead
+            rows = conn.execute(activities_sql, window_params + (1, 0)).fetchall()
+        return rows[0][-1] if rows else 0
+    
+    def activities_page(self, time_range, page, size):
+        """Group the recall entries in time_range into one page of activities"""
+        with self.get_conn(self.recall_db_path) as conn:
+            window = self.activity_window(conn, time_range)
+            if window is None:
+                return {'activities': [], 'total': 0, 'page': page, 'total_pages': 0}
+            activities_sql, window_params = window
+            cursor = conn.cursor()
+            
+            # Get activities with pagination; every row also carries the total count
+            offset = (page - 1) * size
+            cursor.execute(activities_sql, window_params + (size, offset))
+            rows = cursor.fetchall()
+            # Tuple rows unpacked into dict displays; measurably cheaper than sqlite3.Row or dict(zip())
+            activities = [
+                {'app': app, 'title': title, 'count': count, 'first_seen': first_seen,
+                 'last_seen': last_seen, 'duration_minutes': duration_minutes}
+                for app, title, count, first_seen, last_seen, duration_minutes, _total in rows
+            ]
+            total = self.activity_total(conn, activities_sql, window_params, rows)
+            
+            return {
+                'activities': activities,
+                'total': total,
+                'page': page,
+                'total_pages': (total + size - 1) // size
+            }
+    
+    def database_stats(self):
+        """Collect the counters shown on the statistics tab for both databases"""
+        stats = {}
+        
+        # OpenRecall stats
+        if self.db_exists(self.recall_db_path):
+            with self.get_conn(self.recall_db_path) as conn:
+                cursor = conn.cursor()
+                
+                cursor.execute(RECALL_STATS_SQL)
+                stats['total_entries'], stats['unique_apps'], min_ts, max_ts = cursor.fetchone()
+                if min_ts and max_ts:
+                    stats['days_of_data'] = round((max_ts - min_ts) / 86400, 1)
+                else:
+                    stats['days_of_data'] = 0
+        
+        # Documentation stats
+        if self.db_exists(self.docs_db_path):
+            with self.get_conn(self.docs_db_path) as conn:
+                cursor = conn.cursor()
+                
+                # One read snapshot for the cached counters, the recounts and the per-type totals
+                cursor.execute("BEGIN")
+                try:
+                    cursor.execute("SELECT key, value FROM stats_cache")
+                    counts = dict(cursor)
+                except sqlite3.OperationalError:
+                    counts = {}
+                # Recount whatever the cache lacks in a single statement
+                missing = [key for key in STATS_CACHE_COUNTS if key not in counts]
+                if missing:
+                    cursor.execute("SELECT " + ", ".join(f"({STATS_CACHE_COUNTS[key]})" for key in missing))
+                    counts.update(zip(missing, cursor.fetchone()))
+                
+                # Properties stats
+                stats['total_properties'] = counts['properties_active']
+                
+                try:
+                    cursor.execute("SELECT type, cnt FROM property_type_counts WHERE cnt > 0")
+                except sqlite3.OperationalError:
+                    cursor.execute(PROPERTY_TYPE_COUNTS_SQL)
+                stats['properties_by_type'] = {row[0]: row[1] for row in cursor}
+                
+                # Other stats
+                stats['total_tags'] = counts['tags']
+                stats['active_projects'] = counts['projects_active']
+                stats['total_versions'] = counts['versions']
+                
+                indexed_properties = counts['search_index']
+                stats['indexed_properties'] = indexed_properties
+                
+                total_props = stats.get('total_properties', 0)
+                stats['index_coverage'] = round(indexed_properties / max(total_props, 1) * 100, 1)
+                
+                # Database size
+                stats['size_mb'] = round(os.path.getsize(self.docs_db_path) / BYTES_PER_MB, 2)
+        
+        return stats
+    
+    def cached_database_stats(self, force=False):
+        """database_stats(), reused for half the auto-refresh interval while neither database changes"""
+        return self.stats_snapshot_for(force)[0]
+    
+    def stats_snapshot_for(self, force=False):
+        """Current (stats, body, etag) statistics snapshot from the response cache, recomputed when stale"""
+        db_paths = (self.recall_db_path, self.docs_db_path)
+        snapshot = None if force else self.cache_get(('database-stats', self.db_signatures(db_paths)))
+        if snapshot is None:
+            stats = self.database_stats()
+            body = self.app.json.dumps(stats).encode()
+            snapshot = (stats, body, hashlib.blake2b(body, digest_size=8).hexdigest())
+            # Signed after counting: opening the first pooled connection may create the -wal file
+            ttl = self.config.getint('interface', 'auto_refresh_seconds', fallback=30) / 2
+            self.cache_put(('database-stats', self.db_signatures(db_paths)), snapshot, ttl)
+        return snapshot
+    
     def setup_routes(self):
         @self.app.route('/')
         def home():
-            return render_template_string(HTML_TEMPLATE)
+            # The shell's URL never changes, so browsers revalidate it and get a 304 until it is re-rendered
+            response = make_response(self.shell_html)
+            response.set_etag(self.shell_etag)
+            response.cache_control.no_cache = True
+            return response.make_conditional(request)
+        
+        @self.app.route('/assets/<hashed_name>')
+        def get_asset(hashed_name):
+            name = self.asset_names.get(hashed_name)
+            if not name:
+                abort(404)
+            response = send_from_directory(self.app.static_folder, name, max_age=ASSET_MAX_AGE)
+            response.cache_control.public = True
+            response.cache_control.immutable = True
+            return response
+        
+        @self.app.route('/tabs/<name>')
+        def get_tab(name):
+            if name not in TAB_NAMES:
+                abort(404)
+            response = make_response(render_template(f'tabs/{name}.html'))
+            response.add_etag()
+            return response.make_conditional(request)
         
         # Activity-related routes (OpenRecall database)
         @self.app.route('/api/activities')
+        @self.cached_response(lambda: (self.recall_db_path,))
         def get_activities():
             time_range = request.args.get('time_range', 'week')
             page = int(request.args.get('page', 1))
             size = int(request.args.get('size', 20))
             
             try:
-                with sqlite3.connect(self.recall_db_path) as conn:
-                    cursor = conn.cursor()
-                    
-                    # Get time filter
-                    cursor.execute("SELECT MAX(timestamp) FROM entries")
-                    max_ts_result = cursor.fetchone()
-                    if not max_ts_result or not max_ts_result[0]:
-                        return jsonify({'activities': [], 'total': 0, 'page': page, 'total_pages': 0})
-                    
-                    max_ts = max_ts_result[0]
-                    
-                    if time_range == 'today':
-                        start_ts = int(datetime.fromtimestamp(max_ts).replace(hour=0, minute=0, second=0).timestamp())
-                    elif time_range == 'yesterday':
-                        yesterday = datetime.fromtimestamp(max_ts).replace(hour=0, minute=0, second=0) - timedelta(days=1)
-                        start_ts = int(yesterday.timestamp())
-                    elif time_range == 'week':
-                        start_ts = max_ts - (7 * 86400)
-                    elif time_range == 'month':
-                        start_ts = max_ts - (30 * 86400)
-                    else:
-                        cursor.execute("SELECT MIN(timestamp) FROM entries")
-                        min_ts_result = cursor.fetchone()
-                        start_ts = min_ts_result[0] if min_ts_result and min_ts_result[0] else max_ts
-                    
-                    # Get activities with pagination
-                    offset = (page - 1) * size
-                    cursor.execute("""
-                        SELECT app, title, COUNT(*) as count,
-                               MIN(timestamp) as first_seen,
-                               MAX(timestamp) as last_seen
-                        FROM entries
-                        WHERE timestamp >= ?
-                        GROUP BY app, title
-                        ORDER BY count DESC
-                        LIMIT ? OFFSET ?
-                    """, (start_ts, size, offset))
-                    
-                    activities = []
-                    for row in cursor.fetchall():
-                        app, title, count, first_ts, last_ts = row
-                        activities.append({
-                            'app': app,
-                            'title': title,
-                            'count': count,
-                            'first_seen': datetime.fromtimestamp(first_ts).isoformat(),
-                            'last_seen': datetime.fromtimestamp(last_ts).isoformat(),
-                            'duration_minutes': round((last_ts - first_ts) / 60, 1)
-                        })
-                    
-                    # Get total count for pagination
-                    cursor.execute("""
-                        SELECT COUNT(DISTINCT app || title)
-                        FROM entries
-                        WHERE timestamp >= ?
-                    """, (start_ts,))
-                    total = cursor.fetchone()[0]
-                    
-                    return jsonify({
-                        'activities': activities,
-                        'total': total,
-                        'page': page,
-                        'total_pages': (total + size - 1) // size
-                    })
+                if size > STREAM_PAGE_SIZE:
+                    with self.get_conn(self.recall_db_path) as conn:
+                        window = self.activity_window(conn, time_range)
+                        if window is None:
+                            return jsonify({'activities': [], 'total': 0, 'page': page, 'total_pages': 0})
+                        activities_sql, window_params = window
+                        total = self.activity_total(conn, activities_sql, window_params)
+                    summary = {'total': total, 'page': page, 'total_pages': (total + size - 1) // size}
+                    return self.stream_json_list(self.recall_db_path, activities_sql,
+                                                 window_params + (size, (page - 1) * size),
+                                                 'activities', self.activity_item, summary)
+                
+                return self.conditional_json(self.activities_page(time_range, page, size))
                     
             except Exception as e:
                 return jsonify({'error': str(e)}), 500
         
+        # Auto-refresh asks for the activity page and the statistics in one round trip
+        @self.app.route('/api/activities-with-stats')
+        def get_activities_with_stats():
+            time_range = request.args.get('time_range', 'week')
+            page = int(request.args.get('page', 1))
+            size = int(request.args.get('size', 20))
+            
+            try:
+                return self.conditional_json({
+                    'activities': self.activities_page(time_range, page, size),
+                    'stats': self.cached_database_stats()
+                })
+                
+            except Exception as e:
+                return jsonify({'error': str(e)}), 500
+        
         @self.app.route('/api/search-activities')
         def search_activities():
             query = request.args.get('q', '')
             
             try:
-                with sqlite3.connect(self.recall_db_path) as conn:
+                with self.get_conn(self.recall_db_path) as conn:
                     cursor = conn.cursor()
                     
-                    cursor.execute("""
-                        SELECT app, title, COUNT(*) as count,
-                               MIN(timestamp) as first_seen,
-                               MAX(timestamp) as last_seen
-                        FROM entries
-                        WHERE title LIKE ? OR app LIKE ?
-                        GROUP BY app, title
-                        ORDER BY count DESC
-                        LIMIT 20
-                    """, (f'%{query}%', f'%{query}%'))
+                    has_fts = 'entries_fts' in self.db_tables(conn, self.recall_db_path)
+                    match = fts_query(query)
                     
-                    results = []
-                    for row in cursor.fetchall():
-                        app, title, count, first_ts, last_ts = row
-                        results.append({
-                            'app': app,
-                            'title': title,
-                            'count': count,
-                            'first_seen': datetime.fromtimestamp(first_ts).isoformat(),
-                            'last_seen': datetime.fromtimestamp(last_ts).isoformat()
-                        })
+                    if has_fts and match:
+                        cursor.execute(SEARCH_ACTIVITIES_FTS_SQL, (match,))
+                    else:
+                        # No index (read-only or foreign database) or nothing to match on
+                        cursor.execute("""
+                            SELECT app, title, COUNT(*) as count,
+                                   MIN(timestamp) as first_seen,
+                                   MAX(timestamp) as last_seen
+                            FROM entries
+                            WHERE title LIKE ? OR app LIKE ?
+                            GROUP BY app, title
+                            ORDER BY count DESC
+                            LIMIT 20
+                        """, (f'%{query}%', f'%{query}%'))
+                    
+                    results = [
+                        {'app': app, 'title': title, 'count': count, 'first_seen': first_seen, 'last_seen': last_seen}
+                        for app, title, count, first_seen, last_seen in cursor
+                    ]
                     
                     return jsonify({'results': results})
                     
@@ -1871,7 +1579,7 @@ class DatabaseViewer:
                 type_filter = request.args.get('type')
                 tag_filter = request.args.get('tag')
                 
-                if not self.docs_db_path or not Path(self.docs_db_path).exists():
+                if not self.db_exists(self.docs_db_path):
                     return jsonify({
                         'properties': [],
                         'total': 0,
@@ -1880,12 +1588,11 @@ class DatabaseViewer:
                         'error': 'Documentation database not found'
                     })
                 
-                with sqlite3.connect(self.docs_db_path) as conn:
+                with self.get_conn(self.docs_db_path) as conn:
                     cursor = conn.cursor()
                     
                     # Check if properties table exists
-                    cursor.execute("SELECT name FROM sqlite_master WHERE type='table' AND name='properties'")
-                    if not cursor.fetchone():
+                    if 'properties' not in self.db_tables(conn, self.docs_db_path):
                         return jsonify({
                             'properties': [],
                             'total': 0,
@@ -1894,82 +1601,61 @@ class DatabaseViewer:
                             'error': 'Properties table not found. Please run the DocumentationMCP server first to initialize the database.'
                         })
                     
-                    # Build query - simple approach without GROUP_CONCAT to avoid SQL errors
-                    sql = """
-                        SELECT DISTINCT p.id, p.key, p.value, p.type, p.updated_at, si.computed_path
+                    # Tags come back as one JSON array per row, so the page is a single query
+                    count_sql = """
+                        SELECT COUNT(*)
                         FROM properties p
-                        LEFT JOIN search_index si ON p.id = si.property_id
-                        LEFT JOIN property_tags pt ON p.id = pt.property_id
-                        LEFT JOIN tags t ON pt.tag_id = t.id
                         WHERE p.status = 'active'
                     """
+                    filters = ""
                     params = []
                     
                     if type_filter:
-                        sql += " AND p.type = ?"
+                        filters += " AND p.type = ?"
                         params.append(type_filter)
                     
                     if tag_filter:
-                        sql += " AND t.slug = ?"
+                        filters += """ AND EXISTS (
+                            SELECT 1 FROM property_tags pt
+                            JOIN tags t ON pt.tag_id = t.id
+                            WHERE pt.property_id = p.id AND t.slug = ?
+                        )"""
                         params.append(tag_filter)
                     
-                    sql += " ORDER BY p.updated_at DESC"
-                    
                     # Get total count
-                    count_sql = """
-                        SELECT COUNT(DISTINCT p.id)
-                        FROM properties p
-                        LEFT JOIN property_tags pt ON p.id = pt.property_id
-                        LEFT JOIN tags t ON pt.tag_id = t.id
-                        WHERE p.status = 'active'
-                    """
-                    count_params = []
-                    if type_filter:
-                        count_sql += " AND p.type = ?"
-                        count_params.append(type_filter)
-                    if tag_filter:
-                        count_sql += " AND t.slug = ?"
-                        count_params.append(tag_filter)
-                    
-                    cursor.execute(count_sql, count_params)
+                    cursor.execute(count_sql + filters, params)
                     total = cursor.fetchone()[0]
                     
                     # Apply pagination
                     offset = (page - 1) * size
-                    sql += f" LIMIT ? OFFSET ?"
-                    params.extend([size, offset])
-                    
-                    cursor.execute(sql, params)
+                    page_sql = PROPERTIES_PAGE_SQL + filters + " ORDER BY p.updated_at DESC LIMIT ? OFFSET ?"
+                    page_params = params + [size, offset]
+                    summary = {
+                        'total': total,
+                        'page': page,
+                        'total_pages': (total + size - 1) // size
+                    }
                     
-                    properties = []
-                    for row in cursor.fetchall():
-                        prop_id, key, value, prop_type, updated_at, path = row
-                        
-                        # Get tags separately to avoid GROUP_CONCAT issues
-                        cursor.execute("""
-                            SELECT t.name FROM tags t
-                            JOIN property_tags pt ON t.id = pt.tag_id
-                            WHERE pt.property_id = ?
-                        """, (prop_id,))
-                        tag_rows = cursor.fetchall()
-                        tags = [str(tag_row[0]) for tag_row in tag_rows] if tag_rows else []
-                        
-                        properties.append({
+                    def to_property(row):
+                        prop_id, key, value, prop_type, updated_at, path, tags = row
+                        return {
                             'id': prop_id,
                             'key': key,
-                            'value': value[:200] if value else None,
+                            'value': value or None,
                             'type': prop_type,
                             'path': path,
-                            'tags': tags,
+                            'tags': self.app.json.loads(tags),
                             'updated_at': updated_at
-                        })
+                        }
                     
-                    return jsonify({
-                        'properties': properties,
-                        'total': total,
-                        'page': page,
-                        'total_pages': (total + size - 1) // size
-                    })
+                    if size > STREAM_PAGE_SIZE:
+                        return self.stream_json_list(self.docs_db_path, page_sql, page_params,
+                                                     'properties', to_property, summary)
+                    
+                    cursor.execute(page_sql, page_params)
+                    properties = [to_property(row) for row in cursor]
+                    
+                    return self.conditional_json({'properties': properties, **summary})
                     
             except Exception as e:
                 return jsonify({'error': str(e)}), 500
@@ -1977,30 +1663,16 @@ class DatabaseViewer:
         @self.app.route('/api/properties/<property_id>')
         def get_property(property_id):
             try:
-                with sqlite3.connect(self.docs_db_path) as conn:
+                with self.get_conn(self.docs_db_path) as conn:
                     cursor = conn.cursor()
                     
-                    cursor.execute("""
-                        SELECT p.id, p.key, p.value, p.type, p.created_at, p.updated_at, si.computed_path
-                        FROM properties p
-                        LEFT JOIN search_index si ON p.id = si.property_id
-                        WHERE p.id = ? AND p.status = 'active'
-                    """, (property_id,))
+                    cursor.execute(PROPERTY_DETAIL_SQL, (property_id,))
                     
                     row = cursor.fetchone()
                     if not row:
                         return jsonify({'error': 'Property not found'}), 404
                     
-                    prop_id, key, value, prop_type, created_at, updated_at, path = row
-                    
-                    # Get tags separately
-                    cursor.execute("""
-                        SELECT t.name FROM tags t
-                        JOIN property_tags pt ON t.id = pt.tag_id
-                        WHERE pt.property_id = ?
-                    """, (prop_id,))
-                    tag_rows = cursor.fetchall()
-                    tags = [str(tag_row[0]) for tag_row in tag_rows] if tag_rows else []
+                    prop_id, key, value, prop_type, created_at, updated_at, path, tags = row
                     
                     return jsonify({
                         'id': prop_id,
@@ -2008,7 +1680,7 @@ class DatabaseViewer:
                         'value': value,
                         'type': prop_type,
                         'path': path,
-                        'tags': tags,
+                        'tags': self.app.json.loads(tags),
                         'created_at': created_at,
                         'updated_at': updated_at
                     })
@@ -2016,47 +1688,36 @@ class DatabaseViewer:
             except Exception as e:
                 return jsonify({'error': str(e)}), 500
         
+        # Repeated searches are answered from memory; the key includes the database file
+        # signature, so writes from the MCP server (another process) invalidate it too
         @self.app.route('/api/search-properties')
+        @self.cached_response(lambda: (self.docs_db_path,))
         def search_properties():
             query = request.args.get('q', '')
             
             try:
-                with sqlite3.connect(self.docs_db_path) as conn:
+                with self.get_conn(self.docs_db_path) as conn:
                     cursor = conn.cursor()
                     
-                    cursor.execute("""
-                        SELECT DISTINCT p.id, p.key, p.value, p.type, si.computed_path
-                        FROM properties p
-                        LEFT JOIN search_index si ON p.id = si.property_id
-                        WHERE p.status = 'active'
-                        AND (p.key LIKE ? OR p.value LIKE ? OR si.search_vector LIKE ?)
-                        ORDER BY p.updated_at DESC
-                        LIMIT 50
-                    """, (f'%{query}%', f'%{query}%', f'%{query}%'))
+                    match = fts_query(query)
+                    if match and 'properties_fts' in self.db_tables(conn, self.docs_db_path):
+                        cursor.execute(SEARCH_PROPERTIES_FTS_SQL, (match,))
+                    else:
+                        cursor.execute(SEARCH_PROPERTIES_SQL, (f'%{query}%', f'%{query}%', f'%{query}%'))
                     
-                    properties = []
-                    for row in cursor.fetchall():
-                        prop_id, key, value, prop_type, path = row
-                        
-                        # Get tags separately
-                        cursor.execute("""
-                            SELECT t.name FROM tags t
-                            JOIN property_tags pt ON t.id = pt.tag_id
-                            WHERE pt.property_id = ?
-                        """, (prop_id,))
-                        tag_rows = cursor.fetchall()
-                        tags = [str(tag_row[0]) for tag_row in tag_rows] if tag_rows else []
-                        
-                        properties.append({
+                    properties = [
+                        {
                             'id': prop_id,
                             'key': key,
-                            'value': value[:200] if value else None,
+                            'value': value or None,
                             'type': prop_type,
                             'path': path,
-                            'tags': tags
-                        })
+                            'tags': self.app.json.loads(tags)
+                        }
+                        for prop_id, key, value, prop_type, path, tags in cursor
+                    ]
                     
-                    return jsonify({
+                    return self.conditional_json({
                         'query': query,
                         'total_results': len(properties),
                         'properties': properties
@@ -2068,51 +1729,32 @@ class DatabaseViewer:
         @self.app.route('/api/property-tree/<key>')
         def get_property_tree(key):
             try:
-                with sqlite3.connect(self.docs_db_path) as conn:
+                with self.get_conn(self.docs_db_path) as conn:
                     cursor = conn.cursor()
                     
-                    # Get root property
-                    cursor.execute("""
-                        SELECT id, key, value, type FROM properties 
-                        WHERE key = ? AND status = 'active'
-                    """, (key,))
-                    root = cursor.fetchone()
+                    # The root and every descendant down to PROPERTY_TREE_DEPTH come back from one query
+                    cursor.execute(PROPERTY_TREE_SQL, (key,))
+                    rows = cursor.fetchall()
                     
-                    if not root:
+                    if not rows:
                         return jsonify({'error': f'Property {key} not found'}), 404
                     
-                    def build_tree(parent_id, depth=0):
-                        if depth >= 5:  # Prevent infinite recursion
-                            return []
-                        
-                        cursor.execute("""
-                            SELECT id, key, value, type FROM properties 
-                            WHERE parent_id = ? AND status = 'active'
-                            ORDER BY key
-                        """, (parent_id,))
-                        
-                        children = []
-                        for row in cursor.fetchall():
-                            child_id, child_key, child_value, child_type = row
-                            child = {
-                                'id': child_id,
-                                'key': child_key,
-                                'value': child_value,
-                                'type': child_type,
-                                'children': build_tree(child_id, depth + 1)
-                            }
-                            children.append(child)
-                        
-                        return children
-                    
-                    root_id, root_key, root_value, root_type = root
-                    tree = {
-                        'id': root_id,
-                        'key': root_key,
-                        'value': root_value,
-                        'type': root_type,
-                        'children': build_tree(root_id)
-                    }
+                    # Nodes are keyed by (id, depth) so a parent_id cycle repeats nodes instead of looping
+                    nodes = {}
+                    tree = None
+                    for node_id, node_key, node_value, node_type, parent_id, depth in rows:
+                        node = {
+                            'id': node_id,
+                            'key': node_key,
+                            'value': node_value,
+                            'type': node_type,
+                            'children': []
+                        }
+                        nodes[(node_id, depth)] = node
+                        if depth == 0:
+                            tree = node
+                        else:
+                            nodes[(parent_id, depth - 1)]['children'].append(node)
                     
                     return jsonify({'tree': tree})
                     
@@ -2121,17 +1763,17 @@ class DatabaseViewer:
         
         # Tag-related routes
         @self.app.route('/api/tags')
+        @self.cached_response(lambda: (self.docs_db_path,))
         def get_tags():
             try:
-                if not self.docs_db_path or not Path(self.docs_db_path).exists():
+                if not self.db_exists(self.docs_db_path):
                     return jsonify({'tags': [], 'error': 'Documentation database not found'})
                 
-                with sqlite3.connect(self.docs_db_path) as conn:
+                with self.get_conn(self.docs_db_path) as conn:
                     cursor = conn.cursor()
                     
                     # Check if tags table exists
-                    cursor.execute("SELECT name FROM sqlite_master WHERE type='table' AND name='tags'")
-                    if not cursor.fetchone():
+                    if 'tags' not in self.db_tables(conn, self.docs_db_path):
                         return jsonify({'tags': [], 'error': 'Tags table not found'})
                     
                     cursor.execute("""
@@ -2139,26 +1781,27 @@ class DatabaseViewer:
                         ORDER BY name
                     """)
                     
-                    tags = [{'name': row[0], 'slug': row[1]} for row in cursor.fetchall()]
-                    return jsonify({'tags': tags})
+                    tags = [{'name': row[0], 'slug': row[1]} for row in cursor]
+                    return self.conditional_json({'tags': tags}, max_age=60)
                     
             except Exception as e:
                 return jsonify({'error': str(e)}), 500
         
         @self.app.route('/api/tag-tree')
+        @self.cached_response(lambda: (self.docs_db_path,))
         def get_tag_tree():
             project = request.args.get('project', 'default')
+            parent_id = request.args.get('parent') or None
             
             try:
-                if not self.docs_db_path or not Path(self.docs_db_path).exists():
+                if not self.db_exists(self.docs_db_path):
                     return jsonify({'tags': [], 'error': 'Documentation database not found'})
                 
-                with sqlite3.connect(self.docs_db_path) as conn:
+                with self.get_conn(self.docs_db_path) as conn:
                     cursor = conn.cursor()
                     
                     # Check if required tables exist
-                    cursor.execute("SELECT name FROM sqlite_master WHERE type='table' AND name IN ('tags', 'projects')")
-                    existing_tables = [row[0] for row in cursor.fetchall()]
+                    existing_tables = self.db_tables(conn, self.docs_db_path)
                     
                     if 'tags' not in existing_tables or 'projects' not in existing_tables:
                         return jsonify({'tags': [], 'error': 'Required tables not found'})
@@ -2171,58 +1814,45 @@ class DatabaseViewer:
                     
                     project_id = project_row[0]
                     
-                    def build_tag_tree(parent_id):
-                        cursor.execute("""
-                            SELECT id, name, slug, color,
-                                   (SELECT COUNT(*) FROM property_tags WHERE tag_id = tags.id) as property_count
-                            FROM tags 
-                            WHERE parent_tag_id IS ? AND project_id = ?
-                            ORDER BY sort_order, name
-                        """, (parent_id, project_id))
-                        
-                        children = []
-                        for row in cursor.fetchall():
-                            tag_id, name, slug, color, prop_count = row
-                            child = {
-                                'id': tag_id,
-                                'name': name,
-                                'slug': slug,
-                                'color': color,
-                                'property_count': prop_count,
-                                'children': build_tag_tree(tag_id)
-                            }
-                            children.append(child)
-                        
-                        return children
+                    # One level per request; the client fetches a tag's children when it is expanded
+                    cursor.execute("""
+                        SELECT id, name, slug, color,
+                               (SELECT COUNT(*) FROM property_tags WHERE tag_id = tags.id) as property_count,
+                               EXISTS (SELECT 1 FROM tags AS child WHERE child.parent_tag_id = tags.id) as has_children
+                        FROM tags 
+                        WHERE parent_tag_id IS ? AND project_id = ?
+                        ORDER BY sort_order, name
+                    """, (parent_id, project_id))
+                    
+                    tags = [
+                        {
+                            'id': tag_id,
+                            'name': name,
+                            'slug': slug,
+                            'color': color,
+                            'property_count': prop_count,
+                            'has_children': bool(has_children)
+                        }
+                        for tag_id, name, slug, color, prop_count, has_children in cursor
+                    ]
                     
-                    tags = build_tag_tree(None)
-                    return jsonify({'tags': tags})
+                    return self.conditional_json({'tags': tags})
                     
             except Exception as e:
                 return jsonify({'error': str(e)}), 500
         
         # Project-related routes
         @self.app.route('/api/projects')
+        @self.cached_response(lambda: (self.docs_db_path,))
         def get_projects():
             try:
-                with sqlite3.connect(self.docs_db_path) as conn:
+                with self.get_conn(self.docs_db_path) as conn:
                     cursor = conn.cursor()
                     
-                    cursor.execute("""
-                        SELECT p.id, p.name, p.slug, p.is_active, p.created_at,
-                               (SELECT COUNT(*) FROM properties pr 
-                                JOIN property_tags pt ON pr.id = pt.property_id 
-                                JOIN tags t ON pt.tag_id = t.id 
-                                WHERE t.project_id = p.id AND pr.status = 'active') as property_count,
-                               (SELECT COUNT(*) FROM tags WHERE project_id = p.id) as tag_count
-                        FROM projects p
-                        ORDER BY p.created_at DESC
-                    """)
+                    cursor.execute(PROJECTS_SQL)
                     
-                    projects = []
-                    for row in cursor.fetchall():
-                        project_id, name, slug, is_active, created_at, prop_count, tag_count = row
-                        projects.append({
+                    projects = [
+                        {
                             'id': project_id,
                             'name': name,
                             'slug': slug,
@@ -2230,9 +1860,11 @@ class DatabaseViewer:
                             'property_count': prop_count,
                             'tag_count': tag_count,
                             'created_at': created_at
-                        })
+                        }
+                        for project_id, name, slug, is_active, created_at, prop_count, tag_count in cursor
+                    ]
                     
-                    return jsonify({'projects': projects})
+                    return self.conditional_json({'projects': projects}, max_age=60)
                     
             except Exception as e:
                 return jsonify({'error': str(e)}), 500
@@ -2242,59 +1874,15 @@ class DatabaseViewer:
         @self.app.route('/api/database-stats')
         def get_database_stats():
             try:
-                stats = {}
-                
-                # OpenRecall stats
-                if Path(self.recall_db_path).exists():
-                    with sqlite3.connect(self.recall_db_path) as conn:
-                        cursor = conn.cursor()
-                        
-                        cursor.execute("SELECT COUNT(*) FROM entries")
-                        stats['total_entries'] = cursor.fetchone()[0]
-                        
-                        cursor.execute("SELECT COUNT(DISTINCT app) FROM entries")
-                        stats['unique_apps'] = cursor.fetchone()[0]
-                        
-                        cursor.execute("SELECT MIN(timestamp), MAX(timestamp) FROM entries")
-                        min_ts, max_ts = cursor.fetchone()
-                        if min_ts and max_ts:
-                            stats['days_of_data'] = round((max_ts - min_ts) / 86400, 1)
-                        else:
-                            stats['days_of_data'] = 0
+                force = request.args.get('force', '0') == '1'
                 
-                # Documentation stats
-                if Path(self.docs_db_path).exists():
-                    with sqlite3.connect(self.docs_db_path) as conn:
-                        cursor = conn.cursor()
-                        
-                        # Properties stats
-                        cursor.execute("SELECT COUNT(*) FROM properties WHERE status = 'active'")
-                        stats['total_properties'] = cursor.fetchone()[0]
-                        
-                        cursor.execute("SELECT type, COUNT(*) FROM properties WHERE status = 'active' GROUP BY type")
-                        stats['properties_by_type'] = {row[0]: row[1] for row in cursor.fetchall()}
-                        
-                        # Other stats
-                        cursor.execute("SELECT COUNT(*) FROM tags")
-                        stats['total_tags'] = cursor.fetchone()[0]
-                        
-                        cursor.execute("SELECT COUNT(*) FROM projects WHERE is_active = 1")
-                        stats['active_projects'] = cursor.fetchone()[0]
-                        
-                        cursor.execute("SELECT COUNT(*) FROM versions")
-                        stats['total_versions'] = cursor.fetchone()[0]
-                        
-                        cursor.execute("SELECT COUNT(*) FROM search_index")
-                        indexed_properties = cursor.fetchone()[0]
-                        stats['indexed_properties'] = indexed_properties
-                        
-                        total_props = stats.get('total_properties', 0)
-                        stats['index_coverage'] = round(indexed_properties / max(total_props, 1) * 100, 1)
-                        
-                        # Database size
-                        stats['size_mb'] = round(Path(self.docs_db_path).stat().st_size / 1024 / 1024, 2)
-                
-                return jsonify(stats)
+                # The snapshot keeps its encoded body and ETag, so polls only compare or copy bytes
+                _, body, etag = self.stats_snapshot_for(force)
+                response = Response(body, mimetype='application/json')
+                response.set_etag(etag)
+                response.cache_control.private = True
+                response.cache_control.max_age = RESPONSE_CACHE_TTL
+                return response.make_conditional(request)
                 
             except Exception as e:
                 return jsonify({'error': str(e)}), 500
@@ -2302,6 +1890,8 @@ class DatabaseViewer:
         @self.app.route('/api/rebuild-search-index', methods=['POST'])
         def rebuild_search_index():
             try:
+                self.clear_response_cache()
+                
                 # This would need to integrate with the DocumentationMCP rebuild functionality
                 # For now, return a placeholder response
                 return jsonify({
@@ -2322,6 +1912,7 @@ class DatabaseViewer:
                     # Update paths
                     self.recall_db_path = self.config.get('database', 'recall_db_path', fallback=None)
                     self.docs_db_path = self.config.get('database', 'docs_db_path', fallback='documentation.db')
+                    self.retire_pools()
                 
                 # Get database status
                 recall_status = self.get_database_status(self.recall_db_path)
@@ -2342,7 +1933,7 @@ class DatabaseViewer:
                     },
                     'last_updated': self.config.get('metadata', 'last_updated', fallback='Never'),
                     'version': self.config.get('metadata', 'version', fallback='Unknown'),
-                    'config_file': str(Path(self.config_path).absolute())
+                    'config_file': self.config_file
                 })
                 
             except Exception as e:
@@ -2377,6 +1968,9 @@ class DatabaseViewer:
                     # Update instance variables
                     self.recall_db_path = self.config.get('database', 'recall_db_path', fallback=None)
                     self.docs_db_path = self.config.get('database', 'docs_db_path', fallback='documentation.db')
+                    self.retire_pools()
+                    self.clear_response_cache()
+                    self.render_shell()
                     
                     return jsonify({'success': True, 'message': 'Configuration updated successfully'})
                 else:
@@ -2388,24 +1982,19 @@ class DatabaseViewer:
         @self.app.route('/api/config/reset', methods=['POST'])
         def reset_config():
             try:
-                # Create backup of current config
+                # Move the current config aside as the backup; the missing file makes load_config write defaults
                 backup_path = self.config_path + '.backup'
                 if Path(self.config_path).exists():
-                    shutil.copy2(self.config_path, backup_path)
-                
-                # Reset to defaults
-                self.config = self.load_config()
-                
-                # Remove the existing file to force creation of defaults
-                if Path(self.config_path).exists():
-                    Path(self.config_path).unlink()
+                    os.replace(self.config_path, backup_path)
                 
-                # Reload with defaults
                 self.config = self.load_config()
                 
                 # Update instance variables
                 self.recall_db_path = self.config.get('database', 'recall_db_path', fallback=None)
                 self.docs_db_path = self.config.get('database', 'docs_db_path', fallback='documentation.db')
+                self.retire_pools()
+                self.clear_response_cache()
+                self.render_shell()
                 
                 return jsonify({
                     'success': True, 
@@ -2425,6 +2014,7 @@ def main():
     parser.add_argument('--port', type=int, help='Port to run on (overrides config)')
     parser.add_argument('--host', help='Host to bind to (overrides config)')
     parser.add_argument('--create-config', action='store_true', help='Create default configuration file and exit')
+    parser.add_argument('--dev', action='store_true', help='Use the Flask development server even if waitress is installed')
     
     args = parser.parse_args()
     
@@ -2465,7 +2055,13 @@ def main():
     print("Features: Property-based schema, hierarchical data, tag management, full-text search, configurable settings")
     
     try:
-        viewer.app.run(host=host, port=port, debug=False)
+        if serve and not args.dev:
+            # WAL lets the read-only routes run in parallel on waitress's thread pool
+            threads = viewer.config.getint('server', 'threads', fallback=8)
+            print(f"Serving with waitress ({threads} threads)")
+            serve(viewer.app, host=host, port=port, threads=threads)
+        else:
+            viewer.app.run(host=host, port=port, debug=False)
     except KeyboardInterrupt:
         print("\nShutting down gracefully...")
     except Exception as e:
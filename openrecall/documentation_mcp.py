@@ -7,15 +7,25 @@ Compatible with Claude Desktop
 
 import json
 import sqlite3
-import uuid
 from datetime import datetime
 from pathlib import Path
 import sys
 import asyncio
+import atexit
+import functools
+import hashlib
+import multiprocessing
 import os
+import pickle
 import ast
+import re
+from concurrent.futures import ProcessPoolExecutor, as_completed
+import threading
+from contextlib import ExitStack, contextmanager
 from typing import Optional, Dict, List, Any
 
+from openrecall.properties_fts import create_properties_fts, fts_query
+
 # MCP SDK imports
 try:
     from mcp.server import Server, NotificationOptions
@@ -31,21 +41,376 @@ except ImportError:
     import mcp.server.stdio
     import mcp.types as types
 
+# Writes the search_index rows of a set of active properties in one statement: the search vector
+# is the key plus any value, and the path joins the ancestor keys root first. The chain walks up
+# one parent per step, and the depth cap also stops a parent_id cycle; the deepest step of each
+# chain (picked by MAX) carries the full path
+PATH_MAX_DEPTH = 64
+SEARCH_INDEX_WRITE_SQL = f"""
+    INSERT OR REPLACE INTO search_index
+    (property_id, search_vector, computed_path, updated_at)
+    WITH RECURSIVE chain(id, ancestor_id, path, depth) AS (
+        SELECT p.id, p.parent_id, p.key, 0
+        {{targets}}
+        UNION ALL
+        SELECT chain.id, a.parent_id, a.key || ' / ' || chain.path, chain.depth + 1
+        FROM chain
+        JOIN properties a ON a.id = chain.ancestor_id
+        WHERE chain.depth < {PATH_MAX_DEPTH}
+    ), paths AS (
+        SELECT id, path, MAX(depth) FROM chain GROUP BY id
+    )
+    SELECT p.id,
+           CASE WHEN p.value IS NULL OR p.value = '' THEN p.key ELSE p.key || ' ' || p.value END,
+           paths.path,
+           CURRENT_TIMESTAMP
+    FROM paths
+    JOIN properties p ON p.id = paths.id
+"""
+# ... for the property ids bound as a JSON array
+SEARCH_INDEX_REFRESH_SQL = SEARCH_INDEX_WRITE_SQL.format(targets="""FROM json_each(?) target
+        CROSS JOIN properties p ON p.id = target.value
+        WHERE p.status = 'active'""")
+# ... for every active property
+SEARCH_INDEX_REBUILD_SQL = SEARCH_INDEX_WRITE_SQL.format(targets="""FROM properties p
+        WHERE p.status = 'active'""")
+
+# A property (the first active one with the key) and its active descendants down to a bound
+# depth; rows come out depth by depth, and by key within a depth, so parents precede children
+PROPERTY_SUBTREE_SQL = """
+    WITH RECURSIVE subtree(id, key, value, type, parent_id, depth) AS (
+        SELECT id, key, value, type, parent_id, 0 FROM properties
+        WHERE id = (SELECT id FROM properties WHERE key = ? AND status = 'active' LIMIT 1)
+        UNION ALL
+        SELECT p.id, p.key, p.value, p.type, p.parent_id, subtree.depth + 1
+        FROM properties p
+        JOIN subtree ON p.parent_id = subtree.id
+        WHERE subtree.depth < ? AND p.status = 'active'
+    )
+    SELECT id, key, value, type, parent_id, depth FROM subtree
+    ORDER BY depth, key
+"""
+
+# Tags under a parent (NULL for the top level) in one project, with their descendants and
+# property counts; rows come out depth by depth, so parents precede children
+TAG_TREE_MAX_DEPTH = 64
+TAG_SUBTREE_SQL = f"""
+    WITH RECURSIVE subtree(id, name, slug, color, parent_tag_id, sort_order, depth) AS (
+        SELECT id, name, slug, color, parent_tag_id, sort_order, 0 FROM tags
+        WHERE parent_tag_id IS ? AND project_id = ?
+        UNION ALL
+        SELECT tags.id, tags.name, tags.slug, tags.color, tags.parent_tag_id, tags.sort_order, subtree.depth + 1
+        FROM tags
+        JOIN subtree ON tags.parent_tag_id = subtree.id
+        WHERE tags.project_id = ? AND subtree.depth < {TAG_TREE_MAX_DEPTH}
+    )
+    SELECT subtree.id, name, slug, color, parent_tag_id, depth, COALESCE(counts.n, 0)
+    FROM subtree
+    LEFT JOIN (SELECT tag_id, COUNT(*) AS n FROM property_tags GROUP BY tag_id) counts
+        ON counts.tag_id = subtree.id
+    ORDER BY depth, sort_order, name
+"""
+
+# The page of property ids picked by search_properties (bound as a JSON array) as one JSON array of result objects
+# (in no particular order); value is truncated to 200 characters and empty values become null
+SEARCH_RESULTS_SQL = """
+    SELECT json_group_array(json_object(
+        'id', p.id,
+        'key', p.key,
+        'value', NULLIF(substr(p.value, 1, 200), ''),
+        'type', p.type,
+        'path', si.computed_path,
+        'tags', (SELECT json_group_array(t.name) FROM property_tags pt JOIN tags t ON pt.tag_id = t.id
+                 WHERE pt.property_id = p.id)
+    ))
+    FROM json_each(?) page
+    CROSS JOIN properties p ON p.id = page.value  -- CROSS JOIN keeps the id list as the outer loop
+    LEFT JOIN search_index si ON p.id = si.property_id
+"""
+
+# scan_codebase parses this many Python files or more in a process pool; below it, process
+# start-up costs more than the parsing it spreads out
+SCAN_PROCESS_POOL_MIN_FILES = 32
+# Worker cap for that pool; workers are spawned fresh rather than forked, so they never inherit
+# the server's threads, held locks or open SQLite connections
+SCAN_PROCESS_POOL_MAX_WORKERS = min(8, os.cpu_count() or 1)
+
+# extract_python_docs keeps each file's items here, reused while the file's mtime and size are
+# unchanged; bump AST_CACHE_VERSION whenever extraction changes what it returns. The version is
+# part of every entry's file name, so entries written by another extractor are never unpickled
+AST_CACHE_DIR = Path(os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache") / "openrecall" / "ast"
+AST_CACHE_VERSION = 4
+AST_CACHE_SUFFIX = f".v{AST_CACHE_VERSION}.pkl"
+# Entries kept by prune_ast_cache after a scan; the least recently used go first
+AST_CACHE_MAX_ENTRIES = 20000
+
+# Runs of characters that _slugify collapses into a single '-'
+SLUG_SEPARATOR_RE = re.compile(r'[^a-z0-9]+')
+
+# Statements run for every property written; sqlite3 keeps each one prepared on the shared connection
+PROPERTY_INSERT_SQL = """
+    INSERT INTO properties (key, value, type, parent_id)
+    VALUES (?, ?, ?, ?)
+"""
+FIRST_VERSION_INSERT_SQL = """
+    INSERT INTO versions (property_id, version_number, value_snapshot)
+    VALUES (?, 1, ?)
+"""
+PROPERTY_TAG_INSERT_SQL = """
+    INSERT OR IGNORE INTO property_tags (property_id, tag_id)
+    VALUES (?, ?)
+"""
+
+# Statements used by create_property, add_documentation, add_activity_summary and get_activity_summaries
+ACTIVE_PROPERTY_ID_SQL = "SELECT id FROM properties WHERE key = ? AND status = 'active'"
+SECTION_INSERT_SQL = """
+    INSERT INTO properties (key, value, type)
+    VALUES (?, ?, 'section')
+"""
+DOCUMENTATION_INSERT_SQL = """
+    INSERT INTO properties (key, value, type, parent_id)
+    VALUES (?, ?, 'documentation', ?)
+"""
+ACTIVITY_SUMMARY_INSERT_SQL = """
+    INSERT OR REPLACE INTO properties (key, value, type, parent_id)
+    VALUES (?, ?, 'activity_summary', ?)
+"""
+ACTIVITY_SUMMARIES_SQL = """
+    SELECT p.key, p.value, p.updated_at
+    FROM properties p
+    WHERE p.type = 'activity_summary' AND p.status = 'active'
+"""
+
+# Statements used by scan_codebase; item ids come from the column default, so items never conflict
+FILE_PROPERTY_INSERT_SQL = """
+    INSERT OR REPLACE INTO properties (key, value, type)
+    VALUES (?, ?, 'file')
+"""
+CODE_ITEM_INSERT_SQL = """
+    INSERT INTO properties (key, value, type, parent_id)
+    VALUES (?, ?, 'code_item', ?)
+"""
+CHILD_TAG_INSERT_SQL = """
+    INSERT OR IGNORE INTO property_tags (property_id, tag_id)
+    SELECT id, ? FROM properties WHERE parent_id = ?
+"""
+CHILD_IDS_SQL = """
+    SELECT p.id FROM json_each(?) parent
+    CROSS JOIN properties p ON p.parent_id = parent.value
+"""
+
+# INSERT ... RETURNING needs SQLite 3.35; older libraries look the id up by rowid instead
+SQLITE_HAS_RETURNING = sqlite3.sqlite_version_info >= (3, 35, 0)
+
+# Compiled statements kept per connection; the server runs a bounded set of SQL strings
+DB_STATEMENT_CACHE_SIZE = 256
+
+# Stored in PRAGMA user_version once init_database has built the schema; bump it whenever
+# init_database gains a table, index or trigger so existing databases pick the change up
+SCHEMA_VERSION = 1
+
+# Applied to every connection; journal_mode is persistent and is switched to WAL once in init_database
+CONNECTION_PRAGMAS = (
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA mmap_size=268435456",
+    "PRAGMA cache_size=-65536",
+    "PRAGMA busy_timeout=3000",
+    "PRAGMA foreign_keys=ON",
+)
+
+
+def run_in_thread(method):
+    """Make a blocking tool method awaitable by running it in a worker thread, keeping the event loop free"""
+    @functools.wraps(method)
+    async def wrapper(self, *args):
+        return await asyncio.to_thread(method, self, *args)
+    return wrapper
+
+
+def function_signature(node) -> str:
+    """Extract function signature, with the '/' and '*' markers and variadic parameters"""
+    arguments = node.args
+    parts = [arg.arg for arg in arguments.posonlyargs]
+    if parts:
+        parts.append("/")
+    parts += [arg.arg for arg in arguments.args]
+    if arguments.vararg:
+        parts.append(f"*{arguments.vararg.arg}")
+    elif arguments.kwonlyargs:
+        parts.append("*")
+    parts += [arg.arg for arg in arguments.kwonlyargs]
+    if arguments.kwarg:
+        parts.append(f"**{arguments.kwarg.arg}")
+    return f"{node.name}({', '.join(parts)})"
+
+
+def walk_files(root: str, suffixes: tuple):
+    """Yield paths of files under root whose names end with one of suffixes, without following symlinked directories"""
+    stack = [root]
+    while stack:
+        try:
+            entries = os.scandir(stack.pop())
+        except OSError:
+            continue
+        with entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append(entry.path)
+                elif entry.name.endswith(suffixes):
+                    yield entry.path
+
+
+class PythonDocsVisitor(ast.NodeVisitor):
+    """Collect module-level functions, classes and their methods without entering function bodies"""
+    
+    def __init__(self):
+        self.items = []
+    
+    def add_function(self, node, item_type: str, name: str):
+        """Record a function or method"""
+        self.items.append({
+            "type": item_type,
+            "name": name,
+            "signature": function_signature(node),
+            "docstring": ast.get_docstring(node),
+            "line": node.lineno
+        })
+    
+    def visit_FunctionDef(self, node):
+        """Record a module-level function; its body is not visited"""
+        self.add_function(node, "function", node.name)
+    
+    visit_AsyncFunctionDef = visit_FunctionDef
+    
+    def visit_ClassDef(self, node, prefix: str = ""):
+        """Record a class with its methods and nested classes"""
+        name = f"{prefix}{node.name}"
+        self.items.append({
+            "type": "class", 
+            "name": name,
+            "signature": f"class {node.name}",
+            "docstring": ast.get_docstring(node),
+            "line": node.lineno
+        })
+        # Extract methods and nested classes
+        for item in node.body:
+            if isinstance(item, (ast.FunctionDef, ast.AsyncFunctionDef)):
+                self.add_function(item, "method", f"{name}.{item.name}")
+            elif isinstance(item, ast.ClassDef):
+                self.visit_ClassDef(item, f"{name}.")
+
+
+def parse_python_docs(file_path: Path) -> list:
+    """Extract documentation from Python file"""
+    visitor = PythonDocsVisitor()
+    try:
+        # The parser decodes the bytes itself, honouring a BOM or coding cookie
+        with open(file_path, 'rb') as f:
+            content = f.read()
+        
+        visitor.visit(ast.parse(content, filename=str(file_path)))
+    except:
+        pass  # Ignore files that can't be parsed
+    
+    return visitor.items
+
+
+def extract_python_docs(file_path: Path) -> list:
+    """Extract documentation from Python file through the on-disk cache (module level so scan_codebase can run it in worker processes)"""
+    try:
+        st = os.stat(file_path)
+    except OSError:
+        return []
+    
+    cache_path = AST_CACHE_DIR / f"{hashlib.sha1(os.path.abspath(file_path).encode('utf-8')).hexdigest()}{AST_CACHE_SUFFIX}"
+    key = (AST_CACHE_VERSION, st.st_mtime_ns, st.st_size)
+    try:
+        with open(cache_path, 'rb') as f:
+            cached_key, items = pickle.load(f)
+        if cached_key == key:
+            # Mark the entry as used so prune_ast_cache keeps it
+            os.utime(cache_path)
+            return items
+    except Exception:
+        pass  # Missing, stale or unreadable cache entries are re-parsed
+    
+    items = parse_python_docs(file_path)
+    
+    # Write to a private temporary name first so concurrent workers never see a partial entry
+    try:
+        AST_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        tmp_path = cache_path.with_name(f"{cache_path.name}.{os.getpid()}.tmp")
+        with open(tmp_path, 'wb') as f:
+            pickle.dump((key, items), f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, cache_path)
+    except OSError:
+        pass  # The cache is an optimization; an unwritable cache directory just means re-parsing
+    
+    return items
+
+
+def prune_ast_cache(max_entries: int = AST_CACHE_MAX_ENTRIES):
+    """Delete AST cache entries of other extractor versions, then the least recently used beyond max_entries"""
+    try:
+        entries = list(os.scandir(AST_CACHE_DIR))
+    except OSError:
+        return
+    
+    current = []
+    for entry in entries:
+        try:
+            if entry.name.endswith(AST_CACHE_SUFFIX):
+                current.append((entry.stat().st_mtime_ns, entry.path))
+            else:
+                os.remove(entry.path)
+        except OSError:
+            pass  # Removed or replaced by a concurrent scan
+    
+    current.sort()
+    for _, path in current[:max(len(current) - max_entries, 0)]:
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+
 
 class DocumentationMCP:
     def __init__(self, db_path: str):
         self.db_path = db_path
         self.server = Server("documentation-mcp")
         self.init_database()
+        # One shared write connection (re-entrant, so helpers can run inside a caller's block)
+        # plus a read-only one for the search and tree lookups
+        self._conn = self._connect()
+        self._lock = threading.RLock()
+        self._depth = 0
+        self._read_conn = self._connect(read_only=True)
+        self._read_lock = threading.Lock()
+        self._closed = False
+        atexit.register(self.close)
+        # Slug -> id lookups; only hits are cached, so tags and projects created later are still found
+        self._project_ids = {}
+        self._tag_ids = {}
         self.setup_handlers()
     
     def init_database(self):
         """Initialize the property-based documentation database"""
-        with sqlite3.connect(self.db_path) as conn:
+        with self._connect() as conn:
             cursor = conn.cursor()
             
-            # Enable foreign keys
-            cursor.execute("PRAGMA foreign_keys = ON")
+            # A database already at SCHEMA_VERSION has every table, index and trigger below
+            cursor.execute("PRAGMA user_version")
+            if cursor.fetchone()[0] == SCHEMA_VERSION:
+                self._analyze_once(cursor)
+                conn.commit()
+                return
+            
+            # WAL persists in the database file, so this only has to happen once
+            cursor.execute("PRAGMA journal_mode=WAL")
+            
+            # All of the DDL and seeding below commits at once
+            cursor.execute("BEGIN IMMEDIATE")
             
             # Create PROJECTS table
             cursor.execute("""
@@ -94,6 +459,7 @@ class DocumentationMCP:
             """)
             cursor.execute("CREATE INDEX IF NOT EXISTS idx_properties_key_parent ON properties(key, parent_id, status)")
             cursor.execute("CREATE INDEX IF NOT EXISTS idx_properties_parent ON properties(parent_id)")
+            cursor.execute("CREATE INDEX IF NOT EXISTS idx_properties_status_updated ON properties(status, updated_at DESC)")
             
             # Create PROPERTY_TAGS junction table
             cursor.execute("""
@@ -106,6 +472,7 @@ class DocumentationMCP:
                     FOREIGN KEY (tag_id) REFERENCES tags(id) ON DELETE CASCADE
                 )
             """)
+            cursor.execute("CREATE INDEX IF NOT EXISTS idx_property_tags_tag ON property_tags(tag_id)")
             
             # Create VERSIONS table
             cursor.execute("""
@@ -151,14 +518,32 @@ class DocumentationMCP:
                     ('Configuration', 'config'),
                     ('Notes', 'notes')
                 ]
-                for name, slug in default_tags:
-                    cursor.execute("""
-                        INSERT INTO tags (name, slug, project_id) 
-                        VALUES (?, ?, ?)
-                    """, (name, slug, default_project_id))
+                cursor.executemany("""
+                    INSERT INTO tags (name, slug, project_id) 
+                    VALUES (?, ?, ?)
+                """, [(name, slug, default_project_id) for name, slug in default_tags])
+            
+            try:
+                create_properties_fts(cursor)
+            except sqlite3.OperationalError as e:
+                # Builds without FTS5 fall back to LIKE matching in search_properties
+                print(f"Warning: Could not initialize property search index: {e}", file=sys.stderr)
+            
+            self._analyze_once(cursor)
+            cursor.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
             
             conn.commit()
     
+    def _analyze_once(self, cursor):
+        """Gather planner statistics once there is data, so the schema's indexes are picked"""
+        # Statistics taken on an empty database would mislead the planner later
+        cursor.execute("""
+            SELECT NOT EXISTS (SELECT 1 FROM sqlite_master WHERE name = 'sqlite_stat1')
+                   AND EXISTS (SELECT 1 FROM properties)
+        """)
+        if cursor.fetchone()[0]:
+            cursor.execute("ANALYZE")
+    
     def setup_handlers(self):
         """Setup MCP request handlers"""
         
@@ -339,77 +724,107 @@ class DocumentationMCP:
                 text=json.dumps(result, indent=2, default=str)
             )]
     
+    def _connect(self, read_only: bool = False) -> sqlite3.Connection:
+        """Open a connection to the documentation database with CONNECTION_PRAGMAS applied"""
+        if read_only:
+            uri = Path(self.db_path).resolve().as_uri() + "?mode=ro"
+            conn = sqlite3.connect(uri, uri=True, check_same_thread=False, cached_statements=DB_STATEMENT_CACHE_SIZE)
+        else:
+            conn = sqlite3.connect(self.db_path, check_same_thread=False, cached_statements=DB_STATEMENT_CACHE_SIZE)
+        for pragma in CONNECTION_PRAGMAS:
+            conn.execute(pragma)
+        return conn
+    
+    @contextmanager
+    def _connection(self):
+        """Use the shared write connection; the outermost block commits or rolls back"""
+        with self._lock:
+            self._depth += 1
+            try:
+                yield self._conn
+                if self._depth == 1:
+                    self._conn.commit()
+            except BaseException:
+                if self._depth == 1:
+                    self._conn.rollback()
+                raise
+            finally:
+                self._depth -= 1
+    
+    @contextmanager
+    def _reader(self):
+        """Use the shared read-only connection, which never waits on the write lock"""
+        with self._read_lock:
+            yield self._read_conn
+    
+    def close(self):
+        """Refresh stale planner statistics and close the shared connections (safe to call twice)"""
+        if self._closed:
+            return
+        self._closed = True
+        with self._lock:
+            try:
+                self._conn.execute("PRAGMA optimize")
+            except sqlite3.Error as e:
+                print(f"Warning: PRAGMA optimize failed on {self.db_path}: {e}", file=sys.stderr)
+            self._conn.close()
+        with self._read_lock:
+            self._read_conn.close()
+    
     def _slugify(self, text: str) -> str:
         """Convert text to slug format"""
-        import re
-        return re.sub(r'[^a-z0-9]+', '-', text.lower()).strip('-')
+        return SLUG_SEPARATOR_RE.sub('-', text.lower()).strip('-')
     
     def _get_project_id(self, project_slug: str) -> Optional[str]:
         """Get project ID by slug"""
-        with sqlite3.connect(self.db_path) as conn:
+        if project_slug in self._project_ids:
+            return self._project_ids[project_slug]
+        with self._connection() as conn:
             cursor = conn.cursor()
             cursor.execute("SELECT id FROM projects WHERE slug = ?", (project_slug,))
             row = cursor.fetchone()
-            return row[0] if row else None
+            if not row:
+                return None
+            self._project_ids[project_slug] = row[0]
+            return row[0]
     
     def _get_tag_id(self, tag_slug: str, project_id: str = None) -> Optional[str]:
         """Get tag ID by slug"""
-        with sqlite3.connect(self.db_path) as conn:
-            cursor = conn.cursor()
-            if project_id:
-                cursor.execute("SELECT id FROM tags WHERE slug = ? AND project_id = ?", (tag_slug, project_id))
-            else:
-                cursor.execute("SELECT id FROM tags WHERE slug = ?", (tag_slug,))
-            row = cursor.fetchone()
-            return row[0] if row else None
+        tag_ids = self._get_tag_ids([tag_slug], project_id)
+        return tag_ids[0] if tag_ids else None
     
-    def _update_search_index(self, property_id: str):
-        """Update search index for a property"""
-        with sqlite3.connect(self.db_path) as conn:
-            cursor = conn.cursor()
-            
-            # Get property details
-            cursor.execute("""
-                SELECT key, value, type FROM properties 
-                WHERE id = ? AND status = 'active'
-            """, (property_id,))
-            prop = cursor.fetchone()
-            
-            if not prop:
-                return
-            
-            key, value, prop_type = prop
-            
-            # Build search vector
-            search_text_parts = [key]
-            if value:
-                search_text_parts.append(value)
-            
-            # Get computed path
-            path_parts = []
-            current_id = property_id
-            while current_id:
-                cursor.execute("SELECT key, parent_id FROM properties WHERE id = ?", (current_id,))
-                row = cursor.fetchone()
-                if row:
-                    path_parts.append(row[0])
-                    current_id = row[1]
+    def _get_tag_ids(self, tag_slugs: list, project_id: str = None) -> List[str]:
+        """Get the IDs of every existing tag among tag_slugs, one per slug"""
+        slugs = list(dict.fromkeys(tag_slugs))
+        missing = [slug for slug in slugs if (slug, project_id) not in self._tag_ids]
+        if missing:
+            placeholders = ",".join("?" * len(missing))
+            with self._connection() as conn:
+                cursor = conn.cursor()
+                if project_id:
+                    cursor.execute(f"SELECT slug, id FROM tags WHERE slug IN ({placeholders}) AND project_id = ? GROUP BY slug",
+                                   (*missing, project_id))
                 else:
-                    break
-            
-            computed_path = " / ".join(reversed(path_parts))
-            search_vector = " ".join(search_text_parts)
-            
-            # Update search index
-            cursor.execute("""
-                INSERT OR REPLACE INTO search_index 
-                (property_id, search_vector, computed_path, updated_at)
-                VALUES (?, ?, ?, CURRENT_TIMESTAMP)
-            """, (property_id, search_vector, computed_path))
-            
-            conn.commit()
+                    cursor.execute(f"SELECT slug, id FROM tags WHERE slug IN ({placeholders}) GROUP BY slug", missing)
+                for slug, tag_id in cursor:
+                    self._tag_ids[(slug, project_id)] = tag_id
+        return [self._tag_ids[(slug, project_id)] for slug in slugs if (slug, project_id) in self._tag_ids]
+    
+    def _insert_returning_id(self, cursor, table: str, sql: str, params: tuple) -> str:
+        """Run an INSERT that leaves the id to the table's randomblob default and return the new id"""
+        if SQLITE_HAS_RETURNING:
+            cursor.execute(sql + " RETURNING id", params)
+            return cursor.fetchone()[0]
+        cursor.execute(sql, params)
+        cursor.execute(f"SELECT id FROM {table} WHERE rowid = ?", (cursor.lastrowid,))
+        return cursor.fetchone()[0]
+    
+    def _update_search_index(self, cursor, property_ids: list):
+        """Update search index for properties within the caller's transaction"""
+        cursor.execute(SEARCH_INDEX_REFRESH_SQL, (json.dumps(property_ids),))
     
-    async def create_property(self, args: dict) -> dict:
+    @run_in_thread
+    def create_property(self, args: dict) -> dict:
         """Create a new property"""
         try:
             key = args.get("key")
@@ -418,13 +833,13 @@ class DocumentationMCP:
             parent_key = args.get("parent_key")
             tags = args.get("tags", [])
             
-            with sqlite3.connect(self.db_path) as conn:
+            with self._connection() as conn:
                 cursor = conn.cursor()
                 
                 # Get parent ID if specified
                 parent_id = None
                 if parent_key:
-                    cursor.execute("SELECT id FROM properties WHERE key = ? AND status = 'active'", (parent_key,))
+                    cursor.execute(ACTIVE_PROPERTY_ID_SQL, (parent_key,))
                     row = cursor.fetchone()
                     if row:
                         parent_id = row[0]
@@ -432,32 +847,20 @@ class DocumentationMCP:
                         return {"error": f"Parent property '{parent_key}' not found"}
                 
                 # Create property
-                property_id = str(uuid.uuid4())
-                cursor.execute("""
-                    INSERT INTO properties (id, key, value, type, parent_id)
-                    VALUES (?, ?, ?, ?, ?)
-                """, (property_id, key, value, prop_type, parent_id))
+                property_id = self._insert_returning_id(cursor, "properties", PROPERTY_INSERT_SQL,
+                                                        (key, value, prop_type, parent_id))
                 
                 # Create version
-                cursor.execute("""
-                    INSERT INTO versions (property_id, version_number, value_snapshot)
-                    VALUES (?, 1, ?)
-                """, (property_id, value))
+                cursor.execute(FIRST_VERSION_INSERT_SQL, (property_id, value))
                 
                 # Assign tags
-                default_project_id = self._get_project_id("default")
-                for tag_slug in tags:
-                    tag_id = self._get_tag_id(tag_slug, default_project_id)
-                    if tag_id:
-                        cursor.execute("""
-                            INSERT OR IGNORE INTO property_tags (property_id, tag_id)
-                            VALUES (?, ?)
-                        """, (property_id, tag_id))
-                
-                conn.commit()
+                tag_ids = self._get_tag_ids(tags, self._get_project_id("default"))
+                cursor.executemany(PROPERTY_TAG_INSERT_SQL, [(property_id, tag_id) for tag_id in tag_ids])
                 
                 # Update search index
-                self._update_search_index(property_id)
+                self._update_search_index(cursor, [property_id])
+                
+                conn.commit()
                 
                 return {
                     "success": True,
@@ -469,7 +872,8 @@ class DocumentationMCP:
         except Exception as e:
             return {"error": str(e)}
     
-    async def search_properties(self, args: dict) -> dict:
+    @run_in_thread
+    def search_properties(self, args: dict) -> dict:
         """Search properties"""
         try:
             query = args.get("query", "")
@@ -477,22 +881,32 @@ class DocumentationMCP:
             type_filter = args.get("type")
             limit = args.get("limit", 20)
             
-            with sqlite3.connect(self.db_path) as conn:
+            with self._reader() as conn:
                 cursor = conn.cursor()
                 
-                # Build search query
-                sql = """
-                    SELECT DISTINCT p.id, p.key, p.value, p.type, p.parent_id,
-                           si.computed_path, GROUP_CONCAT(t.name) as tags
+                # Ranked FTS5 lookup when the index exists, substring LIKE matching otherwise
+                match = fts_query(query) if query else ""
+                cursor.execute("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'properties_fts'")
+                use_fts = bool(match) and cursor.fetchone() is not None
+                
+                # Pick the page of ids first; value and tags are read only for those rows
+                sql = "SELECT p.id"
+                if use_fts:
+                    sql += """
+                    FROM (SELECT rowid, rank FROM properties_fts WHERE properties_fts MATCH ?) f
+                    JOIN properties p ON p.rowid = f.rowid
+                    """
+                else:
+                    sql += """
                     FROM properties p
                     LEFT JOIN search_index si ON p.id = si.property_id
-                    LEFT JOIN property_tags pt ON p.id = pt.property_id
-                    LEFT JOIN tags t ON pt.tag_id = t.id
-                    WHERE p.status = 'active'
-                """
+                    """
+                sql += " WHERE p.status = 'active'"
                 params = []
                 
-                if query:
+                if use_fts:
+                    params.append(match)
+                elif query:
                     sql += " AND (p.key LIKE ? OR p.value LIKE ? OR si.search_vector LIKE ?)"
                     query_param = f"%{query}%"
                     params.extend([query_param, query_param, query_param])
@@ -501,27 +915,31 @@ class DocumentationMCP:
                     sql += " AND p.type = ?"
                     params.append(type_filter)
                 
+                # The slugs are bound as one JSON array, so any number of tags shares one statement
                 if tag_filters:
-                    placeholders = ",".join("?" * len(tag_filters))
-                    sql += f" AND t.slug IN ({placeholders})"
-                    params.extend(tag_filters)
-                
-                sql += " GROUP BY p.id ORDER BY p.updated_at DESC LIMIT ?"
+                    sql += """
+                        AND EXISTS (
+                            SELECT 1 FROM property_tags pt
+                            JOIN tags t ON pt.tag_id = t.id
+                            JOIN json_each(?) j ON j.value = t.slug
+                            WHERE pt.property_id = p.id
+                        )
+                    """
+                    params.append(json.dumps(tag_filters))
+                
+                # rank is the bm25() score, lower is more relevant
+                sql += " ORDER BY " + ("f.rank, " if use_fts else "") + "p.updated_at DESC LIMIT ?"
                 params.append(limit)
                 
                 cursor.execute(sql, params)
+                ids = [row[0] for row in cursor]
                 
                 properties = []
-                for row in cursor.fetchall():
-                    prop_id, key, value, prop_type, parent_id, path, tags_str = row
-                    properties.append({
-                        "id": prop_id,
-                        "key": key,
-                        "value": value[:200] if value else None,  # Truncate for preview
-                        "type": prop_type,
-                        "path": path,
-                        "tags": tags_str.split(",") if tags_str else []
-                    })
+                if ids:
+                    cursor.execute(SEARCH_RESULTS_SQL, (json.dumps(ids),))
+                    properties = json.loads(cursor.fetchone()[0])
+                    position = {prop_id: i for i, prop_id in enumerate(ids)}
+                    properties.sort(key=lambda prop: position[prop["id"]])
                 
                 return {
                     "query": query,
@@ -532,57 +950,42 @@ class DocumentationMCP:
         except Exception as e:
             return {"error": str(e)}
     
-    async def get_property_tree(self, args: dict) -> dict:
+    @run_in_thread
+    def get_property_tree(self, args: dict) -> dict:
         """Get property hierarchy"""
         try:
             root_key = args.get("key")
             max_depth = args.get("depth", 3)
             
-            with sqlite3.connect(self.db_path) as conn:
+            with self._reader() as conn:
                 cursor = conn.cursor()
                 
-                # Get root property
-                cursor.execute("""
-                    SELECT id, key, value, type FROM properties 
-                    WHERE key = ? AND status = 'active'
-                """, (root_key,))
-                root = cursor.fetchone()
+                # The root and its subtree down to max_depth in one query
+                cursor.execute(PROPERTY_SUBTREE_SQL, (root_key, max_depth))
+                rows = cursor.fetchall()
                 
-                if not root:
+                if not rows:
                     return {"error": f"Property '{root_key}' not found"}
                 
-                def build_tree(parent_id, current_depth):
-                    if current_depth >= max_depth:
-                        return []
-                    
-                    cursor.execute("""
-                        SELECT id, key, value, type FROM properties 
-                        WHERE parent_id = ? AND status = 'active'
-                        ORDER BY key
-                    """, (parent_id,))
-                    
-                    children = []
-                    for row in cursor.fetchall():
-                        child_id, key, value, prop_type = row
-                        child = {
-                            "id": child_id,
-                            "key": key,
-                            "value": value,
-                            "type": prop_type,
-                            "children": build_tree(child_id, current_depth + 1)
-                        }
-                        children.append(child)
-                    
-                    return children
-                
-                root_id, root_key, root_value, root_type = root
-                tree = {
-                    "id": root_id,
-                    "key": root_key,
-                    "value": root_value,
-                    "type": root_type,
-                    "children": build_tree(root_id, 0)
-                }
+                # Parents precede their children, so each row links straight into its parent;
+                # ids seen before (a parent_id cycle) are skipped
+                tree = None
+                nodes = {}
+                for node_id, key, value, prop_type, parent_id, depth in rows:
+                    if node_id in nodes:
+                        continue
+                    node = {
+                        "id": node_id,
+                        "key": key,
+                        "value": value,
+                        "type": prop_type,
+                        "children": []
+                    }
+                    if depth == 0:
+                        tree = node
+                    else:
+                        nodes[parent_id]["children"].append(node)
+                    nodes[node_id] = node
                 
                 return {
                     "root_key": root_key,
@@ -593,7 +996,8 @@ class DocumentationMCP:
         except Exception as e:
             return {"error": str(e)}
     
-    async def create_tag(self, args: dict) -> dict:
+    @run_in_thread
+    def create_tag(self, args: dict) -> dict:
         """Create a new tag"""
         try:
             name = args.get("name")
@@ -602,7 +1006,7 @@ class DocumentationMCP:
             project_slug = args.get("project", "default")
             color = args.get("color")
             
-            with sqlite3.connect(self.db_path) as conn:
+            with self._connection() as conn:
                 cursor = conn.cursor()
                 
                 # Get project ID
@@ -618,14 +1022,17 @@ class DocumentationMCP:
                         return {"error": f"Parent tag '{parent_tag_slug}' not found"}
                 
                 # Create tag
-                tag_id = str(uuid.uuid4())
-                cursor.execute("""
-                    INSERT INTO tags (id, name, slug, parent_tag_id, project_id, color)
-                    VALUES (?, ?, ?, ?, ?, ?)
-                """, (tag_id, name, slug, parent_tag_id, project_id, color))
+                tag_id = self._insert_returning_id(cursor, "tags", """
+                    INSERT INTO tags (name, slug, parent_tag_id, project_id, color)
+                    VALUES (?, ?, ?, ?, ?)
+                """, (name, slug, parent_tag_id, project_id, color))
                 
                 conn.commit()
                 
+                # A project-less lookup may now resolve the slug to this tag
+                self._tag_ids.pop((slug, project_id), None)
+                self._tag_ids.pop((slug, None), None)
+                
                 return {
                     "success": True,
                     "tag_id": tag_id,
@@ -637,13 +1044,14 @@ class DocumentationMCP:
         except Exception as e:
             return {"error": str(e)}
     
-    async def get_tag_tree(self, args: dict) -> dict:
+    @run_in_thread
+    def get_tag_tree(self, args: dict) -> dict:
         """Get tag hierarchy"""
         try:
             project_slug = args.get("project", "default")
             parent_tag_slug = args.get("parent_tag")
             
-            with sqlite3.connect(self.db_path) as conn:
+            with self._reader() as conn:
                 cursor = conn.cursor()
                 
                 # Get project ID
@@ -658,31 +1066,25 @@ class DocumentationMCP:
                     if not parent_tag_id:
                         return {"error": f"Parent tag '{parent_tag_slug}' not found"}
                 
-                def build_tag_tree(parent_id):
-                    cursor.execute("""
-                        SELECT id, name, slug, color, 
-                               (SELECT COUNT(*) FROM property_tags WHERE tag_id = tags.id) as property_count
-                        FROM tags 
-                        WHERE parent_tag_id IS ? AND project_id = ?
-                        ORDER BY sort_order, name
-                    """, (parent_id, project_id))
-                    
-                    children = []
-                    for row in cursor.fetchall():
-                        tag_id, name, slug, color, prop_count = row
-                        child = {
-                            "id": tag_id,
-                            "name": name,
-                            "slug": slug,
-                            "color": color,
-                            "property_count": prop_count,
-                            "children": build_tag_tree(tag_id)
-                        }
-                        children.append(child)
-                    
-                    return children
+                cursor.execute(TAG_SUBTREE_SQL, (parent_tag_id, project_id, project_id))
                 
-                tree = build_tag_tree(parent_tag_id)
+                # Parents precede their children, so each row links straight into its parent;
+                # ids seen before (a parent_tag_id cycle) are skipped
+                tree = []
+                nodes = {}
+                for tag_id, name, slug, color, parent_id, depth, prop_count in cursor:
+                    if tag_id in nodes:
+                        continue
+                    child = {
+                        "id": tag_id,
+                        "name": name,
+                        "slug": slug,
+                        "color": color,
+                        "property_count": prop_count,
+                        "children": []
+                    }
+                    (nodes[parent_id]["children"] if depth else tree).append(child)
+                    nodes[tag_id] = child
                 
                 return {
                     "project": project_slug,
@@ -693,7 +1095,8 @@ class DocumentationMCP:
         except Exception as e:
             return {"error": str(e)}
     
-    async def scan_codebase(self, args: dict) -> dict:
+    @run_in_thread
+    def scan_codebase(self, args: dict) -> dict:
         """Scan codebase and store as properties"""
         try:
             directory = Path(args.get("directory"))
@@ -709,63 +1112,64 @@ class DocumentationMCP:
             
             code_tag_id = self._get_tag_id("code", project_id)
             
+            # Only Python files are parsed; other extensions are skipped
+            suffixes = tuple(ext for ext in extensions if ext == ".py")
+            files = [Path(file_path) for file_path in walk_files(str(directory), suffixes)] if suffixes else []
+            
             total_files = 0
             total_items = 0
             
-            with sqlite3.connect(self.db_path) as conn:
+            with ExitStack() as stack:
+                # Large trees are parsed in worker processes while results are written as they complete
+                if len(files) >= SCAN_PROCESS_POOL_MIN_FILES:
+                    pool = stack.enter_context(ProcessPoolExecutor(
+                        max_workers=SCAN_PROCESS_POOL_MAX_WORKERS, mp_context=multiprocessing.get_context("spawn")))
+                    futures = {pool.submit(extract_python_docs, file_path): file_path for file_path in files}
+                    parsed = ((futures[future], future.result()) for future in as_completed(futures))
+                else:
+                    parsed = ((file_path, extract_python_docs(file_path)) for file_path in files)
+                
+                conn = stack.enter_context(self._connection())
                 cursor = conn.cursor()
                 
-                for ext in extensions:
-                    for file_path in directory.rglob(f"*{ext}"):
-                        if ext == ".py":
-                            # Create file property
-                            file_key = f"file-{self._slugify(str(file_path.relative_to(directory)))}"
-                            file_property_id = str(uuid.uuid4())
-                            
-                            cursor.execute("""
-                                INSERT OR REPLACE INTO properties (id, key, value, type)
-                                VALUES (?, ?, ?, 'file')
-                            """, (file_property_id, file_key, str(file_path)))
-                            
-                            if code_tag_id:
-                                cursor.execute("""
-                                    INSERT OR IGNORE INTO property_tags (property_id, tag_id)
-                                    VALUES (?, ?)
-                                """, (file_property_id, code_tag_id))
-                            
-                            # Extract and store code items
-                            items = self._extract_python_docs(file_path)
-                            for item in items:
-                                item_key = f"{file_key}-{item['name']}"
-                                item_property_id = str(uuid.uuid4())
-                                
-                                # Create structured value
-                                item_data = {
-                                    "signature": item.get("signature"),
-                                    "docstring": item.get("docstring"),
-                                    "line": item.get("line"),
-                                    "type": item["type"]
-                                }
-                                
-                                cursor.execute("""
-                                    INSERT OR REPLACE INTO properties 
-                                    (id, key, value, type, parent_id)
-                                    VALUES (?, ?, ?, 'code_item', ?)
-                                """, (item_property_id, item_key, json.dumps(item_data), file_property_id))
-                                
-                                if code_tag_id:
-                                    cursor.execute("""
-                                        INSERT OR IGNORE INTO property_tags (property_id, tag_id)
-                                        VALUES (?, ?)
-                                    """, (item_property_id, code_tag_id))
-                                
-                                self._update_search_index(item_property_id)
-                                total_items += 1
-                            
-                            self._update_search_index(file_property_id)
-                            total_files += 1
+                file_property_ids = []
+                
+                for file_path, items in parsed:
+                    # Create file property
+                    file_key = f"file-{self._slugify(str(file_path.relative_to(directory)))}"
+                    file_property_id = self._insert_returning_id(cursor, "properties", FILE_PROPERTY_INSERT_SQL, (file_key, str(file_path)))
+                    file_property_ids.append(file_property_id)
+                    
+                    # Store the file's code items in one batch
+                    cursor.executemany(CODE_ITEM_INSERT_SQL, [
+                        (f"{file_key}-{item['name']}", json.dumps({
+                            "signature": item.get("signature"),
+                            "docstring": item.get("docstring"),
+                            "line": item.get("line"),
+                            "type": item["type"]
+                        }), file_property_id)
+                        for item in items
+                    ])
+                    total_items += len(items)
+                    total_files += 1
+                
+                # The file properties are new, so their children are exactly the scanned items
+                if code_tag_id:
+                    cursor.executemany(PROPERTY_TAG_INSERT_SQL, [
+                        (file_property_id, code_tag_id) for file_property_id in file_property_ids
+                    ])
+                    cursor.executemany(CHILD_TAG_INSERT_SQL, [(code_tag_id, file_property_id) for file_property_id in file_property_ids])
+                
+                # Index every scanned row in one pass once all inserts are done
+                cursor.execute(CHILD_IDS_SQL, (json.dumps(file_property_ids),))
+                self._update_search_index(cursor, [row[0] for row in cursor.fetchall()] + file_property_ids)
                 
                 conn.commit()
+                
+                # A scan can add thousands of rows; let SQLite re-analyze the tables that grew
+                cursor.execute("PRAGMA optimize")
+            
+            prune_ast_cache()
             
             return {
                 "success": True,
@@ -777,55 +1181,8 @@ class DocumentationMCP:
         except Exception as e:
             return {"error": str(e)}
     
-    def _extract_python_docs(self, file_path: Path) -> list:
-        """Extract documentation from Python file"""
-        items = []
-        try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                content = f.read()
-            
-            tree = ast.parse(content)
-            
-            for node in ast.walk(tree):
-                if isinstance(node, ast.FunctionDef):
-                    items.append({
-                        "type": "function",
-                        "name": node.name,
-                        "signature": self._get_function_signature(node),
-                        "docstring": ast.get_docstring(node),
-                        "line": node.lineno
-                    })
-                elif isinstance(node, ast.ClassDef):
-                    items.append({
-                        "type": "class", 
-                        "name": node.name,
-                        "signature": f"class {node.name}",
-                        "docstring": ast.get_docstring(node),
-                        "line": node.lineno
-                    })
-                    # Extract methods
-                    for item in node.body:
-                        if isinstance(item, ast.FunctionDef):
-                            items.append({
-                                "type": "method",
-                                "name": f"{node.name}.{item.name}",
-                                "signature": self._get_function_signature(item),
-                                "docstring": ast.get_docstring(item),
-                                "line": item.lineno
-                            })
-        except:
-            pass  # Ignore files that can't be parsed
-        
-        return items
-    
-    def _get_function_signature(self, node: ast.FunctionDef) -> str:
-        """Extract function signature"""
-        args = []
-        for arg in node.args.args:
-            args.append(arg.arg)
-        return f"{node.name}({', '.join(args)})"
-    
-    async def add_documentation(self, args: dict) -> dict:
+    @run_in_thread
+    def add_documentation(self, args: dict) -> dict:
         """Add documentation as structured properties"""
         try:
             title = args.get("title")
@@ -838,53 +1195,36 @@ class DocumentationMCP:
             if not project_id:
                 return {"error": f"Project '{project_slug}' not found"}
             
-            with sqlite3.connect(self.db_path) as conn:
+            with self._connection() as conn:
                 cursor = conn.cursor()
                 
                 # Create or get section property
                 section_key = f"docs-{self._slugify(section)}"
-                cursor.execute("""
-                    SELECT id FROM properties WHERE key = ? AND status = 'active'
-                """, (section_key,))
+                cursor.execute(ACTIVE_PROPERTY_ID_SQL, (section_key,))
                 row = cursor.fetchone()
                 
                 if row:
                     section_id = row[0]
                 else:
-                    section_id = str(uuid.uuid4())
-                    cursor.execute("""
-                        INSERT INTO properties (id, key, value, type)
-                        VALUES (?, ?, ?, 'section')
-                    """, (section_id, section_key, section))
+                    section_id = self._insert_returning_id(cursor, "properties", SECTION_INSERT_SQL, (section_key, section))
                 
                 # Create document property
                 doc_key = f"{section_key}-{self._slugify(title)}"
-                doc_property_id = str(uuid.uuid4())
-                
-                cursor.execute("""
-                    INSERT INTO properties (id, key, value, type, parent_id)
-                    VALUES (?, ?, ?, 'documentation', ?)
-                """, (doc_property_id, doc_key, content, section_id))
+                doc_property_id = self._insert_returning_id(cursor, "properties", DOCUMENTATION_INSERT_SQL, (doc_key, content, section_id))
                 
                 # Assign tags
                 doc_tag_id = self._get_tag_id("documentation", project_id)
                 if doc_tag_id:
-                    cursor.execute("""
-                        INSERT OR IGNORE INTO property_tags (property_id, tag_id)
-                        VALUES (?, ?)
-                    """, (doc_property_id, doc_tag_id))
+                    cursor.execute(PROPERTY_TAG_INSERT_SQL, (doc_property_id, doc_tag_id))
                 
                 for tag_slug in tags:
                     tag_id = self._get_tag_id(tag_slug, project_id)
                     if tag_id:
-                        cursor.execute("""
-                            INSERT OR IGNORE INTO property_tags (property_id, tag_id)
-                            VALUES (?, ?)
-                        """, (doc_property_id, tag_id))
+                        cursor.execute(PROPERTY_TAG_INSERT_SQL, (doc_property_id, tag_id))
                 
-                conn.commit()
+                self._update_search_index(cursor, [doc_property_id])
                 
-                self._update_search_index(doc_property_id)
+                conn.commit()
                 
                 return {
                     "success": True,
@@ -896,7 +1236,8 @@ class DocumentationMCP:
         except Exception as e:
             return {"error": str(e)}
     
-    async def add_activity_summary(self, args: dict) -> dict:
+    @run_in_thread
+    def add_activity_summary(self, args: dict) -> dict:
         """Add daily activity summary"""
         try:
             date = args.get("date")
@@ -908,28 +1249,21 @@ class DocumentationMCP:
             if not project_id:
                 return {"error": f"Project '{project_slug}' not found"}
             
-            with sqlite3.connect(self.db_path) as conn:
+            with self._connection() as conn:
                 cursor = conn.cursor()
                 
                 # Create or get summaries section
                 summaries_key = "activity-summaries"
-                cursor.execute("""
-                    SELECT id FROM properties WHERE key = ? AND status = 'active'
-                """, (summaries_key,))
+                cursor.execute(ACTIVE_PROPERTY_ID_SQL, (summaries_key,))
                 row = cursor.fetchone()
                 
                 if row:
                     summaries_id = row[0]
                 else:
-                    summaries_id = str(uuid.uuid4())
-                    cursor.execute("""
-                        INSERT INTO properties (id, key, value, type)
-                        VALUES (?, ?, ?, 'section')
-                    """, (summaries_id, summaries_key, "Activity Summaries"))
+                    summaries_id = self._insert_returning_id(cursor, "properties", SECTION_INSERT_SQL, (summaries_key, "Activity Summaries"))
                 
                 # Create summary property
                 summary_key = f"summary-{date}"
-                summary_property_id = str(uuid.uuid4())
                 
                 summary_data = {
                     "date": date,
@@ -937,21 +1271,15 @@ class DocumentationMCP:
                     "insights": insights
                 }
                 
-                cursor.execute("""
-                    INSERT OR REPLACE INTO properties (id, key, value, type, parent_id)
-                    VALUES (?, ?, ?, 'activity_summary', ?)
-                """, (summary_property_id, summary_key, json.dumps(summary_data), summaries_id))
+                summary_property_id = self._insert_returning_id(cursor, "properties", ACTIVITY_SUMMARY_INSERT_SQL, (summary_key, json.dumps(summary_data), summaries_id))
                 
                 # Tag as notes
                 notes_tag_id = self._get_tag_id("notes", project_id)
                 if notes_tag_id:
-                    cursor.execute("""
-                        INSERT OR IGNORE INTO property_tags (property_id, tag_id)
-                        VALUES (?, ?)
-                    """, (summary_property_id, notes_tag_id))
+                    cursor.execute(PROPERTY_TAG_INSERT_SQL, (summary_property_id, notes_tag_id))
                 
+                self._update_search_index(cursor, [summary_property_id])
                 conn.commit()
-                self._update_search_index(summary_property_id)
                 
                 return {
                     "success": True,
@@ -963,7 +1291,8 @@ class DocumentationMCP:
         except Exception as e:
             return {"error": str(e)}
     
-    async def get_activity_summaries(self, args: dict) -> dict:
+    @run_in_thread
+    def get_activity_summaries(self, args: dict) -> dict:
         """Get activity summaries with date range"""
         try:
             start_date = args.get("start_date")
@@ -971,14 +1300,10 @@ class DocumentationMCP:
             project_slug = args.get("project", "default")
             limit = args.get("limit", 30)
             
-            with sqlite3.connect(self.db_path) as conn:
+            with self._connection() as conn:
                 cursor = conn.cursor()
                 
-                sql = """
-                    SELECT p.key, p.value, p.updated_at
-                    FROM properties p
-                    WHERE p.type = 'activity_summary' AND p.status = 'active'
-                """
+                sql = ACTIVITY_SUMMARIES_SQL
                 params = []
                 
                 if start_date:
@@ -995,7 +1320,7 @@ class DocumentationMCP:
                 cursor.execute(sql, params)
                 
                 summaries = []
-                for row in cursor.fetchall():
+                for row in cursor:
                     key, value_json, updated_at = row
                     try:
                         data = json.loads(value_json) if value_json else {}
@@ -1021,34 +1346,25 @@ class DocumentationMCP:
         except Exception as e:
             return {"error": str(e)}
     
-    async def get_database_stats(self) -> dict:
+    @run_in_thread
+    def get_database_stats(self, args: dict) -> dict:
         """Get comprehensive database statistics"""
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self._connection() as conn:
                 cursor = conn.cursor()
                 
-                # Properties stats
-                cursor.execute("SELECT COUNT(*) FROM properties WHERE status = 'active'")
-                total_properties = cursor.fetchone()[0]
+                # Properties, tags, projects, versions and search index counts in one statement
+                cursor.execute("""
+                    SELECT (SELECT COUNT(*) FROM properties WHERE status = 'active'),
+                           (SELECT COUNT(*) FROM tags),
+                           (SELECT COUNT(*) FROM projects WHERE is_active = 1),
+                           (SELECT COUNT(*) FROM versions),
+                           (SELECT COUNT(*) FROM search_index)
+                """)
+                total_properties, total_tags, active_projects, total_versions, indexed_properties = cursor.fetchone()
                 
                 cursor.execute("SELECT type, COUNT(*) FROM properties WHERE status = 'active' GROUP BY type")
-                properties_by_type = {row[0]: row[1] for row in cursor.fetchall()}
-                
-                # Tags stats
-                cursor.execute("SELECT COUNT(*) FROM tags")
-                total_tags = cursor.fetchone()[0]
-                
-                # Projects stats
-                cursor.execute("SELECT COUNT(*) FROM projects WHERE is_active = 1")
-                active_projects = cursor.fetchone()[0]
-                
-                # Versions stats
-                cursor.execute("SELECT COUNT(*) FROM versions")
-                total_versions = cursor.fetchone()[0]
-                
-                # Search index stats
-                cursor.execute("SELECT COUNT(*) FROM search_index")
-                indexed_properties = cursor.fetchone()[0]
+                properties_by_type = {row[0]: row[1] for row in cursor}
                 
                 # Recent activity
                 cursor.execute("""
@@ -1059,7 +1375,7 @@ class DocumentationMCP:
                     ORDER BY date DESC
                     LIMIT 10
                 """)
-                recent_activity = [{"date": row[0], "count": row[1]} for row in cursor.fetchall()]
+                recent_activity = [{"date": row[0], "count": row[1]} for row in cursor]
                 
                 return {
                     "database_path": self.db_path,
@@ -1077,28 +1393,28 @@ class DocumentationMCP:
         except Exception as e:
             return {"error": str(e)}
     
-    async def rebuild_search_index(self, args: dict) -> dict:
+    @run_in_thread
+    def rebuild_search_index(self, args: dict) -> dict:
         """Rebuild the full-text search index"""
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self._connection() as conn:
                 cursor = conn.cursor()
                 
                 # Clear existing index
                 cursor.execute("DELETE FROM search_index")
                 
-                # Get all active properties
-                cursor.execute("SELECT id FROM properties WHERE status = 'active'")
-                property_ids = [row[0] for row in cursor.fetchall()]
-                
-                # Rebuild index for each property
-                for property_id in property_ids:
-                    self._update_search_index(property_id)
+                # Rebuild index for every active property
+                cursor.execute(SEARCH_INDEX_REBUILD_SQL)
+                indexed_properties = cursor.rowcount
                 
                 conn.commit()
                 
+                # The whole index was just rewritten; let SQLite re-analyze what changed
+                cursor.execute("PRAGMA optimize")
+                
                 return {
                     "success": True,
-                    "indexed_properties": len(property_ids),
+                    "indexed_properties": indexed_properties,
                     "message": "Search index rebuilt successfully"
                 }
                 
@@ -1130,7 +1446,10 @@ def main():
     args = parser.parse_args()
     
     server = DocumentationMCP(args.db_path)
-    asyncio.run(server.run())
+    try:
+        asyncio.run(server.run())
+    finally:
+        server.close()
 
 
 if __name__ == "__main__":
@@ -197,7 +197,7 @@ class OpenRecallMCP:
                 
                 # Build query
                 query = """
-                    SELECT app, title, COUNT(*) as count,
+                    SELECT app, substr(title, 1, 100) as short_title, COUNT(*) as count,
                            MIN(timestamp) as first_seen,
                            MAX(timestamp) as last_seen
                     FROM entries
@@ -219,7 +219,7 @@ class OpenRecallMCP:
                     app, title, count, first_ts, last_ts = row
                     activities.append({
                         "app": app,
-                        "title": title[:100],  # Truncate long titles
+                        "title": title,  # Truncated to 100 characters by the query
                         "count": count,
                         "first_seen": datetime.fromtimestamp(first_ts).isoformat(),
                         "last_seen": datetime.fromtimestamp(last_ts).isoformat(),
@@ -514,17 +514,15 @@ class OpenRecallMCP:
             with sqlite3.connect(self.db_path) as conn:
                 cursor = conn.cursor()
                 
-                cursor.execute("SELECT COUNT(*) FROM entries")
-                total_entries = cursor.fetchone()[0]
-                
-                cursor.execute("SELECT MIN(timestamp), MAX(timestamp) FROM entries")
-                min_ts, max_ts = cursor.fetchone()
-                
-                cursor.execute("SELECT COUNT(DISTINCT app) FROM entries")
-                unique_apps = cursor.fetchone()[0]
-                
-                cursor.execute("SELECT COUNT(DISTINCT title) FROM entries")
-                unique_titles = cursor.fetchone()[0]
+                # One statement; scalar subqueries keep MIN/MAX as index lookups
+                cursor.execute("""
+                    SELECT (SELECT COUNT(*) FROM entries),
+                           (SELECT MIN(timestamp) FROM entries),
+                           (SELECT MAX(timestamp) FROM entries),
+                           (SELECT COUNT(DISTINCT app) FROM entries),
+                           (SELECT COUNT(DISTINCT title) FROM entries)
+                """)
+                total_entries, min_ts, max_ts, unique_apps, unique_titles = cursor.fetchone()
                 
                 days_of_data = 0
                 if min_ts and max_ts:
@@ -0,0 +1,92 @@
+"""
+Property Search Index
+FTS5 index over the documentation database's properties, shared by the
+documentation MCP server and the database viewer
+"""
+
+import re
+
+# Rows share the rowid of their property; key and value come from properties,
+# search_vector from search_index
+PROPERTIES_FTS_DDL = (
+    """
+    CREATE VIRTUAL TABLE IF NOT EXISTS properties_fts USING fts5(
+        key, value, search_vector,
+        tokenize='unicode61 remove_diacritics 2'
+    )
+    """,
+    # INSERT OR REPLACE gives the property a new rowid without firing delete triggers
+    """
+    CREATE TRIGGER IF NOT EXISTS properties_fts_bi BEFORE INSERT ON properties BEGIN
+        DELETE FROM properties_fts WHERE rowid = (SELECT rowid FROM properties WHERE id = new.id);
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS properties_fts_ai AFTER INSERT ON properties BEGIN
+        INSERT INTO properties_fts (rowid, key, value, search_vector)
+        VALUES (new.rowid, new.key, new.value,
+                (SELECT search_vector FROM search_index WHERE property_id = new.id));
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS properties_fts_ad AFTER DELETE ON properties BEGIN
+        DELETE FROM properties_fts WHERE rowid = old.rowid;
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS properties_fts_au AFTER UPDATE OF key, value ON properties BEGIN
+        UPDATE properties_fts SET key = new.key, value = new.value WHERE rowid = new.rowid;
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS properties_fts_search_ai AFTER INSERT ON search_index BEGIN
+        UPDATE properties_fts SET search_vector = new.search_vector
+        WHERE rowid = (SELECT rowid FROM properties WHERE id = new.property_id);
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS properties_fts_search_au AFTER UPDATE OF search_vector ON search_index BEGIN
+        UPDATE properties_fts SET search_vector = new.search_vector
+        WHERE rowid = (SELECT rowid FROM properties WHERE id = new.property_id);
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS properties_fts_search_ad AFTER DELETE ON search_index BEGIN
+        UPDATE properties_fts SET search_vector = NULL
+        WHERE rowid = (SELECT rowid FROM properties WHERE id = old.property_id);
+    END
+    """,
+)
+
+# True while every property has exactly one index row under its rowid (a VACUUM can renumber rowids)
+PROPERTIES_FTS_IN_SYNC_SQL = """
+    SELECT (SELECT COUNT(*) FROM properties) = (
+        SELECT COUNT(*) FROM properties p JOIN properties_fts f ON f.rowid = p.rowid AND f.key = p.key
+    ) AND (SELECT COUNT(*) FROM properties) = (SELECT COUNT(*) FROM properties_fts)
+"""
+
+PROPERTIES_FTS_BACKFILL_SQL = """
+    INSERT INTO properties_fts (rowid, key, value, search_vector)
+    SELECT p.rowid, p.key, p.value, si.search_vector
+    FROM properties p
+    LEFT JOIN search_index si ON si.property_id = p.id
+"""
+
+
+def create_properties_fts(cursor) -> bool:
+    """Create properties_fts and its triggers, backfilling it when out of sync; the caller commits. Returns whether it backfilled"""
+    for statement in PROPERTIES_FTS_DDL:
+        cursor.execute(statement)
+
+    # Backfill on first run, and re-sync if the rowids no longer line up
+    cursor.execute(PROPERTIES_FTS_IN_SYNC_SQL)
+    if cursor.fetchone()[0]:
+        return False
+    cursor.execute("DELETE FROM properties_fts")
+    cursor.execute(PROPERTIES_FTS_BACKFILL_SQL)
+    return True
+
+
+def fts_query(text: str) -> str:
+    """Turn free text into an FTS5 query matching every word as a prefix"""
+    return ' '.join(f'"{term}"*' for term in re.findall(r'\w+', text))
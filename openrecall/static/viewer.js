@@ -0,0 +1,875 @@
+let currentTab = 'activities';
+let currentPage = 1;
+const pageSize = 20;
+const autoRefreshMs = Number(document.body.dataset.autoRefreshSeconds) * 1000;
+
+// Stale-while-revalidate cache of API responses keyed by URL, mirrored to sessionStorage
+// so a reload can revalidate with If-None-Match instead of downloading everything again
+const responseCache = new Map();
+const storagePrefix = 'swr:';
+
+function cacheGet(url) {
+    let entry = responseCache.get(url);
+    if (!entry) {
+        const stored = sessionStorage.getItem(storagePrefix + url);
+        if (stored) {
+            entry = JSON.parse(stored);
+            responseCache.set(url, entry);
+        }
+    }
+    return entry;
+}
+
+function cacheSet(url, entry) {
+    responseCache.set(url, entry);
+    try {
+        sessionStorage.setItem(storagePrefix + url, JSON.stringify(entry));
+    } catch (err) {
+        // Quota exceeded: keep the in-memory copy only
+    }
+}
+
+function clearResponseCache() {
+    responseCache.clear();
+    Object.keys(sessionStorage)
+        .filter(key => key.startsWith(storagePrefix))
+        .forEach(key => sessionStorage.removeItem(key));
+}
+
+function swrFetch(url, render, force = false, maxAgeMs = autoRefreshMs) {
+    const cached = cacheGet(url);
+    if (cached) {
+        render(cached.data);
+        if (!force && Date.now() - cached.t < maxAgeMs) {
+            return Promise.resolve(cached.data);
+        }
+    }
+    
+    const headers = cached && cached.etag ? { 'If-None-Match': cached.etag } : {};
+    return fetch(url, { headers })
+        .then(r => {
+            if (r.status === 304 && cached) {
+                cacheSet(url, { ...cached, t: Date.now() });
+                return cached.data;
+            }
+            return r.json().then(data => {
+                cacheSet(url, { t: Date.now(), etag: r.headers.get('ETag'), data });
+                render(data);
+                return data;
+            });
+        });
+}
+
+// Escape text from the databases before it is interpolated into markup
+const htmlEscapes = { '&': '&amp;', '<': '&lt;', '>': '&gt;', '"': '&quot;', "'": '&#39;' };
+const htmlEscapeRe = /[&<>"']/g;
+
+function esc(value) {
+    return value == null ? '' : String(value).replace(htmlEscapeRe, c => htmlEscapes[c]);
+}
+
+// Parse markup off-document and move the resulting nodes in with one replaceChildren call
+const markupParser = document.createElement('template');
+
+function replaceHtml(element, html) {
+    markupParser.innerHTML = html;
+    element.replaceChildren(markupParser.content);
+}
+
+// Swap a table body's rows in a single frame, hidden while it changes so layout runs once
+function renderRows(tbody, html) {
+    requestAnimationFrame(() => {
+        const table = tbody.closest('table');
+        table.style.visibility = 'hidden';
+        replaceHtml(tbody, html);
+        table.style.visibility = 'visible';
+    });
+}
+
+// One delegated listener per container instead of an inline handler on every rendered button
+document.getElementById('properties').addEventListener('click', e => {
+    const button = e.target.closest('button');
+    if (!button) return;
+    if (button.matches('.btn-view')) viewProperty(button.dataset.id);
+    else if (button.matches('.btn-tree')) viewPropertyTree(decodeURIComponent(button.dataset.key));
+    else if (button.matches('.page-btn')) changePage(Number(button.dataset.page));
+});
+
+document.getElementById('tags').addEventListener('click', e => {
+    const toggle = e.target.closest('.tree-toggle');
+    if (toggle) toggleTag(toggle.dataset.tagId);
+});
+
+document.getElementById('activities').addEventListener('click', e => {
+    const button = e.target.closest('.page-btn');
+    if (button) changePage(Number(button.dataset.page));
+});
+
+// Initialize
+window.onload = function() {
+    loadActivities();
+    loadDatabaseStats();
+};
+
+// Only the activities pane ships with the page; fetch the others on first use
+// Elements the renderers write to on every refresh, looked up once; tab panes add theirs when their markup arrives
+const DOM = {};
+
+function cacheDomRefs() {
+    DOM.modal = document.getElementById('modal');
+    DOM.modalTitle = document.getElementById('modalTitle');
+    DOM.modalBody = document.getElementById('modalBody');
+    DOM.activityStats = document.getElementById('activityStats');
+    DOM.activitiesBody = document.querySelector('#activitiesTable tbody');
+    DOM.propertiesBody = document.querySelector('#propertiesTable tbody');
+    DOM.databaseStats = document.getElementById('databaseStats');
+    DOM.typeChart = document.getElementById('typeChart');
+}
+
+cacheDomRefs();
+
+function loadTabMarkup(tab) {
+    const pane = document.getElementById(tab);
+    if (pane.childElementCount) return Promise.resolve();
+    
+    const url = `/tabs/${tab}`;
+    const cached = responseCache.get(url);
+    const markup = cached ? Promise.resolve(cached.data) : fetch(url)
+        .then(r => r.text())
+        .then(html => {
+            responseCache.set(url, { t: Date.now(), data: html });
+            return html;
+        });
+    
+    return markup.then(html => {
+        if (pane.childElementCount) return;
+        pane.innerHTML = html;
+        cacheDomRefs();
+        if (tab === 'properties') loadTagOptions();
+        else if (tab === 'tags') return loadProjectOptions();
+    });
+}
+
+function switchTab(tab) {
+    currentTab = tab;
+    document.querySelectorAll('.tab').forEach(t => t.classList.remove('active'));
+    document.querySelectorAll('.tab-content').forEach(c => c.classList.remove('active'));
+    
+    event.target.classList.add('active');
+    document.getElementById(tab).classList.add('active');
+    
+    // Load data for the tab
+    currentPage = 1;
+    loadTabMarkup(tab)
+        .then(() => {
+            if (currentTab !== tab) return;
+            if (tab === 'activities') loadActivities();
+            else if (tab === 'properties') loadProperties();
+            else if (tab === 'tags') loadTags();
+            else if (tab === 'projects') loadProjects();
+            else if (tab === 'stats') loadDatabaseStats();
+            else if (tab === 'settings') loadSettings();
+        })
+        .catch(err => console.error(`Error loading ${tab} tab:`, err));
+}
+
+// Activities functions
+function loadActivities(force = false) {
+    const timeRange = document.getElementById('timeRange').value;
+    
+    swrFetch(`/api/activities?time_range=${timeRange}&page=${currentPage}&size=${pageSize}`, renderActivities, force)
+        .catch(err => console.error('Error loading activities:', err));
+}
+
+function renderActivities(data) {
+    const tbody = DOM.activitiesBody;
+    const html = data.activities.map(a => `
+            <tr>
+                <td>${esc(a.app)}</td>
+                <td class="truncate" title="${esc(a.title)}">${esc(a.title)}</td>
+                <td>${a.count}</td>
+                <td>${formatDate(a.first_seen)}</td>
+                <td>${formatDate(a.last_seen)}</td>
+                <td>${a.duration_minutes} min</td>
+            </tr>
+        `).join('');
+    renderRows(tbody, html);
+    
+    updatePagination('activitiesPagination', data.total_pages);
+}
+
+// Debounce a search box and cancel the previous request, so only the latest query renders
+const searchTimers = {};
+const searchControllers = {};
+
+function debouncedSearch(name, delayMs, run) {
+    clearTimeout(searchTimers[name]);
+    searchTimers[name] = setTimeout(() => {
+        if (searchControllers[name]) searchControllers[name].abort();
+        searchControllers[name] = new AbortController();
+        run(searchControllers[name].signal);
+    }, delayMs);
+}
+
+function searchActivities(event) {
+    const query = event.target.value;
+    debouncedSearch('activities', 200, signal => runActivitySearch(query, signal));
+}
+
+function runActivitySearch(query, signal) {
+    if (!query.trim()) {
+        loadActivities();
+        return;
+    }
+    
+    fetch(`/api/search-activities?q=${encodeURIComponent(query)}`, { signal })
+        .then(r => r.json())
+        .then(data => {
+            const tbody = DOM.activitiesBody;
+            const html = data.results.map(a => `
+                    <tr>
+                        <td>${esc(a.app)}</td>
+                        <td class="truncate">${esc(a.title)}</td>
+                        <td>${a.count}</td>
+                        <td>${formatDate(a.first_seen)}</td>
+                        <td>${formatDate(a.last_seen)}</td>
+                        <td>-</td>
+                    </tr>
+                `).join('');
+            renderRows(tbody, html);
+        })
+        .catch(err => {
+            if (err.name !== 'AbortError') console.error('Error searching activities:', err);
+        });
+}
+
+// Properties functions
+function loadProperties() {
+    const typeFilter = document.getElementById('typeFilter').value;
+    const tagFilter = document.getElementById('tagFilter').value;
+    
+    let url = `/api/properties?page=${currentPage}&size=${pageSize}`;
+    if (typeFilter) url += `&type=${typeFilter}`;
+    if (tagFilter) url += `&tag=${tagFilter}`;
+    
+    swrFetch(url, data => {
+            const tbody = DOM.propertiesBody;
+            
+            if (data.error) {
+                renderRows(tbody, `
+                    <tr>
+                        <td colspan="7" style="text-align: center; padding: 20px; color: #666;">
+                            <strong><i class="bi bi-exclamation-triangle"></i> ${esc(data.error)}</strong><br>
+                            <small>The documentation database needs to be initialized with the new schema.</small>
+                        </td>
+                    </tr>
+                `);
+                updatePagination('propertiesPagination', 0);
+                return;
+            }
+            
+            if (!data.properties || data.properties.length === 0) {
+                renderRows(tbody, `
+                    <tr>
+                        <td colspan="7" style="text-align: center; padding: 20px; color: #666;">
+                            <i class="bi bi-file-text"></i> No properties found.<br>
+                            <small>Use the DocumentationMCP server to add properties to the database.</small>
+                        </td>
+                    </tr>
+                `);
+                updatePagination('propertiesPagination', 0);
+                return;
+            }
+            
+            const html = data.properties.map(p => {
+                const tags = p.tags.filter(tag => tag && tag.trim()).map(tag => `<span class="tag">${esc(tag)}</span>`).join('');
+                const typeClass = typeClassFor(p.type);
+                
+                return `
+                    <tr>
+                        <td><strong>${esc(p.key)}</strong></td>
+                        <td><span class="type-badge ${esc(typeClass)}">${esc(p.type)}</span></td>
+                        <td class="truncate" title="${esc(p.value)}">${esc(p.value || '<empty>')}</td>
+                        <td class="property-path">${esc(p.path)}</td>
+                        <td>${tags}</td>
+                        <td>${formatDate(p.updated_at)}</td>
+                        <td>
+                            <button class="btn-view" data-id="${p.id}">View</button>
+                            <button class="btn-tree" data-key="${encodeURIComponent(p.key)}">Tree</button>
+                        </td>
+                    </tr>
+                `;
+            }).join('');
+            renderRows(tbody, html);
+            
+            updatePagination('propertiesPagination', data.total_pages || 0);
+        })
+        .catch(err => {
+            console.error('Error loading properties:', err);
+            const tbody = DOM.propertiesBody;
+            renderRows(tbody, `
+                <tr>
+                    <td colspan="7" style="text-align: center; padding: 20px; color: #dc3545;">
+                        <i class="bi bi-x-circle"></i> Error loading properties: ${esc(err.message)}
+                    </td>
+                </tr>
+            `);
+        });
+}
+
+function searchProperties(event) {
+    if (event.key === 'Enter') {
+        const query = event.target.value;
+        debouncedSearch('properties', 150, signal => runPropertySearch(query, signal));
+    }
+}
+
+function runPropertySearch(query, signal) {
+    if (!query.trim()) {
+        loadProperties();
+        return;
+    }
+    
+    fetch(`/api/search-properties?q=${encodeURIComponent(query)}`, { signal })
+        .then(r => r.json())
+        .then(data => {
+            const tbody = DOM.propertiesBody;
+            const html = data.properties.map(p => {
+                const tags = p.tags.map(tag => `<span class="tag">${esc(tag)}</span>`).join('');
+                const typeClass = typeClassFor(p.type);
+                
+                return `
+                    <tr>
+                        <td><strong>${esc(p.key)}</strong></td>
+                        <td><span class="type-badge ${esc(typeClass)}">${esc(p.type)}</span></td>
+                        <td class="truncate">${esc(p.value || '<empty>')}</td>
+                        <td class="property-path">${esc(p.path)}</td>
+                        <td>${tags}</td>
+                        <td>-</td>
+                        <td>
+                            <button class="btn-view" data-id="${p.id}">View</button>
+                        </td>
+                    </tr>
+                `;
+            }).join('');
+            renderRows(tbody, html);
+        })
+        .catch(err => {
+            if (err.name !== 'AbortError') console.error('Error searching properties:', err);
+        });
+}
+
+// Row and modal templates are defined once at module scope rather than inside each callback
+const renderPropertyModal = data => `
+                <p><strong>ID:</strong> ${esc(data.id)}</p>
+                <p><strong>Type:</strong> <span class="type-badge ${esc(typeClassFor(data.type))}">${esc(data.type)}</span></p>
+                <p><strong>Path:</strong> ${esc(data.path || 'Root')}</p>
+                <p><strong>Tags:</strong> ${data.tags.map(t => `<span class="tag">${esc(t)}</span>`).join('')}</p>
+                <p><strong>Created:</strong> ${formatDate(data.created_at)}</p>
+                <p><strong>Updated:</strong> ${formatDate(data.updated_at)}</p>
+                <p><strong>Value:</strong></p>
+                <div class="code-block">${esc(data.value || '<empty>')}</div>
+            `;
+
+function viewProperty(id) {
+    fetch(`/api/properties/${id}`)
+        .then(r => r.json())
+        .then(data => {
+            DOM.modalTitle.textContent = data.key;
+            DOM.modalBody.innerHTML = renderPropertyModal(data);
+            DOM.modal.style.display = 'block';
+        })
+        .catch(err => console.error('Error loading property:', err));
+}
+
+function viewPropertyTree(key) {
+    fetch(`/api/property-tree/${encodeURIComponent(key)}`)
+        .then(r => r.json())
+        .then(data => {
+            DOM.modalTitle.textContent = `Tree: ${key}`;
+            DOM.modalBody.innerHTML = renderPropertyTree(data.tree);
+            DOM.modal.style.display = 'block';
+        })
+        .catch(err => console.error('Error loading property tree:', err));
+}
+
+function renderPropertyTree(node) {
+    const out = [];
+    renderPropertyTreeInto(node, 0, out);
+    return out.join('');
+}
+
+// Push each node's markup onto a shared array; the caller joins once
+function renderPropertyTreeInto(node, level, out) {
+    const typeClass = typeClassFor(node.type);
+    out.push(`
+        <div class="tree-item" style="margin-left: ${level * 20}px">
+            <strong>${esc(node.key)}</strong> 
+            <span class="type-badge ${esc(typeClass)}">${esc(node.type)}</span><br>
+            <div class="code-block" style="margin: 5px 0; font-size: 12px;">${esc(node.value || '<empty>')}</div>
+        </div>
+    `);
+    (node.children || []).forEach(child => renderPropertyTreeInto(child, level + 1, out));
+}
+
+// Tags functions
+function loadTags() {
+    const project = document.getElementById('projectFilter').value;
+    
+    swrFetch(`/api/tag-tree?project=${project}`, data => {
+            const tagTree = document.getElementById('tagTree');
+            
+            if (data.error) {
+                tagTree.innerHTML = `
+                    <div style="text-align: center; padding: 40px; color: #666;">
+                        <h3><i class="bi bi-exclamation-triangle"></i> ${esc(data.error)}</h3>
+                        <p>The documentation database needs to be initialized with the new schema.<br>
+                        Use the DocumentationMCP server to create tags and properties.</p>
+                    </div>
+                `;
+                return;
+            }
+            
+            if (!data.tags || data.tags.length === 0) {
+                tagTree.innerHTML = `
+                    <div style="text-align: center; padding: 40px; color: #666;">
+                        <h3><i class="bi bi-tags"></i> No tags found</h3>
+                        <p>Use the DocumentationMCP server to create hierarchical tags.</p>
+                    </div>
+                `;
+                return;
+            }
+            
+            replaceHtml(tagTree, renderTagTree(data.tags));
+        })
+        .catch(err => {
+            console.error('Error loading tags:', err);
+            document.getElementById('tagTree').innerHTML = `
+                <div style="text-align: center; padding: 40px; color: #dc3545;">
+                    <h3><i class="bi bi-x-circle"></i> Error loading tags</h3>
+                    <p>${esc(err.message)}</p>
+                </div>
+            `;
+        });
+}
+
+function renderTagTree(tags, level = 0) {
+    return tags.map(tag => `
+            <div class="tree-item" style="margin-left: ${level * 20}px">
+                ${tag.has_children
+                    ? `<span class="tree-toggle" data-tag-id="${tag.id}"><i class="bi bi-folder"></i></span>`
+                    : '<span><i class="bi bi-tag"></i></span>'}
+                <span class="tag" style="background-color: ${esc(tag.color || '#e0e0e0')}">${esc(tag.name)}</span>
+                <span class="property-path">(${tag.property_count} properties)</span>
+                ${tag.has_children
+                    ? `<div id="tag-${tag.id}" class="tree-children collapsed" data-loaded="0" data-level="${level + 1}"></div>`
+                    : ''}
+            </div>
+        `).join('');
+}
+
+// Children are fetched from the server the first time a tag is expanded
+function toggleTag(tagId) {
+    const children = document.getElementById(`tag-${tagId}`);
+    if (children.dataset.loaded === '0') {
+        children.dataset.loaded = '1';
+        const project = document.getElementById('projectFilter').value;
+        swrFetch(`/api/tag-tree?project=${project}&parent=${tagId}`, data => {
+            replaceHtml(children, renderTagTree(data.tags || [], Number(children.dataset.level)));
+        }).catch(err => {
+            children.dataset.loaded = '0';
+            console.error('Error loading tags:', err);
+        });
+    }
+    children.classList.toggle('collapsed');
+}
+
+// Projects functions
+function loadProjects() {
+    swrFetch('/api/projects', data => {
+            const tbody = document.querySelector('#projectsTable tbody');
+            const html = data.projects.map(p => `
+                    <tr>
+                        <td><strong>${esc(p.name)}</strong></td>
+                        <td>${esc(p.slug)}</td>
+                        <td>${p.is_active ? '<i class="bi bi-check-circle text-success"></i> Active' : '<i class="bi bi-x-circle text-danger"></i> Inactive'}</td>
+                        <td>${p.property_count}</td>
+                        <td>${p.tag_count}</td>
+                        <td>${formatDate(p.created_at)}</td>
+                        <td>
+                            <button onclick="viewProject('${p.id}')">View</button>
+                        </td>
+                    </tr>
+                `).join('');
+            renderRows(tbody, html);
+        })
+        .catch(err => console.error('Error loading projects:', err));
+}
+
+
+// Statistics functions
+function loadDatabaseStats(force = false) {
+    swrFetch('/api/database-stats', renderStats, force)
+        .catch(err => console.error('Error loading database stats:', err));
+}
+
+function renderStats(data) {
+    // Activity stats
+    DOM.activityStats.innerHTML = `
+        <div class="stat-card">
+            <div class="stat-number">${formatNumber(data.total_entries)}</div>
+            <div class="stat-label">Total Entries</div>
+        </div>
+        <div class="stat-card">
+            <div class="stat-number">${formatNumber(data.unique_apps)}</div>
+            <div class="stat-label">Unique Apps</div>
+        </div>
+        <div class="stat-card">
+            <div class="stat-number">${formatNumber(data.days_of_data)}</div>
+            <div class="stat-label">Days of Data</div>
+        </div>
+    `;
+    
+    // Statistics tab, once its markup has been fetched
+    if (!DOM.databaseStats) return;
+    
+    DOM.databaseStats.innerHTML = `
+        <div class="stat-card">
+            <div class="stat-number">${formatNumber(data.total_properties)}</div>
+            <div class="stat-label">Total Properties</div>
+        </div>
+        <div class="stat-card">
+            <div class="stat-number">${formatNumber(data.total_tags)}</div>
+            <div class="stat-label">Tags</div>
+        </div>
+        <div class="stat-card">
+            <div class="stat-number">${formatNumber(data.active_projects)}</div>
+            <div class="stat-label">Active Projects</div>
+        </div>
+        <div class="stat-card">
+            <div class="stat-number">${formatNumber(data.total_versions)}</div>
+            <div class="stat-label">Versions</div>
+        </div>
+        <div class="stat-card">
+            <div class="stat-number">${formatPercent(data.index_coverage)}</div>
+            <div class="stat-label">Search Index Coverage</div>
+        </div>
+        <div class="stat-card">
+            <div class="stat-number">${formatNumber(data.size_mb)}</div>
+            <div class="stat-label">Database Size (MB)</div>
+        </div>
+    `;
+    
+    // Property type chart
+    if (data.properties_by_type) {
+        const byType = data.properties_by_type;
+        const cards = Object.keys(byType).map(type => {
+            const typeClass = typeClassFor(type);
+            return `
+                <div class="stat-card" style="min-width: 150px;">
+                    <div class="stat-number">${formatNumber(byType[type])}</div>
+                    <div class="stat-label">
+                        <span class="type-badge ${esc(typeClass)}">${esc(type)}</span>
+                    </div>
+                </div>
+            `;
+        }).join('');
+        DOM.typeChart.innerHTML = `<div style="display: flex; flex-wrap: wrap; gap: 10px;">${cards}</div>`;
+    }
+}
+
+// Utility functions
+
+// Filter dropdown contents rarely change within a session
+const optionsMaxAgeMs = 60000;
+
+function loadTagOptions() {
+    swrFetch('/api/tags', data => {
+            const select = document.getElementById('tagFilter');
+            const header = '<option value="">All Tags</option>';
+            
+            if (data.error) {
+                select.innerHTML = header + '<option value="" disabled><i class="bi bi-exclamation-triangle"></i> ' + esc(data.error) + '</option>';
+                return;
+            }
+            
+            if (data.tags && data.tags.length > 0) {
+                select.innerHTML = header + data.tags.map(tag => `<option value="${esc(tag.slug)}">${esc(tag.name)}</option>`).join('');
+            } else {
+                select.innerHTML = header + '<option value="" disabled>No tags available</option>';
+            }
+        }, false, optionsMaxAgeMs)
+        .catch(err => {
+            console.error('Error loading tag options:', err);
+            const select = document.getElementById('tagFilter');
+            select.innerHTML = '<option value="">All Tags</option><option value="" disabled><i class="bi bi-x-circle"></i> Error loading tags</option>';
+        });
+}
+
+function loadProjectOptions() {
+    return swrFetch('/api/projects', data => {
+            const select = document.getElementById('projectFilter');
+            select.innerHTML = data.projects.map(project => `<option value="${esc(project.slug)}">${esc(project.name)}</option>`).join('');
+        }, false, optionsMaxAgeMs)
+        .catch(err => console.error('Error loading project options:', err));
+}
+
+function updatePagination(elementId, totalPages) {
+    const pagination = document.getElementById(elementId);
+    const pages = Array.from({ length: Math.min(totalPages, 10) }, (_, index) => index + 1);
+    const html = pages.map(i => `
+            <button class="page-btn ${i === currentPage ? 'active' : ''}" data-page="${i}">${i}</button>
+        `).join('');
+    requestAnimationFrame(() => { pagination.innerHTML = html; });
+}
+
+function changePage(page) {
+    currentPage = page;
+    if (currentTab === 'activities') loadActivities();
+    else if (currentTab === 'properties') loadProperties();
+}
+
+// Shared formatter; toLocaleDateString/toLocaleTimeString build a new one on every call
+const dateTimeFormat = new Intl.DateTimeFormat(undefined, { dateStyle: 'short', timeStyle: 'medium' });
+
+// Shared number formatters for the stat cards; index_coverage arrives as a 0-100 percentage
+const numberFormat = new Intl.NumberFormat();
+const percentFormat = new Intl.NumberFormat(undefined, { style: 'percent', maximumFractionDigits: 1 });
+
+function formatNumber(value) {
+    return numberFormat.format(value || 0);
+}
+
+function formatPercent(value) {
+    return percentFormat.format((value || 0) / 100);
+}
+
+// Re-renders show the same timestamps over and over; remember what each one formatted to
+const formattedDates = new Map();
+const maxFormattedDates = 2048;
+
+function formatDate(value) {
+    if (!value) return '-';
+    const hit = formattedDates.get(value);
+    if (hit !== undefined) return hit;
+    
+    // Activity timestamps arrive as epoch seconds, documentation dates as strings
+    const date = new Date(typeof value === 'number' ? value * 1000 : value);
+    const formatted = isNaN(date) ? '-' : dateTimeFormat.format(date);
+    if (formattedDates.size >= maxFormattedDates) formattedDates.clear();
+    formattedDates.set(value, formatted);
+    return formatted;
+}
+
+// Property types are free text written by MCP clients (and may be NULL), so each badge class is
+// reduced to [a-z0-9-] and built only once per type
+const typeClasses = new Map();
+
+function typeClassFor(type) {
+    let typeClass = typeClasses.get(type);
+    if (typeClass === undefined) {
+        typeClass = `type-${String(type ?? 'none').toLowerCase().replace(/[^a-z0-9-]/g, '-')}`;
+        typeClasses.set(type, typeClass);
+    }
+    return typeClass;
+}
+
+function closeModal() {
+    DOM.modal.style.display = 'none';
+}
+
+// One request per refresh: the activity page and the statistics come back together
+function refreshActivities() {
+    const timeRange = document.getElementById('timeRange').value;
+    
+    swrFetch(`/api/activities-with-stats?time_range=${timeRange}&page=${currentPage}&size=${pageSize}`, data => {
+            renderActivities(data.activities);
+            renderStats(data.stats);
+        }, true)
+        .catch(err => console.error('Error refreshing activities:', err));
+}
+
+function rebuildSearchIndex() {
+    if (confirm('Rebuild search index? This may take a moment.')) {
+        fetch('/api/rebuild-search-index', { method: 'POST' })
+            .then(r => r.json())
+            .then(data => {
+                alert(data.message || 'Search index rebuilt');
+                clearResponseCache();
+                loadDatabaseStats();
+            })
+            .catch(err => {
+                console.error('Error rebuilding index:', err);
+                alert('Error rebuilding search index');
+            });
+    }
+}
+
+// Form functions (placeholders)
+function showPropertyForm() {
+    alert('Property form not implemented yet');
+}
+
+function showTagForm() {
+    alert('Tag form not implemented yet');
+}
+
+function showProjectForm() {
+    alert('Project form not implemented yet');
+}
+
+
+// Settings functions
+function loadSettings(force = false) {
+    fetch('/api/config' + (force ? '?reload=true' : ''))
+        .then(r => r.json())
+        .then(data => {
+            if (data.error) {
+                showAlert('Error loading settings: ' + data.error, 'error');
+                return;
+            }
+            
+            // Populate form fields
+            document.getElementById('recallDbPath').value = data.recall_db_path || '';
+            document.getElementById('docsDbPath').value = data.docs_db_path || '';
+            document.getElementById('serverHost').value = data.server.host || '127.0.0.1';
+            document.getElementById('serverPort').value = data.server.port || 8084;
+            document.getElementById('autoRefresh').value = data.interface.auto_refresh_seconds || 30;
+            document.getElementById('pageSize').value = data.interface.default_page_size || 20;
+            
+            // Update status indicators
+            updateDatabaseStatus('recallDbStatus', data.recall_db_status);
+            updateDatabaseStatus('docsDbStatus', data.docs_db_status);
+            
+            // Update config status table
+            updateConfigStatusTable(data);
+        })
+        .catch(err => {
+            console.error('Error loading settings:', err);
+            showAlert('Failed to load settings', 'error');
+        });
+}
+
+function saveSettings() {
+    const settings = {
+        recall_db_path: document.getElementById('recallDbPath').value,
+        docs_db_path: document.getElementById('docsDbPath').value,
+        server: {
+            host: document.getElementById('serverHost').value,
+            port: parseInt(document.getElementById('serverPort').value)
+        },
+        interface: {
+            auto_refresh_seconds: parseInt(document.getElementById('autoRefresh').value),
+            default_page_size: parseInt(document.getElementById('pageSize').value)
+        }
+    };
+    
+    fetch('/api/config', {
+        method: 'POST',
+        headers: {
+            'Content-Type': 'application/json'
+        },
+        body: JSON.stringify(settings)
+    })
+    .then(r => r.json())
+    .then(data => {
+        if (data.error) {
+            showAlert('Error saving settings: ' + data.error, 'error');
+        } else {
+            showAlert('Settings saved successfully! Restart required for server settings to take effect.', 'success');
+            clearResponseCache();
+            loadSettings(true); // Reload to show updated status
+        }
+    })
+    .catch(err => {
+        console.error('Error saving settings:', err);
+        showAlert('Failed to save settings', 'error');
+    });
+}
+
+function resetToDefaults() {
+    if (confirm('Reset all settings to defaults? This cannot be undone.')) {
+        fetch('/api/config/reset', { method: 'POST' })
+            .then(r => r.json())
+            .then(data => {
+                if (data.error) {
+                    showAlert('Error resetting settings: ' + data.error, 'error');
+                } else {
+                    showAlert('Settings reset to defaults', 'success');
+                    loadSettings(true);
+                }
+            })
+            .catch(err => {
+                console.error('Error resetting settings:', err);
+                showAlert('Failed to reset settings', 'error');
+            });
+    }
+}
+
+function updateDatabaseStatus(elementId, status) {
+    const element = document.getElementById(elementId);
+    if (!element) return;
+    
+    if (status && status.exists) {
+        element.className = 'config-status config-valid';
+        element.textContent = `✓ Valid (${status.size_mb} MB, ${status.entries || 'N/A'} entries)`;
+    } else {
+        element.className = 'config-status config-invalid';
+        element.textContent = status ? status.error || '✗ File not found' : '✗ Not configured';
+    }
+}
+
+const renderConfigStatusRow = (setting, lastUpdated) => {
+    const valid = setting.status && setting.status.exists;
+    const statusText = valid ? 'Valid' : (setting.status ? setting.status.error || 'Invalid' : 'Not Set');
+    return `
+            <tr>
+                <td><strong>${setting.key}</strong></td>
+                <td class="truncate" title="${esc(setting.value)}">${esc(setting.value || '<not set>')}</td>
+                <td><span class="config-status ${valid ? 'config-valid' : 'config-invalid'}">${esc(statusText)}</span></td>
+                <td>${esc(lastUpdated || '-')}</td>
+            </tr>
+        `;
+};
+
+function updateConfigStatusTable(config) {
+    const tbody = document.querySelector('#configStatusTable tbody');
+    
+    const settings = [
+        { key: 'Recall DB', value: config.recall_db_path, status: config.recall_db_status },
+        { key: 'Docs DB', value: config.docs_db_path, status: config.docs_db_status },
+        { key: 'Server Host', value: config.server.host, status: { exists: true } },
+        { key: 'Server Port', value: config.server.port, status: { exists: true } },
+        { key: 'Auto Refresh', value: config.interface.auto_refresh_seconds + 's', status: { exists: true } },
+        { key: 'Page Size', value: config.interface.default_page_size, status: { exists: true } }
+    ];
+    
+    renderRows(tbody, settings.map(setting => renderConfigStatusRow(setting, config.last_updated)).join(''));
+}
+
+function showAlert(message, type) {
+    const alertDiv = document.getElementById('settingsAlert');
+    alertDiv.innerHTML = `<div class="alert alert-${type === 'success' ? 'success' : 'error'}">${esc(message)}</div>`;
+    setTimeout(() => {
+        alertDiv.innerHTML = '';
+    }, 5000);
+}
+
+// Module scope is private; expose what the inline on* handlers call
+Object.assign(window, {
+    switchTab,
+    loadActivities,
+    refreshActivities,
+    searchActivities,
+    loadProperties,
+    searchProperties,
+    showPropertyForm,
+    loadTags,
+    showTagForm,
+    showProjectForm,
+    rebuildSearchIndex,
+    loadSettings,
+    saveSettings,
+    resetToDefaults,
+    closeModal
+});
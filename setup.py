@@ -25,6 +25,9 @@ extras_require = {
     "windows": ["pywin32", "psutil"],
     "macos": ["pyobjc==10.3"],
     "linux": [],
+    "compress": ["flask-compress"],
+    "json": ["orjson"],
+    "server": ["waitress"],
     "python-doctr": [
         "python-doctr @ git+https://github.com/koenvaneijk/doctr.git@af711bc04eb8876a7189923fb51ec44481ee18cd"
     ],
@@ -51,6 +54,7 @@ setup(
     name="OpenRecall",
     version="0.8",
     packages=find_packages(),
+    package_data={"openrecall": ["static/*", "templates/tabs/*"]},
     install_requires=install_requires,
     long_description=long_description,
     long_description_content_type="text/markdown",
@@ -0,0 +1,207 @@
+import json
+import sqlite3
+from pathlib import Path
+
+import pytest
+
+from openrecall.database_viewer import (
+    ACTIVITIES_ROLLUP_SQL,
+    PROPERTY_TYPE_COUNTS_SQL,
+    STATS_CACHE_COUNTS,
+    STREAM_PAGE_SIZE,
+    DatabaseViewer,
+)
+
+
+@pytest.fixture
+def viewer(tmp_path):
+    recall_db = tmp_path / "recall.db"
+    with sqlite3.connect(recall_db) as conn:
+        conn.execute(
+            """CREATE TABLE IF NOT EXISTS entries (
+                   id INTEGER PRIMARY KEY AUTOINCREMENT,
+                   app TEXT,
+                   title TEXT,
+                   text TEXT,
+                   timestamp INTEGER UNIQUE,
+                   embedding BLOB
+               )"""
+        )
+    viewer = DatabaseViewer(
+        config_path=str(tmp_path / "viewer.ini"),
+        recall_db_path=str(recall_db),
+        docs_db_path=str(tmp_path / "docs.db"),
+    )
+    yield viewer
+    viewer.close()
+
+
+def stream_body(viewer, extra):
+    with viewer.app.test_request_context():
+        response = viewer.stream_json_list(
+            viewer.docs_db_path, "SELECT value FROM json_each(?)", ("[1, 2, 3]",),
+            "items", lambda row: row[0], extra,
+        )
+        return "".join(response.response)
+
+
+def test_stream_json_list_with_extra(viewer):
+    assert json.loads(stream_body(viewer, {"total": 3})) == {"items": [1, 2, 3], "total": 3}
+
+
+def test_stream_json_list_without_extra(viewer):
+    assert json.loads(stream_body(viewer, {})) == {"items": [1, 2, 3]}
+
+
+def test_streamed_properties_page(viewer):
+    count = STREAM_PAGE_SIZE + 20
+    with sqlite3.connect(viewer.docs_db_path) as conn:
+        conn.executemany(
+            "INSERT INTO properties (key, value, type) VALUES (?, ?, 'text')",
+            [(f"key-{i}", f"value {i}") for i in range(count)],
+        )
+
+    response = viewer.app.test_client().get(f"/api/properties?size={count + 1}")
+    data = json.loads(response.get_data(as_text=True))
+
+    assert response.status_code == 200
+    assert data["total"] == count + 1  # plus the welcome property
+    assert len(data["properties"]) == count + 1
+    assert data["total_pages"] == 1
+
+
+def test_home_is_served_from_memory(viewer):
+    client = viewer.app.test_client()
+    response = client.get("/")
+    etag = response.headers["ETag"]
+
+    assert response.status_code == 200
+    assert client.get("/", headers={"If-None-Match": etag}).status_code == 304
+    assert not list(Path(viewer.app.static_folder).glob("viewer.*.html"))
+
+
+def test_cached_search_follows_database_writes(viewer):
+    client = viewer.app.test_client()
+    assert client.get("/api/search-properties?q=zebra").get_json()["total_results"] == 0
+
+    with sqlite3.connect(viewer.docs_db_path) as conn:
+        conn.execute("INSERT INTO properties (key, value) VALUES ('zebra', 'striped')")
+
+    assert client.get("/api/search-properties?q=zebra").get_json()["total_results"] == 1
+
+
+def test_rebuild_search_index_clears_response_cache(viewer):
+    client = viewer.app.test_client()
+    client.get("/api/search-properties?q=welcome")
+    client.get("/api/database-stats")
+    assert viewer.response_cache
+
+    client.post("/api/rebuild-search-index")
+    assert not viewer.response_cache
+
+
+def insert_entries(viewer, count, now=1760000000):
+    with sqlite3.connect(viewer.recall_db_path) as conn:
+        conn.executemany(
+            "INSERT INTO entries (app, title, text, timestamp, embedding) VALUES (?, ?, '', ?, x'')",
+            [(f"app{i % 3}", f"title {i % 7}", now - i * 3000) for i in range(count)],
+        )
+
+
+def rollup_rows(conn):
+    return sorted(conn.execute("SELECT app, title, day, count, first_ts, last_ts FROM activity_rollup"))
+
+
+def recounted_rollup_rows(conn):
+    return sorted(conn.execute("""
+        SELECT COALESCE(app, ''), COALESCE(title, ''), date(timestamp, 'unixepoch', 'localtime'),
+               COUNT(*), MIN(timestamp), MAX(timestamp)
+        FROM entries
+        GROUP BY 1, 2, 3
+    """))
+
+
+def test_activity_rollup_follows_entry_writes(viewer):
+    insert_entries(viewer, 300)
+    with sqlite3.connect(viewer.recall_db_path) as conn:
+        assert rollup_rows(conn) == recounted_rollup_rows(conn)
+
+        conn.execute("UPDATE entries SET title = 'renamed' WHERE id % 5 = 0")
+        conn.execute("UPDATE entries SET timestamp = timestamp - 86400 WHERE id % 11 = 0")
+        conn.execute("UPDATE entries SET app = NULL WHERE id % 13 = 0")
+        conn.execute("DELETE FROM entries WHERE id % 4 = 0")
+        conn.commit()
+
+        assert rollup_rows(conn) == recounted_rollup_rows(conn)
+
+
+@pytest.mark.parametrize("time_range", ["today", "yesterday", "week", "month", "all"])
+def test_activity_rollup_window_matches_entries(viewer, monkeypatch, time_range):
+    insert_entries(viewer, 500)
+
+    def page(conn):
+        activities_sql, window_params = viewer.activity_window(conn, time_range)
+        rows = conn.execute(activities_sql, window_params + (1000, 0)).fetchall()
+        return sorted(row[:5] for row in rows)
+
+    with viewer.get_conn(viewer.recall_db_path) as conn:
+        assert viewer.activity_window(conn, time_range)[0] == ACTIVITIES_ROLLUP_SQL
+        rolled_up = page(conn)
+        monkeypatch.setattr(viewer, "db_tables", lambda conn, db_path: set())
+        direct = page(conn)
+
+    assert rolled_up
+    assert rolled_up == direct
+
+
+def test_stats_cache_and_type_counts_follow_writes(viewer):
+    with sqlite3.connect(viewer.docs_db_path) as conn:
+        conn.execute("INSERT INTO properties (id, key, type) VALUES ('a', 'alpha', 'code_item')")
+        conn.execute("INSERT INTO properties (id, key, type) VALUES ('b', 'beta', NULL)")
+        conn.execute("INSERT INTO properties (id, key, type) VALUES ('c', 'gamma', 'text')")
+        conn.execute("INSERT OR REPLACE INTO properties (id, key, type) VALUES ('a', 'alpha', 'file')")
+        conn.execute("UPDATE properties SET status = 'archived' WHERE id = 'c'")
+        conn.execute("UPDATE properties SET type = 'text' WHERE id = 'b'")
+        conn.execute("UPDATE properties SET status = 'active', type = NULL WHERE id = 'c'")
+        conn.execute("INSERT INTO versions (property_id, version_number) VALUES ('a', 1)")
+        conn.execute("INSERT INTO search_index (property_id, search_vector) VALUES ('a', 'alpha')")
+        conn.execute("INSERT OR REPLACE INTO search_index (property_id, search_vector) VALUES ('a', 'alpha again')")
+        conn.execute("INSERT INTO projects (name, slug, is_active) VALUES ('Old', 'old', 0)")
+        conn.execute("INSERT INTO tags (name, slug) VALUES ('Extra', 'extra')")
+        conn.execute("DELETE FROM tags WHERE slug = 'notes'")
+        conn.execute("DELETE FROM properties WHERE id = 'b'")
+
+        cached = dict(conn.execute("SELECT key, value FROM stats_cache"))
+        for key, sql in STATS_CACHE_COUNTS.items():
+            assert cached[key] == conn.execute(sql).fetchone()[0], key
+
+        type_counts = sorted(conn.execute("SELECT type, cnt FROM property_type_counts WHERE cnt > 0"),
+                             key=repr)
+        assert type_counts == sorted(conn.execute(PROPERTY_TYPE_COUNTS_SQL), key=repr)
+
+
+def test_refresh_stats_cache_leaves_quiet_database_untouched(viewer):
+    with sqlite3.connect(viewer.docs_db_path) as conn:
+        viewer.refresh_stats_cache(conn.cursor())
+        assert conn.total_changes == 0
+
+
+def test_refresh_stats_cache_corrects_drift(viewer):
+    with sqlite3.connect(viewer.docs_db_path) as conn:
+        conn.execute("UPDATE stats_cache SET value = value + 5 WHERE key = 'tags'")
+        conn.execute("DELETE FROM property_type_counts")
+        viewer.refresh_stats_cache(conn.cursor())
+
+        assert conn.execute("SELECT value FROM stats_cache WHERE key = 'tags'").fetchone()[0] == \
+            conn.execute(STATS_CACHE_COUNTS['tags']).fetchone()[0]
+        assert sorted(conn.execute("SELECT type, cnt FROM property_type_counts WHERE cnt > 0"), key=repr) == \
+            sorted(conn.execute(PROPERTY_TYPE_COUNTS_SQL), key=repr)
+
+
+def test_close_stops_stats_refresh_thread(viewer):
+    thread = viewer.stats_refresh_thread
+    assert thread.is_alive()
+
+    viewer.close()
+    assert not thread.is_alive()
+    assert viewer.stats_refresh_thread is None
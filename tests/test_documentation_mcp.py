@@ -0,0 +1,104 @@
+import importlib
+import os
+
+import pytest
+
+from openrecall import documentation_mcp
+
+
+@pytest.fixture
+def cache_dir(tmp_path, monkeypatch):
+    cache_dir = tmp_path / "cache"
+    monkeypatch.setattr(documentation_mcp, "AST_CACHE_DIR", cache_dir)
+    return cache_dir
+
+
+def test_extract_python_docs_reuses_cache(tmp_path, cache_dir, monkeypatch):
+    source = tmp_path / "module.py"
+    source.write_text('def greet(name):\n    """Say hello"""\n')
+
+    items = documentation_mcp.extract_python_docs(source)
+    assert [item["name"] for item in items] == ["greet"]
+    assert [path.name.endswith(documentation_mcp.AST_CACHE_SUFFIX) for path in cache_dir.iterdir()] == [True]
+
+    def fail(file_path):
+        raise AssertionError("parsed despite an up-to-date cache entry")
+
+    with monkeypatch.context() as patch:
+        patch.setattr(documentation_mcp, "parse_python_docs", fail)
+        assert documentation_mcp.extract_python_docs(source) == items
+
+    # A changed file (different size) is parsed again
+    source.write_text('def greet(name):\n    """Say hello"""\n\n\nclass Greeter:\n    pass\n')
+    assert [item["name"] for item in documentation_mcp.extract_python_docs(source)] == ["greet", "Greeter"]
+
+
+def test_prune_ast_cache(cache_dir):
+    cache_dir.mkdir()
+    suffix = documentation_mcp.AST_CACHE_SUFFIX
+    for i in range(4):
+        entry = cache_dir / f"{i}{suffix}"
+        entry.write_bytes(b"")
+        os.utime(entry, ns=(i * 10**9, i * 10**9))
+    (cache_dir / "old.v0.pkl").write_bytes(b"")
+    (cache_dir / f"stray{suffix}.123.tmp").write_bytes(b"")
+
+    documentation_mcp.prune_ast_cache(max_entries=2)
+
+    assert sorted(path.name for path in cache_dir.iterdir()) == [f"2{suffix}", f"3{suffix}"]
+
+
+def test_ast_cache_dir_honours_xdg_cache_home(tmp_path, monkeypatch):
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+    try:
+        assert importlib.reload(documentation_mcp).AST_CACHE_DIR == tmp_path / "openrecall" / "ast"
+    finally:
+        monkeypatch.undo()
+        importlib.reload(documentation_mcp)
+
+
+def test_parse_python_docs_output(tmp_path):
+    source = tmp_path / "module.py"
+    source.write_text(
+        'class Outer:\n'
+        '    """Outer docs"""\n'
+        '    def method(self, a, /, b, *args, c, **kwargs):\n'
+        '        def helper():\n'
+        '            pass\n'
+        '    async def fetch(self, *, timeout):\n'
+        '        pass\n'
+        '    class Inner:\n'
+        '        def run(self):\n'
+        '            pass\n'
+        '\n'
+        'def top(x):\n'
+        '    """Top docs"""\n'
+        '    class Local:\n'
+        '        pass\n'
+        '\n'
+        'async def stream():\n'
+        '    pass\n'
+        '\n'
+        'if True:\n'
+        '    def conditional():\n'
+        '        pass\n'
+    )
+
+    assert documentation_mcp.parse_python_docs(source) == [
+        {"type": "class", "name": "Outer", "signature": "class Outer", "docstring": "Outer docs", "line": 1},
+        {"type": "method", "name": "Outer.method", "signature": "method(self, a, /, b, *args, c, **kwargs)",
+         "docstring": None, "line": 3},
+        {"type": "method", "name": "Outer.fetch", "signature": "fetch(self, *, timeout)", "docstring": None, "line": 6},
+        {"type": "class", "name": "Outer.Inner", "signature": "class Inner", "docstring": None, "line": 8},
+        {"type": "method", "name": "Outer.Inner.run", "signature": "run(self)", "docstring": None, "line": 9},
+        {"type": "function", "name": "top", "signature": "top(x)", "docstring": "Top docs", "line": 12},
+        {"type": "function", "name": "stream", "signature": "stream()", "docstring": None, "line": 17},
+        {"type": "function", "name": "conditional", "signature": "conditional()", "docstring": None, "line": 21},
+    ]
+
+
+def test_parse_python_docs_skips_unparseable_files(tmp_path):
+    source = tmp_path / "broken.py"
+    source.write_text("def broken(:\n")
+
+    assert documentation_mcp.parse_python_docs(source) == []
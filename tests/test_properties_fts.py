@@ -0,0 +1,57 @@
+import sqlite3
+
+import pytest
+
+from openrecall.database_viewer import DatabaseViewer
+from openrecall.documentation_mcp import DocumentationMCP
+from openrecall.properties_fts import fts_query
+
+
+def viewer_database(tmp_path):
+    db_path = tmp_path / "docs.db"
+    viewer = DatabaseViewer(config_path=str(tmp_path / "viewer.ini"), docs_db_path=str(db_path))
+    viewer.close()
+    return db_path
+
+
+def mcp_database(tmp_path):
+    db_path = tmp_path / "docs.db"
+    DocumentationMCP(str(db_path)).close()
+    return db_path
+
+
+@pytest.mark.parametrize("create_database", [viewer_database, mcp_database])
+def test_properties_fts_follows_property_writes(tmp_path, create_database):
+    with sqlite3.connect(create_database(tmp_path)) as conn:
+        conn.execute("INSERT INTO properties (id, key, value) VALUES ('a', 'alpha', 'first value')")
+        conn.execute("INSERT INTO properties (id, key, value) VALUES ('b', 'beta', 'second value')")
+        conn.execute("INSERT INTO properties (id, key, value) VALUES ('c', 'gamma', 'third value')")
+        conn.execute("INSERT INTO search_index (property_id, search_vector) VALUES ('a', 'alpha first')")
+        conn.execute("INSERT OR REPLACE INTO search_index (property_id, search_vector) VALUES ('a', 'alpha replaced')")
+        conn.execute("INSERT INTO search_index (property_id, search_vector) VALUES ('c', 'gamma third')")
+        conn.execute("INSERT OR REPLACE INTO properties (id, key, value) VALUES ('b', 'beta', 'rewritten')")
+        conn.execute("UPDATE properties SET value = 'edited' WHERE id = 'a'")
+        conn.execute("DELETE FROM search_index WHERE property_id = 'c'")
+        conn.execute("DELETE FROM properties WHERE id = 'c'")
+
+        indexed = sorted(conn.execute("SELECT rowid, key, value, search_vector FROM properties_fts"))
+        expected = sorted(conn.execute("""
+            SELECT p.rowid, p.key, p.value, si.search_vector
+            FROM properties p
+            LEFT JOIN search_index si ON si.property_id = p.id
+        """))
+        assert indexed == expected
+
+        def match(query):
+            return [row[0] for row in conn.execute(
+                "SELECT key FROM properties_fts WHERE properties_fts MATCH ?", (query,))]
+
+        assert match(fts_query("rewrit")) == ["beta"]
+        assert match(fts_query("replaced")) == ["alpha"]
+        assert match(fts_query("second")) == []
+        assert match(fts_query("gamma")) == []
+
+
+def test_fts_query():
+    assert fts_query('say "hello", café-au-lait!') == '"say"* "hello"* "café"* "au"* "lait"*'
+    assert fts_query('  "') == ''